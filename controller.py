@@ -1,78 +1,217 @@
 """Software to monitor and control garage doors via a raspberry pi."""
 
 import time, syslog, uuid
+import base64
+import collections
+import datetime
+import gzip
+import hashlib
+import hmac
+import io
+import mimetypes
+import re
+import os
+import bisect
+import signal
+import sys
 import smtplib
-import RPi.GPIO as gpio
+import threading
+import traceback
 import json
 import httplib
 import urllib
-import subprocess
+import socket
 
 from twisted.internet import task
 from twisted.internet import reactor
+from twisted.internet import defer
+from twisted.internet import threads
 from twisted.internet import ssl
+from twisted.internet.protocol import Factory, ReconnectingClientFactory
+from twisted.protocols.basic import LineReceiver
 from twisted.web import server
 from twisted.web.static import File
-from twisted.web.resource import Resource, IResource
-from zope.interface import implements
+from twisted.web.client import Agent, HTTPConnectionPool, FileBodyProducer, readBody
+from twisted.web.http_headers import Headers
+from twisted.web.resource import Resource
+from twisted.python.failure import Failure
+from twisted.python.threadpool import ThreadPool
 
-from twisted.cred import checkers, portal
-from twisted.web.guard import HTTPAuthSessionWrapper, BasicCredentialFactory
+import mqtt
 
 from email.mime.text import MIMEText
 from email.utils import formatdate
 from email.utils import make_msgid
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
-class HttpPasswordRealm(object):
-    implements(portal.IRealm)
+try:
+    import smbus
+except ImportError:
+    smbus = None
 
-    def __init__(self, myresource):
-        self.myresource = myresource
+# Set by use_gpio_backend()
+gpio = None
+gpio_backend = None
 
-    def requestAvatar(self, user, mind, *interfaces):
-        if IResource in interfaces:
-            return (IResource, self.myresource, lambda: None)
-        raise NotImplementedError()
 
 class Door(object):
+    # times to try again to release a relay that couldn't be released
+    release_retries = 3
     last_action = None
     last_action_time = None
-    msg_sent = False
-    pb_iden = None
+    last_position = None
+    debounce_call = None
+    recheck_call = None
+    on_travel = None
 
-    def __init__(self, doorId, config):
+    def __init__(self, doorId, config, provider):
         self.id = doorId
-        self.name = config['name']
-        self.relay_pin = config['relay_pin']
-        self.state_pin = config['state_pin']
-        self.state_pin_closed_value = config.get('state_pin_closed_value', 0)
-        self.time_to_close = config.get('time_to_close', 10)
-        self.time_to_open = config.get('time_to_open', 10)
-        self.openhab_name = config.get('openhab_name')
-        self.open_time = time.time()
-        gpio.setup(self.relay_pin, gpio.OUT)
-        gpio.setup(self.state_pin, gpio.IN, pull_up_down=gpio.PUD_UP)
-        gpio.output(self.relay_pin, True)
+        self.config = None
+        self.relay_pin = config.relay_pin
+        self.state_pin = config.state_pin
+        self.open_state_pin = config.open_state_pin
+        self.configure(config)
+        self.last_state = 'unknown'
+        self.last_state_time = time.time()
+        self.pulse_queue = []
+        self.sensor_value = None
+        self.open_sensor_value = None
+        self.provider = provider
+        provider.setup_door(self)
+
+    def configure(self, config):
+        """Applies the door's settings, apart from its wiring, which can't change."""
+        previous, self.config = self.config, config
+        self.name = config.name
+        self.state_pin_closed_value = config.state_pin_closed_value
+        self.open_state_pin_open_value = config.open_state_pin_open_value
+        self.travel_time_alpha = config.travel_time_alpha
+        self.stuck_factor = config.stuck_factor
+        self.openhab_name = config.openhab_name
+        self.ifttt_event_open = config.ifttt_event_open
+        self.ifttt_event_close = config.ifttt_event_close
+        self.relay_pulse_time = config.relay_pulse_time
+        self.relay_pulse_gap = config.relay_pulse_gap
+        # Keep the learned travel times unless the configured ones changed
+        time_to_open, time_to_close = self.travel_times(config)
+        if previous is None or self.travel_times(previous)[0] != time_to_open:
+            self.time_to_open = time_to_open
+        if previous is None or self.travel_times(previous)[1] != time_to_close:
+            self.time_to_close = time_to_close
+
+    @staticmethod
+    def travel_times(config):
+        time_to_open = config.time_to_open if config.time_to_open is not None else config.approx_time_to_open
+        time_to_close = config.time_to_close if config.time_to_close is not None else config.approx_time_to_close
+        return time_to_open, time_to_close
+
+    def get_position(self):
+        # the sensor values are kept up to date by the provider's sample()
+        if self.sensor_value == self.state_pin_closed_value:
+            return 'closed'
+        if self.open_state_pin is not None and self.open_sensor_value == self.open_state_pin_open_value:
+            return 'open'
+        return 'between'
 
     def get_state(self):
-        if gpio.input(self.state_pin) == self.state_pin_closed_value:
-            return 'closed'
+        now = time.time()
+        position = self.get_position()
+        if position != self.last_position:
+            self.track_motion(position, now)
+
+        if position != 'between':
+            deadline = self.motion_deadline()
+            if deadline is not None and now > deadline:
+                # The click never got the door moving
+                self.last_action = None
+                self.last_action_time = None
+            return position
         elif self.last_action == 'open':
-            if time.time() - self.last_action_time >= self.time_to_open:
+            elapsed = now - self.last_action_time
+            if elapsed < self.time_to_open:
+                return 'opening'
+            elif self.open_state_pin is None:
+                # Without an open sensor all we can do is assume it got there
+                self.last_action = None
                 return 'open'
-            else:
+            elif elapsed < self.time_to_open * self.stuck_factor:
                 return 'opening'
-        elif self.last_action ==  'close':
-            if time.time() - self.last_action_time >= self.time_to_close:
-                return 'open' # This state indicates a problem
             else:
+                return 'stuck'
+        elif self.last_action ==  'close':
+            if now - self.last_action_time < self.time_to_close * self.stuck_factor:
                 return 'closing'
+            else:
+                return 'stuck'
         else:
             return 'open'
 
+    def track_motion(self, position, now):
+        """
+        Follows the door between its end positions. Completed trips update
+        the door's travel time estimates (an exponentially weighted average
+        of the measured times), and motion that did not come from a click
+        here, e.g. the wall button, is picked up as it starts.
+        """
+        previous, self.last_position = self.last_position, position
+        if previous is None:
+            return
+        if position == 'between':
+            if self.last_action is None:
+                self.last_action = 'open' if previous == 'closed' else 'close'
+                self.last_action_time = now
+            return
+        if position == 'closed' and self.last_action == 'close':
+            self.time_to_close = self.learn_travel('close', now - self.last_action_time, self.time_to_close)
+        elif position == 'open' and self.last_action == 'open':
+            self.time_to_open = self.learn_travel('open', now - self.last_action_time, self.time_to_open)
+        self.last_action = None
+        self.last_action_time = None
+
+    def learn_travel(self, direction, measured, estimate):
+        # A trip far longer than usual was most likely interrupted
+        if measured > estimate * self.stuck_factor * 2:
+            return estimate
+        estimate = self.travel_time_alpha * measured + (1 - self.travel_time_alpha) * estimate
+        if self.on_travel is not None:
+            self.on_travel(self, direction, measured, estimate)
+        return estimate
+
+    def motion_deadline(self):
+        """When the door's state will next change if its sensors don't."""
+        if self.last_action == 'open':
+            if self.open_state_pin is None:
+                return self.last_action_time + self.time_to_open
+            return self.last_action_time + self.time_to_open * self.stuck_factor
+        elif self.last_action == 'close':
+            return self.last_action_time + self.time_to_close * self.stuck_factor
+        return None
+
     def toggle_relay(self):
+        """
+        Press the door's button. Returns a Deferred which fires once the relay
+        has been released again. Presses made while a pulse is in progress are
+        queued and run in order, so pulses to the same door never interleave.
+        """
+        d = defer.Deferred()
+        self.pulse_queue.append(d)
+        if len(self.pulse_queue) == 1:
+            self.start_pulse()
+        return d
+
+    def start_pulse(self):
         state = self.get_state()
+        try:
+            self.provider.output(self.relay_pin, False)
+        except Exception:
+            syslog.syslog("%s: couldn't press the relay: %s" % (self.name, sys.exc_info()[1]))
+            self.finish_pulse(Failure())
+            return
+
         if (state == 'open'):
             self.last_action = 'close'
             self.last_action_time = time.time()
@@ -82,267 +221,2884 @@ class Door(object):
         else:
             self.last_action = None
             self.last_action_time = None
+        reactor.callLater(self.relay_pulse_time, self.end_pulse)  # @UndefinedVariable
 
-        gpio.output(self.relay_pin, False)
-        time.sleep(0.2)
-        gpio.output(self.relay_pin, True)
+    def end_pulse(self, attempt=0):
+        try:
+            self.provider.output(self.relay_pin, True)
+        except Exception:
+            error = sys.exc_info()[1]
+            if attempt < self.release_retries:
+                syslog.syslog("%s: couldn't release the relay, trying again: %s" % (self.name, error))
+                reactor.callLater(self.relay_pulse_time, self.end_pulse, attempt + 1)  # @UndefinedVariable
+                return
+            syslog.syslog(syslog.LOG_CRIT, "%s: GAVE UP RELEASING THE RELAY ON PIN %s, IT MAY STILL BE HELD: %s" %
+                          (self.name, self.relay_pin, error))
+            self.finish_pulse(Failure())
+            return
+        self.finish_pulse(self)
+
+    def finish_pulse(self, result):
+        """Fires the pulse at the head of the queue with result and starts the next one."""
+        d = self.pulse_queue.pop(0)
+        if self.pulse_queue:
+            # Give the opener a moment to register the release
+            reactor.callLater(self.relay_pulse_gap, self.start_pulse)  # @UndefinedVariable
+        if isinstance(result, Failure):
+            d.errback(result)
+        else:
+            d.callback(result)
 
-class Controller(object):
-    def __init__(self, config):
-        gpio.setwarnings(False)
-        gpio.cleanup()
-        gpio.setmode(gpio.BCM)
+class RemoteDoor(object):
+    """
+    A door attached to another controller node. Its state is pushed by the
+    node (see NodeProvider) and toggling it sends the node a command.
+    """
+    last_action = None
+    last_action_time = None
+    debounce_call = None
+    recheck_call = None
+    openhab_name = None
+    ifttt_event_open = None
+    ifttt_event_close = None
+
+    def __init__(self, doorId, remote_id, name, provider):
+        self.id = doorId
+        self.remote_id = remote_id
+        self.name = name
+        self.provider = provider
+        self.node = None
+        self.reported_state = 'unknown'
+        self.last_state = 'unknown'
+        self.last_state_time = time.time()
+
+    def get_state(self):
+        return self.reported_state
+
+    def motion_deadline(self):
+        return None
+
+    def toggle_relay(self):
+        if self.node is None:
+            return defer.fail(IOError("%s is offline" % self.name))
+        return self.node.send_toggle(self)
+
+class DaemonThreadPool(ThreadPool):
+    """A thread pool whose threads don't keep the process alive, so a hung one can't stop it exiting."""
+
+    def threadFactory(self, *args, **kwargs):
+        thread = threading.Thread(*args, **kwargs)
+        thread.daemon = True
+        return thread
+
+class DoorProvider(object):
+    """
+    Somewhere doors are attached. The controller samples each provider's
+    doors as a batch, so a provider can read all of its inputs at once.
+    Providers whose sample() talks to hardware, and so might hang, are
+    read in a thread of their own (see read()).
+    """
+    supports_edges = False
+    blocking = False
+
+    def __init__(self, name, config, controller):
+        self.name = name
         self.config = config
-        self.doors = [Door(n, c) for (n, c) in sorted(config['doors'].items())]
-        self.updateHandler = UpdateHandler(self)
-        for door in self.doors:
-            door.last_state = 'unknown'
-            door.last_state_time = time.time()
-
-        self.use_alerts = config['config']['use_alerts']
-        self.alert_type = config['alerts']['alert_type']
-        self.ttw = config['alerts']['time_to_wait']
-        if self.alert_type is not None:
-            if isinstance(self.alert_type, str):
-                self.alert_type = self.alert_type.split(",")
-            for alert in self.alert_type:
-                if alert == 'smtp':
-                    self.use_smtp = False
-                    smtp_params = ("smtphost", "smtpport", "smtp_tls", "username", "password", "to_email")
-                    self.use_smtp = ('smtp' in config['alerts']) and set(smtp_params) <= set(config['alerts']['smtp'])
-                    syslog.syslog("we are using SMTP")
-                elif alert == 'pushbullet':
-                    self.pushbullet_access_token = config['alerts']['pushbullet']['access_token']
-                    syslog.syslog("we are using Pushbullet")
-                elif alert == 'pushover':
-                    self.pushover_user_key = config['alerts']['pushover']['user_key']
-                    syslog.syslog("we are using Pushover")
-                elif alert == 'telegram':
-                    self.telegram_api_token = config['alerts']['telegram']['api_token']
-                    self.telegram_chat_id = config['alerts']['telegram']['chat_id']
-                    syslog.syslog("we are using Telegram")
-                elif alert == 'ifttt':
-                    self.ifttt_key = config['alerts']['ifttt']['key']
-                    self.ifttt_event = config['alerts']['ifttt']['event']
-                    syslog.syslog("we are using IFTTT")
+        self.controller = controller
+        self.doors = []
+        self.pool = None
+        # when the read in progress started, if one is
+        self.sampling_since = None
+        self.last_sample_time = None
+        self.sample_error = None
+
+    def setup_door(self, door):
+        self.doors.append(door)
+
+    def remove_door(self, door):
+        self.doors.remove(door)
+
+    def sample(self, doors):
+        """Refreshes the sensor_value of each of the given doors."""
+        pass
+
+    def read(self, doors):
+        """
+        Calls sample(doors), in the provider's own thread if it may block.
+        Returns a Deferred that fires with how long the read took.
+        """
+        if not self.blocking:
+            return defer.maybeDeferred(self.timed_sample, doors)
+        if self.pool is None:
+            # Never stopped: a thread stuck in a read can't be joined
+            self.pool = DaemonThreadPool(1, 1, 'provider-' + self.name)
+            self.pool.start()
+        return threads.deferToThreadPool(reactor, self.pool, self.timed_sample, doors)  # @UndefinedVariable
+
+    def timed_sample(self, doors):
+        start = self.sampling_since = time.time()
+        try:
+            self.sample(doors)
+        finally:
+            self.sampling_since = None
+        return time.time() - start
+
+    def sampling_for(self):
+        """How long the read in progress has taken so far; 0 if there isn't one."""
+        since = self.sampling_since
+        return 0.0 if since is None else time.time() - since
+
+    def output(self, pin, value):
+        raise NotImplementedError()
+
+    def watch(self, door, callback):
+        """Calls callback(door), from any thread, when the door's sensor changes."""
+        pass
+
+    def start(self):
+        pass
+
+class GpioProvider(DoorProvider):
+    """Doors wired to the Raspberry Pi's own GPIO pins, numbered BCM-style."""
+    supports_edges = True
+    blocking = True
+
+    def __init__(self, name, config, controller):
+        DoorProvider.__init__(self, name, config, controller)
+        if gpio_backend is None:
+            use_gpio_backend(controller.config.config.gpio_backend)
+        # A reload can't switch backends under doors already running
+        self.simulated = gpio_backend == 'sim'
+
+    def pins(self, door):
+        return [pin for pin in (door.relay_pin, door.state_pin, door.open_state_pin) if pin is not None]
+
+    def setup_door(self, door):
+        DoorProvider.setup_door(self, door)
+        if self.simulated:
+            gpio.add_door(door.config)
+        gpio.setup(door.relay_pin, gpio.OUT)
+        gpio.setup(door.state_pin, gpio.IN, pull_up_down=gpio.PUD_UP)
+        if door.open_state_pin is not None:
+            gpio.setup(door.open_state_pin, gpio.IN, pull_up_down=gpio.PUD_UP)
+        gpio.output(door.relay_pin, True)
+
+    def remove_door(self, door):
+        DoorProvider.remove_door(self, door)
+        for pin in self.pins(door):
+            gpio.remove_event_detect(pin)
+            gpio.cleanup(pin)
+        if self.simulated:
+            gpio.remove_door(door.config)
+
+    def sample(self, doors):
+        for door in doors:
+            door.sensor_value = gpio.input(door.state_pin)
+            if door.open_state_pin is not None:
+                door.open_sensor_value = gpio.input(door.open_state_pin)
+
+    def output(self, pin, value):
+        gpio.output(pin, value)
+
+    def watch(self, door, callback):
+        for pin in (door.state_pin, door.open_state_pin):
+            if pin is not None:
+                gpio.add_event_detect(pin, gpio.BOTH, callback=lambda channel: callback(door))
+
+class Mcp23017Provider(DoorProvider):
+    """
+    Doors wired to an MCP23017 I2C GPIO expander, with pins numbered 0-15
+    (GPA0-7 then GPB0-7). All sixteen inputs are read in one I2C transfer.
+    """
+    blocking = True
+    IODIR = 0x00
+    GPPU = 0x0C
+    GPIO = 0x12
+    OLAT = 0x14
+
+    def __init__(self, name, config, controller):
+        DoorProvider.__init__(self, name, config, controller)
+        if smbus is None:
+            raise ImportError("The python smbus module is needed for I2C expanders")
+        self.bus = smbus.SMBus(config.bus)
+        self.address = config.address
+        self.directions = 0xFFFF
+        self.pullups = 0
+        self.latch = 0xFFFF
+
+    def write_register(self, register, value):
+        self.bus.write_i2c_block_data(self.address, register, [value & 0xFF, value >> 8])
+
+    def setup_door(self, door):
+        DoorProvider.setup_door(self, door)
+        self.directions &= ~(1 << door.relay_pin)
+        self.pullups |= 1 << door.state_pin
+        if door.open_state_pin is not None:
+            self.pullups |= 1 << door.open_state_pin
+        self.write_registers()
+
+    def remove_door(self, door):
+        DoorProvider.remove_door(self, door)
+        self.directions |= 1 << door.relay_pin
+        self.pullups &= ~(1 << door.state_pin)
+        if door.open_state_pin is not None:
+            self.pullups &= ~(1 << door.open_state_pin)
+        self.write_registers()
+
+    def write_registers(self):
+        # Release the relay before making its pin an output
+        self.write_register(self.OLAT, self.latch)
+        self.write_register(self.IODIR, self.directions)
+        self.write_register(self.GPPU, self.pullups)
+
+    def sample(self, doors):
+        low, high = self.bus.read_i2c_block_data(self.address, self.GPIO, 2)
+        values = low | (high << 8)
+        for door in doors:
+            door.sensor_value = (values >> door.state_pin) & 1
+            if door.open_state_pin is not None:
+                door.open_sensor_value = (values >> door.open_state_pin) & 1
+
+    def output(self, pin, value):
+        if value:
+            self.latch |= 1 << pin
         else:
-            self.alert_type = None
-            syslog.syslog("No alerts configured")
+            self.latch &= ~(1 << pin)
+        self.write_register(self.OLAT, self.latch)
 
-    def status_check(self):
+class NodeProvider(DoorProvider):
+    """
+    Doors attached to other controller nodes, which connect to the port
+    given in this provider's config and push their door states (see
+    NodeProtocol). A node's doors appear here as '<node>_<door id>'.
+    """
+    supports_edges = True
+
+    def start(self):
+        reactor.listenTCP(self.config.port, NodeFactory(self))  # @UndefinedVariable
+
+    def node_connected(self, node, doors):
+        for remote_id, name, state, state_time in doors:
+            doorId = '%s_%s' % (node.node, remote_id)
+            door = self.controller.doors.get(doorId)
+            if door is None:
+                door = RemoteDoor(doorId, remote_id, name, self)
+                self.setup_door(door)
+                self.controller.doors.add(door)
+            elif not self.owns(door):
+                syslog.syslog("Ignoring %s's door %s: there is already a door called %s" %
+                              (node.node, remote_id, doorId))
+                continue
+            door.node = node
+            door.reported_state = state
+            self.controller.check_door(door)
+
+    def node_update(self, node, remote_id, state, state_time):
+        door = self.controller.doors.get('%s_%s' % (node.node, remote_id))
+        if door is not None and self.owns(door) and door.node is node:
+            door.reported_state = state
+            self.controller.check_door(door)
+
+    def owns(self, door):
+        return isinstance(door, RemoteDoor) and door.provider is self
+
+    def node_disconnected(self, node):
         for door in self.doors:
-            new_state = door.get_state()
-            if (door.last_state != new_state):
-                syslog.syslog('%s: %s => %s' % (door.name, door.last_state, new_state))
-                door.last_state = new_state
-                door.last_state_time = time.time()
-                self.updateHandler.handle_updates()
-                if self.config['config']['use_openhab'] and (new_state == "open" or new_state == "closed"):
-                    self.update_openhab(door.name, new_state)
-                if self.config['config']['use_ifttt'] and (new_state == "open" or new_state == "closed"):
-                    self.update_ifttt(door.name, new_state, door.ifttt_event_open, door.ifttt_event_close)
-            if new_state == 'open' and not door.msg_sent and time.time() - door.open_time >= self.ttw:
-                if self.use_alerts:
-                    title = "%s's garage door open" % door.name
-                    if self.ttw == 0:
-                        message = "%s's garage door just opened" % (door.name)
-                    else:
-                        etime = elapsed_time(int(time.time() - door.open_time))
-                        message = "%s's garage door has been open for %s" % (door.name, etime)
-                    self.send_msg(door, title, message)
-                    door.msg_sent = True
-
-            if new_state == 'closed':
-                if self.use_alerts:
-                    if door.msg_sent == True:
-                        title = "%s's garage doors closed" % door.name
-                        etime = elapsed_time(int(time.time() - door.open_time))
-                        message = "%s's garage door is now closed after %s "% (door.name, etime)
-                        self.send_msg(door, title, message)
-                door.open_time = time.time()
-                door.msg_sent = False
+            if door.node is node:
+                door.node = None
+                door.reported_state = 'unknown'
+                self.controller.check_door(door)
 
-    def send_msg(self, door, title, message):
-        for alert in self.alert_type:
-            if alert == 'smtp':
-                self.send_email(title, message)
-            elif alert == 'pushbullet':
-                self.send_pushbullet(door, title, message)
-            elif alert == 'pushover':
-                self.send_pushover(door, title, message)
-            elif alert == 'telegram':
-                self.send_telegram(door, title, message)
-
-    def send_email(self, title, message):
+class NodeProtocol(LineReceiver):
+    """
+    The aggregator's end of a connection from a controller node. Messages
+    are JSON objects, one per line. The node starts with
+    {"hello": node, "key": key, "doors": [[id, name, state, time], ...]}
+    and then sends {"update": [id, state, time]} on every change. The
+    aggregator sends {"toggle": id, "ref": n}, which the node answers with
+    {"done": n} once the relay pulse has finished.
+    """
+    delimiter = '\n'
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.node = None
+        self.pending = {}
+        self.next_ref = 0
+
+    def lineReceived(self, line):
         try:
-            if self.use_smtp:
-                syslog.syslog("Sending email message")
-                config = self.config['alerts']['smtp']
-
-                message = MIMEText(message)
-                message['Date'] = formatdate()
-                message['From'] = config["username"]
-                message['To'] = config["to_email"]
-                message['Subject'] = config["subject"]
-                message['Message-ID'] = make_msgid()
-
-                server = smtplib.SMTP(config["smtphost"], config["smtpport"])
-                if (config["smtp_tls"] == "True") :
-                    server.starttls()
-                server.login(config["username"], config["password"])
-                server.sendmail(config["username"], config["to_email"], message.as_string())
-                server.close()
-        except Exception as inst:
-            syslog.syslog("Error sending email: " + str(inst))
-
-    def send_pushbullet(self, door, title, message):
+            message = json.loads(line)
+        except ValueError:
+            self.transport.loseConnection()
+            return
+        if self.node is None:
+            key = str(message.get('key', ''))
+            if 'hello' not in message or not hmac.compare_digest(key, str(self.provider.config.key)):
+                syslog.syslog("Rejected node connection from %s" % self.transport.getPeer().host)
+                self.transport.loseConnection()
+                return
+            self.node = message['hello']
+            syslog.syslog("Node %s connected" % self.node)
+            self.provider.node_connected(self, message['doors'])
+        elif 'update' in message:
+            self.provider.node_update(self, *message['update'])
+        elif 'done' in message:
+            d = self.pending.pop(message['done'], None)
+            if d is not None:
+                d.callback(None)
+
+    def send_toggle(self, door):
+        self.next_ref += 1
+        d = defer.Deferred()
+        self.pending[self.next_ref] = d
+        self.sendLine(json.dumps({'toggle': door.remote_id, 'ref': self.next_ref}))
+        return d.addCallback(lambda _: door)
+
+    def connectionLost(self, reason):
+        if self.node is not None:
+            syslog.syslog("Node %s disconnected" % self.node)
+            self.provider.node_disconnected(self)
+        pending, self.pending = self.pending, {}
+        for d in pending.values():
+            d.errback(reason)
+
+class NodeFactory(Factory):
+    def __init__(self, provider):
+        self.provider = provider
+
+    def buildProtocol(self, addr):
+        return NodeProtocol(self.provider)
+
+class UplinkProtocol(LineReceiver):
+    """A node's end of its connection to the aggregator; see NodeProtocol."""
+    delimiter = '\n'
+
+    def connectionMade(self):
+        controller = self.factory.controller
+        self.factory.connection = self
+        self.sendLine(json.dumps({
+            'hello': self.factory.config.node,
+            'key': self.factory.config.key,
+            'doors': [(d.id, d.name, d.last_state, d.last_state_time) for d in controller.doors],
+        }))
+
+    def send_update(self, door):
+        self.sendLine(json.dumps({'update': (door.id, door.last_state, door.last_state_time)}))
+
+    def lineReceived(self, line):
+        message = json.loads(line)
+        if 'toggle' in message:
+            ref = message['ref']
+            pulse = self.factory.controller.toggle(message['toggle'])
+            if pulse is None:
+                pulse = defer.succeed(None)
+            pulse.addBoth(lambda _: self.sendLine(json.dumps({'done': ref})))
+
+    def connectionLost(self, reason):
+        if self.factory.connection is self:
+            self.factory.connection = None
+
+class UplinkFactory(ReconnectingClientFactory):
+    protocol = UplinkProtocol
+    maxDelay = 30
+
+    def __init__(self, controller, config):
+        self.controller = controller
+        self.config = config
+        self.connection = None
+
+    def buildProtocol(self, addr):
+        self.resetDelay()
+        return ReconnectingClientFactory.buildProtocol(self, addr)
+
+    def publish(self, door):
+        if self.connection is not None:
+            self.connection.send_update(door)
+
+class Integration(object):
+    """
+    Something outside the controller that is told about door state
+    changes. Everything here runs on the reactor, so nothing may block.
+    """
+    name = None
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def state_changed(self, door, old_state, new_state):
+        raise NotImplementedError()
+
+    def door_removed(self, door):
+        pass
+
+class HttpIntegration(Integration):
+    """Sends requests through the controller's pool of persistent HTTP connections."""
+    timeout = 10
+
+    def __init__(self, config, pool):
+        self.config = config
+        self.agent = Agent(reactor, pool=pool, connectTimeout=self.timeout)
+
+    def request(self, method, url, body, content_type):
+        d = self.agent.request(method, utf8(url), Headers({'Content-Type': [content_type]}),
+                               FileBodyProducer(io.BytesIO(utf8(body))))
+        d.addTimeout(self.timeout, reactor)
+        d.addCallback(self.response)
+        d.addErrback(lambda failure: syslog.syslog("Error updating %s: %s" % (self.name, failure.getErrorMessage())))
+        return d
+
+    def response(self, response):
+        # Reading the body hands the connection back to the pool
+        d = readBody(response)
+        if response.code >= 300:
+            d.addCallback(lambda body: syslog.syslog("Error updating %s: HTTP %d %s" % (self.name, response.code, body[:200])))
+        return d
+
+class OpenhabIntegration(HttpIntegration):
+    """Sets the openHAB item of each door (openhab_name, or else its name) to open or closed."""
+    name = 'openhab'
+
+    def state_changed(self, door, old_state, new_state):
+        if new_state not in ('open', 'closed'):
+            return
+        item = door.openhab_name or door.name
+        url = 'http://%s:%s/rest/items/%s/state' % (self.config.server, self.config.port, urllib.quote(utf8(item)))
+        self.request('PUT', url, new_state, 'text/plain')
+
+class IftttIntegration(HttpIntegration):
+    """Triggers a door's ifttt_event_open or ifttt_event_close webhook."""
+    name = 'ifttt'
+
+    def state_changed(self, door, old_state, new_state):
+        event = {'open': door.ifttt_event_open, 'closed': door.ifttt_event_close}.get(new_state)
+        if not event:
+            return
+        url = 'https://maker.ifttt.com/trigger/%s/with/key/%s' % (urllib.quote(utf8(event)), self.config.key)
+        self.request('POST', url, urllib.urlencode({'value1': utf8(door.name), 'value2': new_state}),
+                     'application/x-www-form-urlencoded')
+
+class MqttIntegration(Integration):
+    """
+    Publishes each door's state, retained, to <topic_prefix>/<door>/state
+    and carries out OPEN, CLOSE and TOGGLE sent to <topic_prefix>/<door>/set.
+    <topic_prefix>/status is "online" while the controller is connected;
+    the broker sets it to "offline" if the connection drops. With discovery
+    on, every door is also announced to Home Assistant as a garage cover,
+    and announced again whenever Home Assistant comes back online.
+    """
+    name = 'mqtt'
+    commands = {'OPEN': 'open', 'CLOSE': 'close', 'TOGGLE': 'toggle'}
+    # Home Assistant covers only know these states
+    value_template = ("{% if value in ('open', 'closed', 'opening', 'closing') %}{{ value }}"
+                      "{% elif value == 'stuck' %}open{% else %}None{% endif %}")
+
+    def __init__(self, controller, config):
+        self.controller = controller
+        self.config = config
+        client_id = config.client_id or 'garage-' + socket.gethostname()
+        self.node_id = re.sub(r'[^A-Za-z0-9_-]', '_', client_id)
+        self.prefix = config.topic_prefix.rstrip('/')
+        self.status_topic = self.prefix + '/status'
+        self.client = mqtt.MQTTClientFactory(client_id, config.keepalive, config.username, config.password,
+                                             will=(self.status_topic, 'offline', True),
+                                             buffer_size=config.buffer_size)
+        self.client.on_connect = self.connected
+        self.client.subscribe(self.prefix + '/+/set', self.command_received)
+        if config.discovery:
+            self.client.subscribe(config.discovery_prefix + '/status', self.home_assistant_status)
+        self.announced = set()
+
+    def topic(self, door, leaf):
+        return '%s/%s/%s' % (self.prefix, door.id, leaf)
+
+    def discovery_topic(self, door):
+        return '%s/cover/%s/%s/config' % (self.config.discovery_prefix, self.node_id, door.id)
+
+    def start(self):
+        reactor.connectTCP(self.config.host, self.config.port, self.client)  # @UndefinedVariable
+        for door in self.controller.doors:
+            if door.last_state is not None:
+                self.state_changed(door, None, door.last_state)
+
+    def stop(self):
+        self.client.publish(self.status_topic, 'offline', retain=True)
+        self.client.stop()
+
+    def connected(self):
+        self.client.publish(self.status_topic, 'online', retain=True)
+        self.announced = set()
+        self.announce_all()
+        # whatever the broker kept from before, it ends up with the current states
+        for door in self.controller.doors:
+            if door.last_state is not None:
+                self.client.publish(self.topic(door, 'state'), door.last_state, retain=True, qos=1)
+
+    def announce_all(self):
+        if self.config.discovery:
+            for door in self.controller.doors:
+                self.announce(door)
+
+    def announce(self, door):
+        self.announced.add(door.id)
+        config = {
+            'name': door.name,
+            'unique_id': '%s_%s' % (self.node_id, door.id),
+            'device_class': 'garage',
+            'command_topic': self.topic(door, 'set'),
+            'state_topic': self.topic(door, 'state'),
+            'value_template': self.value_template,
+            'availability_topic': self.status_topic,
+            'payload_open': 'OPEN',
+            'payload_close': 'CLOSE',
+            'payload_stop': None,
+            'device': {'identifiers': [self.node_id], 'name': 'Garage Door Controller',
+                       'model': 'garage-door-controller'},
+        }
+        self.client.publish(self.discovery_topic(door), json.dumps(config), retain=True, qos=1)
+
+    def state_changed(self, door, old_state, new_state):
+        if self.config.discovery and door.id not in self.announced and self.client.connection is not None:
+            # e.g. a door on a node that has just joined
+            self.announce(door)
+        self.client.publish(self.topic(door, 'state'), new_state, retain=True, qos=1)
+
+    def door_removed(self, door):
+        # Empty retained messages clear the door from the broker and Home Assistant
+        self.client.publish(self.topic(door, 'state'), '', retain=True, qos=1)
+        if self.config.discovery:
+            self.client.publish(self.discovery_topic(door), '', retain=True, qos=1)
+        self.announced.discard(door.id)
+
+    def command_received(self, topic, payload):
+        doorId = topic[len(self.prefix) + 1:-len('/set')]
+        door = self.controller.doors.get(doorId)
+        command = self.commands.get(payload.strip().upper())
+        if door is None or command is None:
+            syslog.syslog("Ignoring MQTT command %r for %s" % (payload, doorId))
+            return
+        syslog.syslog("%s: %s requested over MQTT" % (door.name, command))
+        self.controller.watch_pulse(self.controller.command_door(door, command), door)
+
+    def home_assistant_status(self, topic, payload):
+        if payload == 'online':
+            self.announce_all()
+
+class NotificationChannel(object):
+    """
+    One way of sending alerts. send() blocks, so it is only ever called from
+    the channel's own worker thread (see Notifier); this also makes it safe
+    for the channel to keep its connection open between messages.
+    """
+    name = None
+    host = None
+
+    def __init__(self, config, alerts):
+        self.config = config
+        self.timeout = config.timeout if config.timeout is not None else alerts.timeout
+        self.conn = None
+
+    def send(self, doors, title, message):
+        raise NotImplementedError()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def request(self, method, url, body, headers):
+        """Make a request on the channel's persistent HTTPS connection."""
+        while True:
+            reused = self.conn is not None
+            if not reused:
+                self.conn = httplib.HTTPSConnection(self.host, 443, timeout=self.timeout)
+            try:
+                self.conn.request(method, url, body, headers)
+                response = self.conn.getresponse()
+                data = response.read()
+            except (httplib.HTTPException, socket.error):
+                self.close()
+                # The server may have dropped an idle connection; try a fresh one
+                if reused:
+                    continue
+                raise
+            if response.status >= 400:
+                raise IOError("HTTP %d from %s: %s" % (response.status, self.host, data))
+            return data
+
+class SmtpChannel(NotificationChannel):
+    name = 'smtp'
+
+    def send(self, doors, title, message):
+        syslog.syslog("Sending email message")
+        config = self.config
+
+        message = MIMEText(message)
+        message['Date'] = formatdate()
+        message['From'] = config.username
+        message['To'] = config.to_email
+        message['Subject'] = config.subject
+        message['Message-ID'] = make_msgid()
+
+        while True:
+            reused = self.conn is not None
+            if not reused:
+                self.connect()
+            try:
+                self.conn.sendmail(config.username, config.to_email, message.as_string())
+                return
+            except (smtplib.SMTPServerDisconnected, socket.error):
+                self.close()
+                if not reused:
+                    raise
+
+    def connect(self):
+        config = self.config
+        server = smtplib.SMTP(config.smtphost, config.smtpport, timeout=self.timeout)
+        if config.smtp_tls:
+            server.starttls()
+        server.login(config.username, config.password)
+        self.conn = server
+
+    def close(self):
+        if self.conn is not None:
+            try:
+                self.conn.quit()
+            except Exception:
+                pass
+            self.conn = None
+
+class PushbulletChannel(NotificationChannel):
+    name = 'pushbullet'
+    host = 'api.pushbullet.com'
+
+    def __init__(self, config, alerts):
+        NotificationChannel.__init__(self, config, alerts)
+        # iden of each push still showing => ids of the doors it is the latest news of
+        self.pushes = {}
+
+    def send(self, doors, title, message):
+        syslog.syslog("Sending pushbutton message")
+        headers = {'Authorization': 'Bearer ' + self.config.access_token, 'Content-Type': 'application/json'}
+
+        # Replace our earlier pushes about these doors rather than pile up
+        ids = set(door.id for door in doors)
+        for iden, push_ids in list(self.pushes.items()):
+            push_ids -= ids
+            if not push_ids:
+                self.request("DELETE", '/v2/pushes/' + iden, "", headers)
+                del self.pushes[iden]
+
+        response = self.request("POST", "/v2/pushes",
+             json.dumps({
+                 "type": "note",
+                 "title": title,
+                 "body": message,
+             }), headers)
+        self.pushes[json.loads(response)['iden']] = ids
+
+class PushoverChannel(NotificationChannel):
+    name = 'pushover'
+    host = 'api.pushover.net'
+
+    def send(self, doors, title, message):
+        syslog.syslog("Sending Pushover message")
+        self.request("POST", "/1/messages.json",
+                urllib.urlencode({
+                    "token": self.config.api_key,
+                    "user": self.config.user_key,
+                    "title": title,
+                    "message": message,
+                }), { "Content-type": "application/x-www-form-urlencoded" })
+
+class TelegramChannel(NotificationChannel):
+    name = 'telegram'
+    host = 'api.telegram.org'
+
+    def send(self, doors, title, message):
+        syslog.syslog("Sending Telegram message")
+        self.request("POST", "/bot" + self.config.api_token + "/sendMessage",
+                urllib.urlencode({
+                    "chat_id": self.config.chat_id,
+                    "text": message,
+                }), { "Content-type": "application/x-www-form-urlencoded" })
+
+class TokenBucket(object):
+    """Allows rate events a second on average, in bursts of up to burst."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.time()
+
+    def refill(self):
+        now = time.time()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self):
+        self.refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self):
+        """Seconds until take() will next succeed."""
+        self.refill()
+        return max(0, (1 - self.tokens) / self.rate)
+
+class Notifier(object):
+    """
+    Delivers alerts without blocking the reactor. Alerts raised within
+    coalesce_window seconds of each other are sent as one message, and a
+    door whose alerts keep coming (a flapping sensor) is held back. Every
+    channel has a token bucket limiting how often it sends, and while it is
+    out of tokens alerts keep collecting into its next message.
+
+    Each channel has its own bounded queue and a single worker thread, so
+    channels send concurrently and a slow or failing channel cannot hold up
+    the others. Failed sends are retried with exponential backoff.
+    """
+
+    def __init__(self, config, metrics):
+        self.channels = []
+        self.send_time = metrics.histogram('garage_notification_send_seconds',
+                                           'Time taken to send an alert', ('channel',))
+        self.failures = metrics.counter('garage_notification_failures_total',
+                                        'Failed attempts to send an alert', ('channel',))
+        self.dropped = metrics.counter('garage_notification_dropped_total',
+                                       'Alerts dropped because a queue was full or retries ran out', ('channel',))
+        self.rate_limited = metrics.counter('garage_notification_rate_limited_total',
+                                            'Messages held back because a channel was over its rate limit',
+                                            ('channel',))
+        self.suppressed = metrics.counter('garage_notification_flapping_total',
+                                          'Alerts held back because a door kept changing', ('door',))
+        self.configure(config)
+        self.started = False
+        self.pending = []
+        self.flush_call = None
+        self.recent = {}
+        self.held_back = {}
+
+    def configure(self, config):
+        """Applies the alerts section. Channels added later pick up its queue and rate limit settings."""
+        self.config = config
+        self.queue_size = config.queue_size
+        self.max_retries = config.max_retries
+        self.retry_delay = config.retry_delay
+        self.coalesce_window = config.coalesce_window
+        self.flap_window = config.flap_window
+        self.flap_max = config.flap_max
+
+    def add_channel(self, channel):
+        config = self.config
+        channel.queue = defer.DeferredQueue(size=self.queue_size)
+        channel.pool = ThreadPool(1, 1, 'notify-' + channel.name)
+        rate_limit = channel.config.rate_limit if channel.config.rate_limit is not None else config.rate_limit
+        burst = channel.config.rate_burst if channel.config.rate_burst is not None else config.rate_burst
+        channel.bucket = TokenBucket(rate_limit / 60.0, burst) if rate_limit else None
+        channel.backlog = []
+        channel.offer_call = None
+        channel.stopped = False
+        self.channels.append(channel)
+        if self.started:
+            self.start_channel(channel)
+
+    def remove_channel(self, channel):
+        """Stops a channel once it has finished any send in progress. Alerts still waiting for it are dropped."""
+        self.channels.remove(channel)
+        channel.stopped = True
+        if channel.offer_call is not None and channel.offer_call.active():
+            channel.offer_call.cancel()
+        if channel.queue.waiting:
+            # wake process_queue() so that it can finish
+            channel.queue.put(None)
+
+    def start(self):
+        self.started = True
+        for channel in self.channels:
+            self.start_channel(channel)
+
+    def start_channel(self, channel):
+        channel.pool.start()
+        channel.shutdown_trigger = reactor.addSystemEventTrigger('during', 'shutdown', self.stop_channel, channel)  # @UndefinedVariable
+        self.process_queue(channel)
+
+    def stop_channel(self, channel):
+        channel.pool.callInThread(channel.close)
+        channel.pool.stop()
+
+    def notify(self, door, title, message):
+        """Queue an alert on every channel. Never blocks."""
+        if self.flapping(door):
+            return
+        held_back = self.held_back.pop(door.id, 0)
+        if held_back:
+            message += " (%d more alerts were held back while the door kept changing)" % held_back
+        self.pending.append((door, title, message))
+        if self.flush_call is None:
+            self.flush_call = reactor.callLater(self.coalesce_window, self.flush)  # @UndefinedVariable
+
+    def flapping(self, door):
+        now = time.time()
+        times = self.recent.setdefault(door.id, collections.deque())
+        while times and times[0] <= now - self.flap_window:
+            times.popleft()
+        if len(times) >= self.flap_max:
+            if door.id not in self.held_back:
+                syslog.syslog("%s keeps changing, holding back its alerts" % door.name)
+            self.held_back[door.id] = self.held_back.get(door.id, 0) + 1
+            self.suppressed.inc((door.id,))
+            return True
+        times.append(now)
+        return False
+
+    def flush(self):
+        self.flush_call = None
+        batch, self.pending = self.pending, []
+        for channel in self.channels:
+            channel.backlog.extend(batch)
+            if channel.offer_call is None:
+                self.offer(channel)
+
+    def offer(self, channel):
+        """Queue the channel's backlog as one message, if its rate limit allows."""
+        channel.offer_call = None
+        if not channel.backlog:
+            return
+        if channel.bucket is not None and not channel.bucket.take():
+            self.rate_limited.inc((channel.name,))
+            channel.offer_call = reactor.callLater(channel.bucket.wait_time(), self.offer, channel)  # @UndefinedVariable
+            return
+        batch, channel.backlog = channel.backlog, []
         try:
-            syslog.syslog("Sending pushbutton message")
-            config = self.config['alerts']['pushbullet']
-
-            if door.pb_iden != None:
-                conn = httplib.HTTPSConnection("api.pushbullet.com:443")
-                conn.request("DELETE", '/v2/pushes/' + door.pb_iden, "",
-                             {'Authorization': 'Bearer ' + config['access_token'], 'Content-Type': 'application/json'})
-                conn.getresponse()
-                door.pb_iden = None
-
-            conn = httplib.HTTPSConnection("api.pushbullet.com:443")
-            conn.request("POST", "/v2/pushes",
-                 json.dumps({
-                     "type": "note",
-                     "title": title,
-                     "body": message,
-                 }), {'Authorization': 'Bearer ' + config['access_token'], 'Content-Type': 'application/json'})
-            response = conn.getresponse().read()
-            print(response)
-            door.pb_iden = json.loads(response)['iden']
-        except Exception as inst:
-            syslog.syslog("Error sending to pushbullet: " + str(inst))
-
-    def send_pushover(self, door, title, message):
+            channel.queue.put(self.combine(batch))
+        except defer.QueueOverflow:
+            syslog.syslog("Alert queue for %s is full, dropping %d alerts" % (channel.name, len(batch)))
+            self.dropped.inc((channel.name,))
+
+    def combine(self, batch):
+        doors = []
+        for door, title, message in batch:
+            if door not in doors:
+                doors.append(door)
+        if len(batch) == 1:
+            door, title, message = batch[0]
+        else:
+            title = "%d garage door alerts" % len(batch)
+            message = "\n".join(message for door, title, message in batch)
+        return doors, title, message
+
+    @defer.inlineCallbacks
+    def process_queue(self, channel):
+        while not channel.stopped:
+            item = yield channel.queue.get()
+            if item is not None:
+                yield self.deliver(channel, *item)
+        reactor.removeSystemEventTrigger(channel.shutdown_trigger)  # @UndefinedVariable
+        self.stop_channel(channel)
+
+    @defer.inlineCallbacks
+    def deliver(self, channel, doors, title, message):
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            start = time.time()
+            try:
+                yield threads.deferToThreadPool(reactor, channel.pool, channel.send, doors, title, message)
+                return
+            except Exception as inst:
+                syslog.syslog("Error sending to %s: %s" % (channel.name, inst))
+                self.failures.inc((channel.name,))
+            finally:
+                self.send_time.observe(time.time() - start, (channel.name,))
+            if attempt < self.max_retries:
+                yield task.deferLater(reactor, delay, lambda: None)
+                delay *= 2
+        syslog.syslog("Giving up sending to %s: %s" % (channel.name, title))
+        self.dropped.inc((channel.name,))
+
+class TimeWindow(object):
+    """A daily period of local time, written like "22:00-06:00"."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.start, self.end = [self.parse(part) for part in spec.split('-')]
+
+    def parse(self, hhmm):
+        hours, minutes = [int(part) for part in hhmm.strip().split(':')]
+        if not (0 <= hours < 24 and 0 <= minutes < 60):
+            raise ValueError("no such time: %s" % hhmm)
+        return hours, minutes
+
+    def __eq__(self, other):
+        return isinstance(other, TimeWindow) and (self.start, self.end) == (other.start, other.end)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def contains(self, t):
+        now = time.localtime(t)[3:5]
+        if self.start <= self.end:
+            return self.start <= now < self.end
+        return now >= self.start or now < self.end
+
+    def end_after(self, t):
+        """The first time after t at which the window closes."""
+        now = datetime.datetime.fromtimestamp(t)
+        end = now.replace(hour=self.end[0], minute=self.end[1], second=0, microsecond=0)
+        if end <= now:
+            end += datetime.timedelta(days=1)
+        return time.mktime(end.timetuple())
+
+class AlertRule(object):
+    """
+    One alert condition from the 'rules' list of the alerts section. Rules
+    are told about each door state change as it happens and arm reactor
+    timers for anything due later, so nothing is checked on every poll.
+    """
+    inherit_quiet_hours = True
+
+    def __init__(self, controller, config, quiet_hours):
+        self.controller = controller
+        self.doors = config.doors
+        if config.quiet_hours is not INHERIT:
+            quiet_hours = config.quiet_hours
+        elif not self.inherit_quiet_hours:
+            quiet_hours = None
+        self.quiet_hours = quiet_hours
+        self.timers = {}
+
+    def applies(self, door):
+        return self.doors is None or door.id in self.doors
+
+    def quiet(self, t):
+        return self.quiet_hours is not None and self.quiet_hours.contains(t)
+
+    def state_changed(self, door, old_state, new_state, now):
+        raise NotImplementedError()
+
+    def due(self, door):
+        raise NotImplementedError()
+
+    def arm(self, door, when):
+        self.cancel(door)
+        self.timers[door.id] = reactor.callLater(max(when - time.time(), 0), self.fire, door)  # @UndefinedVariable
+
+    def fire(self, door):
+        del self.timers[door.id]
+        self.due(door)
+
+    def cancel(self, door):
+        timer = self.timers.pop(door.id, None)
+        if timer is not None and timer.active():
+            timer.cancel()
+
+    def forget(self, door):
+        self.cancel(door)
+
+class OpenTooLongRule(AlertRule):
+    """
+    Alerts once a door has been open for 'after' seconds, then every
+    'repeat' seconds (at most 'max_repeats' more times) until it closes,
+    and finally says when it closed.
+    """
+
+    def __init__(self, controller, config, quiet_hours):
+        AlertRule.__init__(self, controller, config, quiet_hours)
+        self.after = config.after
+        self.repeat = config.repeat
+        self.max_repeats = config.max_repeats
+        self.notify_closed = config.notify_closed
+        self.opened = {}
+        self.sent = {}
+
+    def forget(self, door):
+        AlertRule.forget(self, door)
+        self.opened.pop(door.id, None)
+        self.sent.pop(door.id, None)
+
+    def state_changed(self, door, old_state, new_state, now):
+        if new_state == 'closed':
+            self.cancel(door)
+            opened = self.opened.pop(door.id, now)
+            if self.sent.pop(door.id, 0) and self.notify_closed and not self.quiet(now):
+                title = "%s's garage doors closed" % door.name
+                etime = elapsed_time(int(now - opened))
+                message = "%s's garage door is now closed after %s "% (door.name, etime)
+                self.controller.send_msg(door, title, message)
+        elif new_state != 'unknown' and door.id not in self.opened:
+            self.opened[door.id] = now
+            self.arm(door, now + self.after)
+
+    def due(self, door):
+        now = time.time()
+        if self.quiet(now):
+            self.arm(door, self.quiet_hours.end_after(now))
+            return
+        sent = self.sent.get(door.id, 0)
+        title = "%s's garage door open" % door.name
+        if self.after == 0 and sent == 0:
+            message = "%s's garage door just opened" % (door.name)
+        else:
+            etime = elapsed_time(int(now - self.opened[door.id]))
+            message = "%s's garage door has been open for %s" % (door.name, etime)
+        self.controller.send_msg(door, title, message)
+        self.sent[door.id] = sent + 1
+        if self.repeat and (self.max_repeats is None or sent < self.max_repeats):
+            self.arm(door, now + self.repeat)
+
+class OpenedAtNightRule(AlertRule):
+    """Alerts as soon as a door starts to open during 'hours'."""
+    inherit_quiet_hours = False
+
+    def __init__(self, controller, config, quiet_hours):
+        AlertRule.__init__(self, controller, config, quiet_hours)
+        self.hours = config.hours
+
+    def state_changed(self, door, old_state, new_state, now):
+        if old_state == 'closed' and new_state not in ('closed', 'unknown') and \
+                self.hours.contains(now) and not self.quiet(now):
+            title = "%s's garage door opened at night" % door.name
+            message = "%s's garage door was opened at %s" % (door.name, time.strftime('%H:%M', time.localtime(now)))
+            self.controller.send_msg(door, title, message)
+
+class AlertRules(object):
+    """The alert rules in force, built from the alerts section of the config."""
+    rule_types = {'open_too_long': OpenTooLongRule, 'opened_at_night': OpenedAtNightRule}
+
+    def __init__(self, controller, config):
+        rules = config.rules
+        if rules is None:
+            # The original single alert
+            rules = [RULE_CONFIG.make(type='open_too_long', after=config.time_to_wait)]
+        self.rules = [self.rule_types[rule.type](controller, rule, config.quiet_hours) for rule in rules]
+
+    def state_changed(self, door, old_state, new_state):
+        now = time.time()
+        for rule in self.rules:
+            if rule.applies(door):
+                rule.state_changed(door, old_state, new_state, now)
+
+    def forget(self, door):
+        for rule in self.rules:
+            rule.forget(door)
+
+    def stop(self):
+        for rule in self.rules:
+            for timer in rule.timers.values():
+                if timer.active():
+                    timer.cancel()
+            rule.timers.clear()
+
+class DoorRegistry(object):
+    """
+    The controller's doors, in display order, with lookup by id. There is
+    one registry per controller and every resource shares it; each door's
+    last_state is the most recently sampled state, so request handlers can
+    answer from it without reading the GPIO pins themselves.
+    """
+
+    def __init__(self, doors=()):
+        self.ordered = []
+        self.by_id = {}
+        for door in doors:
+            self.add(door)
+
+    def add(self, door, index=None):
+        """Adds door at the end, or at index in the display order."""
+        if index is None:
+            self.ordered.append(door)
+        else:
+            self.ordered.insert(index, door)
+        self.by_id[door.id] = door
+
+    def get(self, doorId):
+        return self.by_id.get(doorId)
+
+    def __contains__(self, doorId):
+        return doorId in self.by_id
+
+    def __iter__(self):
+        return iter(self.ordered)
+
+    def remove(self, door):
+        self.ordered.remove(door)
+        del self.by_id[door.id]
+
+    def __len__(self):
+        return len(self.ordered)
+
+class Counter(object):
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.values = {}
+
+    def inc(self, labels=(), amount=1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        for labels, value in sorted(self.values.items()):
+            yield self.name, self.labelnames, labels, value
+
+class Gauge(object):
+    """
+    A value read when the metrics are rendered. function returns a number,
+    or when the gauge has labels, (labels, value) pairs.
+    """
+    def __init__(self, name, help, function, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.function = function
+
+    def samples(self):
+        if not self.labelnames:
+            yield self.name, (), (), self.function()
+        else:
+            for labels, value in self.function():
+                yield self.name, self.labelnames, labels, value
+
+class Histogram(object):
+    # seconds
+    default_buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, name, help, labelnames=(), buckets=default_buckets):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.values = {}
+
+    def observe(self, value, labels=()):
+        counts = self.values.get(labels)
+        if counts is None:
+            # one count per bucket plus +Inf, then the sum
+            counts = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def samples(self):
+        le_names = self.labelnames + ('le',)
+        for labels, counts in sorted(self.values.items()):
+            total = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                total += count
+                yield self.name + '_bucket', le_names, labels + (str(bound),), total
+            yield self.name + '_sum', self.labelnames, labels, counts[-1]
+            yield self.name + '_count', self.labelnames, labels, total
+
+class Metrics(object):
+    """
+    In-process counters, gauges and histograms, rendered in the Prometheus
+    text format by /metrics. Updating a metric is a dictionary lookup and an
+    addition, so they are cheap enough to leave on.
+    """
+    kinds = {Counter: 'counter', Gauge: 'gauge', Histogram: 'histogram'}
+
+    def __init__(self):
+        self.metrics = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help, labelnames=()):
+        return self.add(Counter(name, help, labelnames))
+
+    def gauge(self, name, help, function, labelnames=()):
+        return self.add(Gauge(name, help, function, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=Histogram.default_buckets):
+        return self.add(Histogram(name, help, labelnames, buckets))
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append('# HELP %s %s' % (metric.name, metric.help))
+            lines.append('# TYPE %s %s' % (metric.name, self.kinds[type(metric)]))
+            for name, labelnames, labels, value in metric.samples():
+                if labelnames:
+                    name += '{%s}' % ','.join('%s="%s"' % (n, escape_label(v))
+                                              for n, v in zip(labelnames, labels))
+                lines.append('%s %s' % (name, repr(float(value))))
+        return '\n'.join(lines) + '\n'
+
+class ReactorMonitor(object):
+    """
+    Measures reactor loop lag: how late a timer that is rescheduled every
+    interval actually runs. Anything that blocks the reactor thread shows up
+    here.
+    """
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.expected = None
+
+    def start(self):
+        self.expected = time.time() + self.interval
+        reactor.callLater(self.interval, self.tick)  # @UndefinedVariable
+
+    def tick(self):
+        now = time.time()
+        self.lag = max(now - self.expected, 0.0)
+        self.max_lag = max(self.max_lag, self.lag)
+        self.expected = now + self.interval
+        reactor.callLater(self.interval, self.tick)  # @UndefinedVariable
+
+def sd_notify(state):
+    """
+    Tells systemd about the service's state (e.g. 'READY=1') when it was
+    started with Type=notify. Returns False if there is no one to tell.
+    """
+    address = os.environ.get('NOTIFY_SOCKET')
+    if not address:
+        return False
+    if address.startswith('@'):
+        # an abstract socket
+        address = '\0' + address[1:]
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        sock.connect(address)
+        sock.sendall(utf8(state))
+        return True
+    except socket.error:
+        return False
+    finally:
+        sock.close()
+
+class Watchdog(object):
+    """
+    Checks every few seconds that the controller is still doing its job:
+    each provider's status loop is running, its doors were read recently
+    and no read is hung. While they are, it sends systemd's watchdog a
+    heartbeat (when WatchdogSec is set for the service); once they aren't,
+    the heartbeats stop and systemd restarts the controller. A reactor
+    that has stopped altogether sends no heartbeats either.
+    """
+
+    def __init__(self, controller, interval=5.0):
+        self.controller = controller
+        self.interval = interval
+        self.heartbeat = False
+        usec = os.environ.get('WATCHDOG_USEC')
+        pid = os.environ.get('WATCHDOG_PID')
+        if usec and (not pid or int(pid) == os.getpid()):
+            # systemd wants to hear from us at least every WATCHDOG_USEC
+            self.heartbeat = True
+            self.interval = min(interval, int(usec) / 2e6)
+        self.problems = []
+        self.status = None
+
+    def start(self):
+        task.LoopingCall(self.check).start(self.interval)
+
+    def check(self):
+        problems = list(self.controller.problems())
+        if problems != self.problems:
+            syslog.syslog("Unhealthy: " + '; '.join(problems) if problems else "Healthy again")
+        self.problems = problems
+        if not problems:
+            if self.heartbeat:
+                sd_notify('WATCHDOG=1')
+            status = "Monitoring %d doors" % len(self.controller.doors)
+        else:
+            status = '; '.join(problems)
+        if status != self.status:
+            sd_notify('STATUS=' + status)
+            self.status = status
+
+class EventHistory(object):
+    """
+    Append-only log of door events: state changes, toggles and alerts. Each
+    event is one compact JSON line, [time, door, kind, value].
+
+    Recording an event only appends to memory. Pending lines are written and
+    fsynced in batches from a background thread every flush_interval
+    seconds. Every event in the file is also kept in an in-memory index, so
+    queries never read the file. Once the file grows past max_bytes the
+    oldest half is dropped and the file rewritten.
+    """
+
+    def __init__(self, config):
+        self.path = config.file
+        self.max_bytes = config.max_bytes
+        self.flush_interval = config.flush_interval
+        self.events = []
+        self.times = []
+        self.doors = {}
+        self.size = 0
+        self.pending = []
+        self.file = None
+        self.pool = ThreadPool(1, 1, 'history')
+        self.load()
+
+    def load(self):
         try:
-            syslog.syslog("Sending Pushover message")
-            config = self.config['alerts']['pushover']
-            conn = httplib.HTTPSConnection("api.pushover.net:443")
-            conn.request("POST", "/1/messages.json",
-                    urllib.urlencode({
-                        "token": config['api_key'],
-                        "user": config['user_key'],
-                        "title": title,
-                        "message": message,
-                    }), { "Content-type": "application/x-www-form-urlencoded" })
-            conn.getresponse()
-        except Exception as inst:
-            syslog.syslog("Error sending to pushover: " + str(inst))
-
-    def send_telegram(self, door, title, message):
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        event = tuple(json.loads(line))
+                    except ValueError:
+                        # most likely a line cut short by a crash
+                        continue
+                    self.index(event)
+                    self.size += len(line)
+        except IOError:
+            pass
+
+    def index(self, event):
+        self.events.append(event)
+        self.times.append(event[0])
+        times, events = self.doors.setdefault(event[1], ([], []))
+        times.append(event[0])
+        events.append(event)
+
+    def start(self):
+        self.pool.start()
+        task.LoopingCall(self.flush).start(self.flush_interval, now=False)
+        reactor.addSystemEventTrigger('during', 'shutdown', self.stop)  # @UndefinedVariable
+
+    def stop(self):
+        self.flush()
+        self.pool.callInThread(self.close)
+        self.pool.stop()
+
+    def record(self, door, kind, value):
+        event = (time.time(), door, kind, value)
+        line = json.dumps(event, separators=(',', ':')) + '\n'
+        self.index(event)
+        self.pending.append(line)
+        self.size += len(line)
+
+    def flush(self):
+        if self.size > self.max_bytes:
+            self.compact()
+        elif self.pending:
+            data, self.pending = ''.join(self.pending), []
+            self.pool.callInThread(self.write, data)
+
+    def compact(self):
+        keep = []
+        size = 0
+        for event in reversed(self.events):
+            line = json.dumps(event, separators=(',', ':')) + '\n'
+            if size + len(line) > self.max_bytes / 2:
+                break
+            keep.append(line)
+            size += len(line)
+        keep.reverse()
+
+        events = self.events[len(self.events) - len(keep):]
+        self.events, self.times, self.doors = [], [], {}
+        for event in events:
+            self.index(event)
+        self.size = size
+        self.pending = []
+        self.pool.callInThread(self.rewrite, ''.join(keep))
+
+    def write(self, data):
         try:
-            syslog.syslog("Sending Telegram message")
-            config = self.config['alerts']['telegram']
-            conn = httplib.HTTPSConnection("api.telegram.org:443")
-            conn.request("POST", "/bot" + config['api_token'] + "/sendMessage",
-                    urllib.urlencode({
-                        "chat_id": config['chat_id'],
-                        "text": message,
-                    }), { "Content-type": "application/x-www-form-urlencoded" })
-            conn.getresponse()
-        except Exception as inst:
-            syslog.syslog("Error sending to telegram: " + str(inst))
-
-    def update_ifttt(self, door, status, open_event, close_event):
+            if self.file is None:
+                self.file = open(self.path, 'a')
+            self.file.write(data)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        except (IOError, OSError) as inst:
+            syslog.syslog("Error writing history: " + str(inst))
+            self.close()
+
+    def rewrite(self, data):
+        self.close()
         try:
-            syslog.syslog("Sending ifttt event")
-            config = self.config['ifttt']
-            conn = httplib.HTTPSConnection("maker.ifttt.com:443")
-            if status == "open":
-                conn.request("POST", "/trigger/" + open_event + "/with/key/" + config['key'],
-                        urllib.urlencode({
-                            "value1": door,
-                            "value2": status,
-                        }), { "Content-type": "application/x-www-form-urlencoded" })
+            with open(self.path + '.tmp', 'w') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.rename(self.path + '.tmp', self.path)
+        except (IOError, OSError) as inst:
+            syslog.syslog("Error compacting history: " + str(inst))
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def query(self, start=None, end=None, door=None, limit=None):
+        """Returns the events between start and end, oldest first."""
+        if door is None:
+            times, events = self.times, self.events
+        elif door in self.doors:
+            times, events = self.doors[door]
+        else:
+            return []
+        first = 0 if start is None else bisect.bisect_left(times, start)
+        last = len(times) if end is None else bisect.bisect_right(times, end)
+        if limit is not None:
+            first = max(first, last - limit)
+        return events[first:last]
+
+class ConfigError(Exception):
+    """A config that can't be used. Lists every problem found, not just the first."""
+
+    def __init__(self, errors):
+        Exception.__init__(self, "Invalid configuration:\n  " + "\n  ".join(errors))
+        self.errors = errors
+
+# Field defaults: REQUIRED settings must be given. INHERIT settings take
+# their value from elsewhere unless given, and can be given as null.
+REQUIRED = object()
+INHERIT = object()
+
+class Number(object):
+    def __init__(self, minimum=None, maximum=None, integer=False):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.integer = integer
+
+    def compile(self, value, where, errors):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            errors.append("%s must be a number, not %s" % (where, json.dumps(value)))
+        elif self.integer and not isinstance(value, int):
+            errors.append("%s must be a whole number, not %s" % (where, value))
+        elif self.minimum is not None and value < self.minimum:
+            errors.append("%s must be at least %s" % (where, self.minimum))
+        elif self.maximum is not None and value > self.maximum:
+            errors.append("%s must be at most %s" % (where, self.maximum))
+        else:
+            return value
+
+class Text(object):
+    def __init__(self, numbers=False):
+        self.numbers = numbers
+
+    def compile(self, value, where, errors):
+        if isinstance(value, basestring):
+            return value
+        if self.numbers and isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        errors.append("%s must be a string, not %s" % (where, json.dumps(value)))
+
+class Boolean(object):
+    def compile(self, value, where, errors):
+        if isinstance(value, bool):
+            return value
+        # Older configs spell some of these "True" and "False"
+        if isinstance(value, basestring) and value.lower() in ('true', 'false'):
+            return value.lower() == 'true'
+        errors.append("%s must be true or false, not %s" % (where, json.dumps(value)))
+
+class Choice(object):
+    def __init__(self, *choices):
+        self.choices = choices
+
+    def compile(self, value, where, errors):
+        if value in self.choices and not isinstance(value, bool):
+            return value
+        errors.append("%s must be one of %s, not %s" % (where, ', '.join(json.dumps(c) for c in self.choices),
+                                                        json.dumps(value)))
+
+class Window(object):
+    def compile(self, value, where, errors):
+        try:
+            return TimeWindow(value)
+        except (AttributeError, ValueError):
+            errors.append('%s must be a time range like "22:00-06:00", not %s' % (where, json.dumps(value)))
+
+class ListOf(object):
+    """A list, compiled to a tuple. With split, a comma separated string also works."""
+
+    def __init__(self, kind, split=False):
+        self.kind = kind
+        self.split = split
+
+    def compile(self, value, where, errors):
+        if self.split and isinstance(value, basestring):
+            value = [part.strip() for part in value.split(',') if part.strip()]
+        if not isinstance(value, list):
+            errors.append("%s must be a list, not %s" % (where, json.dumps(value)))
+            return None
+        return tuple(self.kind.compile(item, '%s[%d]' % (where, n), errors) for n, item in enumerate(value))
+
+class MapOf(object):
+    """An object with arbitrary keys, compiled to a tuple of (key, value) pairs in key order."""
+
+    def __init__(self, kind):
+        self.kind = kind
+
+    def compile(self, value, where, errors):
+        if not isinstance(value, dict):
+            errors.append("%s must be an object, not %s" % (where, json.dumps(value)))
+            return None
+        return tuple((key, self.kind.compile(item, '%s.%s' % (where, key), errors))
+                     for key, item in sorted(value.items()))
+
+class Section(object):
+    """
+    An object with known keys, compiled to a namedtuple. fields lists
+    (name, kind, default) for each key; a default that is a dict is
+    compiled as if it had been given.
+    """
+
+    def __init__(self, typename, fields):
+        self.fields = fields
+        self.type = collections.namedtuple(typename, [name for name, kind, default in fields])
+
+    def compile(self, value, where, errors):
+        if not isinstance(value, dict):
+            errors.append("%s must be an object, not %s" % (where or 'the configuration', json.dumps(value)))
+            return None
+        names = set(self.type._fields)
+        for key in sorted(value):
+            if key not in names:
+                syslog.syslog("Ignoring unknown setting %s" % self.path(where, key))
+        values = {}
+        for name, kind, default in self.fields:
+            path = self.path(where, name)
+            if value.get(name) is not None:
+                values[name] = kind.compile(value[name], path, errors)
+            elif default is REQUIRED:
+                errors.append("%s is required" % path)
+                values[name] = None
+            elif default is INHERIT and name in value:
+                values[name] = None
+            elif isinstance(default, dict):
+                values[name] = kind.compile(default, path, errors)
             else:
-                conn.request("POST", "/trigger/" + close_event + "/with/key/" + config['key'],
-                        urllib.urlencode({
-                            "value1": door,
-                            "value2": status,
-                        }), { "Content-type": "application/x-www-form-urlencoded" })
-            conn.getresponse()
-        except Exception as inst:
-            syslog.syslog("Error updating ifttt: " + str(inst))
-
-    def update_openhab(self, item, state):
+                values[name] = default
+        return self.type(**values)
+
+    def path(self, where, name):
+        return '%s.%s' % (where, name) if where else name
+
+    def make(self, **values):
+        """Builds one of these from keyword arguments, for settings made up in code."""
+        errors = []
+        compiled = self.compile(values, '', errors)
+        if errors:
+            raise ConfigError(errors)
+        return compiled
+
+SIMULATION_CONFIG = Section('SimulationConfig', [
+    ('bounce_time', Number(minimum=0), 0),
+    ('stuck_sensor', Choice(0, 1), None),
+    ('jammed', Boolean(), False),
+    ('position', Choice('closed', 'open'), 'closed'),
+])
+
+DOOR_CONFIG = Section('DoorConfig', [
+    ('name', Text(), REQUIRED),
+    ('provider', Text(), 'gpio'),
+    ('relay_pin', Number(minimum=0, integer=True), REQUIRED),
+    ('state_pin', Number(minimum=0, integer=True), REQUIRED),
+    ('state_pin_closed_value', Choice(0, 1), 0),
+    ('open_state_pin', Number(minimum=0, integer=True), None),
+    ('open_state_pin_open_value', Choice(0, 1), 0),
+    ('time_to_open', Number(minimum=0), None),
+    ('time_to_close', Number(minimum=0), None),
+    ('approx_time_to_open', Number(minimum=0), 10),
+    ('approx_time_to_close', Number(minimum=0), 10),
+    ('travel_time_alpha', Number(minimum=0, maximum=1), 0.3),
+    ('stuck_factor', Number(minimum=1), 1.5),
+    ('relay_pulse_time', Number(minimum=0), 0.2),
+    ('relay_pulse_gap', Number(minimum=0), 0.5),
+    ('openhab_name', Text(), None),
+    ('ifttt_event_open', Text(), None),
+    ('ifttt_event_close', Text(), None),
+    ('simulation', SIMULATION_CONFIG, {}),
+])
+
+PROVIDER_CONFIG = Section('ProviderConfig', [
+    ('type', Choice('gpio', 'mcp23017', 'nodes'), REQUIRED),
+    ('bus', Number(minimum=0, integer=True), 1),
+    ('address', Number(minimum=0, maximum=0x7F, integer=True), 0x20),
+    ('port', Number(minimum=1, maximum=65535, integer=True), None),
+    ('key', Text(), None),
+])
+
+UPSTREAM_CONFIG = Section('UpstreamConfig', [
+    ('host', Text(), REQUIRED),
+    ('port', Number(minimum=1, maximum=65535, integer=True), REQUIRED),
+    ('node', Text(), REQUIRED),
+    ('key', Text(), REQUIRED),
+])
+
+def channel_config(typename, fields):
+    # Every channel can override these settings of the alerts section
+    return Section(typename, fields + [
+        ('timeout', Number(minimum=0), None),
+        ('rate_limit', Number(minimum=0), None),
+        ('rate_burst', Number(minimum=1), None),
+    ])
+
+SMTP_CONFIG = channel_config('SmtpConfig', [
+    ('smtphost', Text(), REQUIRED),
+    ('smtpport', Number(minimum=1, maximum=65535, integer=True), 587),
+    ('smtp_tls', Boolean(), True),
+    ('username', Text(), REQUIRED),
+    ('password', Text(), REQUIRED),
+    ('to_email', Text(), REQUIRED),
+    ('subject', Text(), "Garage door alert"),
+])
+
+PUSHBULLET_CONFIG = channel_config('PushbulletConfig', [
+    ('access_token', Text(), REQUIRED),
+])
+
+PUSHOVER_CONFIG = channel_config('PushoverConfig', [
+    ('user_key', Text(), REQUIRED),
+    ('api_key', Text(), REQUIRED),
+])
+
+TELEGRAM_CONFIG = channel_config('TelegramConfig', [
+    ('chat_id', Text(numbers=True), REQUIRED),
+    ('api_token', Text(), REQUIRED),
+])
+
+IFTTT_ALERT_CONFIG = Section('IftttAlertConfig', [
+    ('key', Text(), REQUIRED),
+    ('event', Text(), REQUIRED),
+])
+
+RULE_CONFIG = Section('RuleConfig', [
+    ('type', Choice('open_too_long', 'opened_at_night'), REQUIRED),
+    ('doors', ListOf(Text()), None),
+    ('after', Number(minimum=0), 0),
+    ('repeat', Number(minimum=1), None),
+    ('max_repeats', Number(minimum=0, integer=True), None),
+    ('notify_closed', Boolean(), True),
+    ('hours', Window(), TimeWindow('22:00-06:00')),
+    ('quiet_hours', Window(), INHERIT),
+])
+
+ALERTS_CONFIG = Section('AlertsConfig', [
+    ('alert_type', ListOf(Choice('smtp', 'pushbullet', 'pushover', 'telegram', 'ifttt'), split=True), ()),
+    ('time_to_wait', Number(minimum=0), 0),
+    ('rules', ListOf(RULE_CONFIG), None),
+    ('quiet_hours', Window(), None),
+    ('timeout', Number(minimum=0), 10),
+    ('queue_size', Number(minimum=1, integer=True), 100),
+    ('max_retries', Number(minimum=0, integer=True), 3),
+    ('retry_delay', Number(minimum=0), 2),
+    ('coalesce_window', Number(minimum=0), 2),
+    ('rate_limit', Number(minimum=0), 10),
+    ('rate_burst', Number(minimum=1), 5),
+    ('flap_window', Number(minimum=0), 300),
+    ('flap_max', Number(minimum=1, integer=True), 6),
+    ('smtp', SMTP_CONFIG, None),
+    ('pushbullet', PUSHBULLET_CONFIG, None),
+    ('pushover', PUSHOVER_CONFIG, None),
+    ('telegram', TELEGRAM_CONFIG, None),
+    ('ifttt', IFTTT_ALERT_CONFIG, None),
+])
+
+SETTINGS = Section('Settings', [
+    ('use_https', Boolean(), False),
+    ('use_auth', Boolean(), False),
+    ('use_alerts', Boolean(), False),
+    ('use_openhab', Boolean(), False),
+    ('use_ifttt', Boolean(), False),
+    ('use_mqtt', Boolean(), False),
+    ('allow_api', Boolean(), False),
+    ('api_key', Text(), None),
+    ('gpio_backend', Choice('rpi', 'sim'), 'rpi'),
+    ('state_detection', Choice('poll', 'interrupt'), 'poll'),
+    ('poll_interval', Number(minimum=0.01), 0.5),
+    ('fallback_poll_interval', Number(minimum=0.01), 10),
+    ('debounce_time', Number(minimum=0), 0.05),
+    ('sample_timeout', Number(minimum=0.01), 5),
+    ('update_timeout', Number(minimum=0), 25),
+    ('max_update_waiters', Number(minimum=0, integer=True), 500),
+    ('update_history', Number(minimum=1, integer=True), 256),
+    ('event_heartbeat', Number(minimum=0.01), 15),
+    ('max_event_streams', Number(minimum=0, integer=True), 100),
+    ('reload_interval', Number(minimum=0), 5),
+])
+
+SITE_CONFIG = Section('SiteConfig', [
+    ('port', Number(minimum=1, maximum=65535, integer=True), 8081),
+    ('port_secure', Number(minimum=1, maximum=65535, integer=True), 8444),
+    ('username', Text(), None),
+    ('password', Text(), None),
+    ('ssl_key', Text(), None),
+    ('ssl_cert', Text(), None),
+    ('asset_cache_max_size', Number(minimum=0, integer=True), 512 * 1024),
+])
+
+MQTT_CONFIG = Section('MqttConfig', [
+    ('host', Text(), None),
+    ('port', Number(minimum=1, maximum=65535, integer=True), 1883),
+    ('username', Text(), None),
+    ('password', Text(), None),
+    ('client_id', Text(), None),
+    ('topic_prefix', Text(), 'garage'),
+    ('keepalive', Number(minimum=5, maximum=65535, integer=True), 60),
+    ('buffer_size', Number(minimum=0, integer=True), 100),
+    ('discovery', Boolean(), True),
+    ('discovery_prefix', Text(), 'homeassistant'),
+])
+
+USER_CONFIG = Section('UserConfig', [
+    ('password_hash', Text(), REQUIRED),
+    ('doors', ListOf(Text(), split=True), None),
+    ('read_only', Boolean(), False),
+])
+
+AUTH_CONFIG = Section('AuthConfig', [
+    ('users', MapOf(USER_CONFIG), ()),
+    ('secret_file', Text(), 'session.key'),
+    ('session_lifetime', Number(minimum=60), 30 * 24 * 60 * 60),
+    ('api_token_lifetime', Number(minimum=60), 365 * 24 * 60 * 60),
+    ('cache_size', Number(minimum=1, integer=True), 1000),
+    ('max_pending', Number(minimum=1, integer=True), 20),
+])
+
+CONFIG = Section('Config', [
+    ('config', SETTINGS, {}),
+    ('alerts', ALERTS_CONFIG, {}),
+    ('openhab', Section('OpenhabConfig', [('server', Text(), None), ('port', Text(numbers=True), None)]), {}),
+    ('ifttt', Section('IftttConfig', [('key', Text(), None)]), {}),
+    ('mqtt', MQTT_CONFIG, {}),
+    ('history', Section('HistoryConfig', [('file', Text(), 'history.log'),
+                                          ('max_bytes', Number(minimum=1, integer=True), 1024 * 1024),
+                                          ('flush_interval', Number(minimum=0.01), 5)]), {}),
+    ('site', SITE_CONFIG, {}),
+    ('auth', AUTH_CONFIG, {}),
+    ('doors', MapOf(DOOR_CONFIG), REQUIRED),
+    ('providers', MapOf(PROVIDER_CONFIG), ()),
+    ('upstream', UPSTREAM_CONFIG, None),
+])
+
+def compile_config(raw):
+    """
+    Checks a parsed config.json and turns it into immutable namedtuples,
+    with every default filled in. Raises ConfigError listing all problems.
+    """
+    errors = []
+    config = CONFIG.compile(raw, '', errors)
+    if not errors:
+        check_config(config, errors)
+    if errors:
+        raise ConfigError(errors)
+    return config
+
+def check_config(config, errors):
+    """The checks that involve more than one setting."""
+    settings, site = config.config, config.site
+    if settings.allow_api and not settings.api_key:
+        errors.append("config.api_key is required when allow_api is on")
+    if settings.use_auth and not (site.username and site.password) and not config.auth.users:
+        errors.append("auth.users, or site.username and site.password, are required when use_auth is on")
+    for name, user in config.auth.users:
+        try:
+            parse_password_hash(user.password_hash)
+        except ValueError:
+            errors.append("auth.users.%s.password_hash is not a hash from extra/hashpassword.py" % name)
+        for doorId in user.doors or ():
+            if doorId not in dict(config.doors):
+                errors.append("auth.users.%s.doors: there is no door %s" % (name, doorId))
+        if name == site.username:
+            errors.append("auth.users.%s is also site.username" % name)
+    if settings.use_https and not (site.ssl_key and site.ssl_cert):
+        errors.append("site.ssl_key and site.ssl_cert are required when use_https is on")
+    if settings.use_openhab and not (config.openhab.server and config.openhab.port):
+        errors.append("openhab.server and openhab.port are required when use_openhab is on")
+    if settings.use_ifttt and not config.ifttt.key:
+        errors.append("ifttt.key is required when use_ifttt is on")
+    if settings.use_mqtt and not config.mqtt.host:
+        errors.append("mqtt.host is required when use_mqtt is on")
+    for alert in config.alerts.alert_type:
+        if getattr(config.alerts, alert) is None:
+            errors.append("alerts.%s is required when alert_type includes %s" % (alert, alert))
+    for rule in config.alerts.rules or ():
+        for doorId in rule.doors or ():
+            if doorId not in dict(config.doors):
+                errors.append("alerts.rules: there is no door %s" % doorId)
+    providers = dict(config.providers)
+    for name, provider in config.providers:
+        if provider.type == 'nodes' and not (provider.port and provider.key):
+            errors.append("providers.%s.port and providers.%s.key are required" % (name, name))
+    pins = {}
+    for doorId, door in config.doors:
+        if door.provider != 'gpio' and door.provider not in providers:
+            errors.append("doors.%s.provider: there is no provider %s" % (doorId, door.provider))
+        for pin in (door.relay_pin, door.state_pin, door.open_state_pin):
+            if pin is None:
+                continue
+            user = pins.setdefault((door.provider, pin), doorId)
+            if user != doorId:
+                errors.append("doors.%s uses pin %d, which doors.%s uses already" % (doorId, pin, user))
+
+def load_config(path):
+    try:
+        with open(path) as f:
+            raw = json.load(f)
+    except (IOError, ValueError) as e:
+        raise ConfigError(["%s: %s" % (path, e)])
+    return compile_config(raw)
+
+PASSWORD_HASH_ITERATIONS = 100000
+
+def utf8(value):
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+def hash_password(password, iterations=PASSWORD_HASH_ITERATIONS, salt=None):
+    """
+    Returns a "pbkdf2_sha256$<iterations>$<salt>$<hash>" string, the form
+    auth.users.*.password_hash takes in config.json.
+    """
+    if salt is None:
+        salt = base64.b64encode(os.urandom(12))
+    digest = hashlib.pbkdf2_hmac('sha256', utf8(password), salt, iterations)
+    return 'pbkdf2_sha256$%d$%s$%s' % (iterations, salt, base64.b64encode(digest))
+
+def parse_password_hash(password_hash):
+    """Splits a hash from hash_password into (iterations, salt, hash); raises ValueError."""
+    algorithm, iterations, salt, digest = str(password_hash).split('$')
+    if algorithm != 'pbkdf2_sha256' or not salt or not digest:
+        raise ValueError(password_hash)
+    return int(iterations), salt, digest
+
+def check_password(password, password_hash):
+    """Deliberately slow; call it from a thread."""
+    iterations, salt, expected = parse_password_hash(password_hash)
+    digest = hashlib.pbkdf2_hmac('sha256', utf8(password), salt, iterations)
+    return hmac.compare_digest(base64.b64encode(digest), expected)
+
+# Checked against when someone gives a name we don't know, so that takes as
+# long as a wrong password. Nothing hashes to it.
+UNKNOWN_USER_HASH = 'pbkdf2_sha256$%d$unknown$unknown' % PASSWORD_HASH_ITERATIONS
+
+class Account(object):
+    """Someone allowed to use the controller, and the doors they may see and operate."""
+
+    def __init__(self, name, password_hash=None, doors=None, read_only=False):
+        self.name = name
+        self.password_hash = str(password_hash or '')
+        self.doors = frozenset(doors) if doors is not None else None
+        self.read_only = read_only
+
+    def can_see(self, doorId):
+        return self.doors is None or doorId in self.doors
+
+    def can_control(self, doorId):
+        return not self.read_only and self.can_see(doorId)
+
+    def visible(self, rows):
+        """Drops the rows, each starting with a door id, for doors this account can't see."""
+        if self.doors is None:
+            return rows
+        return [row for row in rows if row[0] in self.doors]
+
+# Everyone, when use_auth is off
+ANONYMOUS = Account('anonymous')
+
+class AuthBusy(Exception):
+    """Raised (in a Deferred) when too many password checks are already waiting."""
+
+class Auth(object):
+    """
+    Decides who a request comes from. Passwords are only hashed when
+    someone logs in (or sends Basic credentials that haven't been seen
+    before), on a thread of their own. A login is answered with a signed
+    token, kept in a cookie by browsers or sent as "Authorization: Bearer"
+    by other clients, which costs one HMAC to check the first time it is
+    seen and a dictionary lookup after that. Tokens carry the account name
+    and expiry time; changing a user's password ends their sessions.
+    """
+    cookie = 'garage_session'
+    realm = 'Garage Door Controller'
+
+    def __init__(self, config):
+        self.pool = ThreadPool(1, 1, 'auth')
+        self.secret = None
+        self.secret_file = None
+        self.legacy = None
+        self.pending = 0
+        self.configure(config)
+
+    def configure(self, config):
+        settings = config.auth
+        if settings.secret_file != self.secret_file:
+            self.secret_file = settings.secret_file
+            self.secret = self.load_secret(settings.secret_file)
+        self.enabled = config.config.use_auth
+        self.secure = config.config.use_https
+        self.session_lifetime = settings.session_lifetime
+        self.api_token_lifetime = settings.api_token_lifetime
+        self.cache_size = settings.cache_size
+        self.max_pending = settings.max_pending
+
+        accounts = {}
+        for name, user in settings.users:
+            accounts[name] = Account(name, user.password_hash, user.doors, user.read_only)
+        self.accounts = accounts
+        site = config.site
+        if site.username and site.password:
+            # The single user of older configs, with a password in the clear
+            legacy = (site.username, site.password)
+            if self.legacy is None or self.legacy[:2] != legacy:
+                if reactor.running:  # @UndefinedVariable
+                    # Reloaded with a new password: hash it off the reactor,
+                    # letting nobody in under that name until it's done
+                    self.legacy = legacy + (None,)
+                    d = threads.deferToThreadPool(reactor, self.pool, self.legacy_hash, *legacy)  # @UndefinedVariable
+                    d.addCallback(self.legacy_hashed, legacy)
+                else:
+                    self.legacy = legacy + (self.legacy_hash(*legacy),)
+            if self.legacy[2] is not None:
+                accounts[site.username] = Account(site.username, self.legacy[2])
+        else:
+            self.legacy = None
+        self.api_key = None
+        if config.config.allow_api and config.config.api_key:
+            self.api_key = utf8(config.config.api_key)
+        self.api_account = Account('api')
+
+        # Accounts may have changed, so nothing verified so far still holds
+        self.tokens = collections.OrderedDict()
+        self.passwords = collections.OrderedDict()
+
+    def load_secret(self, path):
+        """The key tokens are signed with, made on first use so sessions survive restarts."""
+        try:
+            with open(path, 'rb') as f:
+                secret = f.read().strip()
+            if secret:
+                return secret
+        except IOError:
+            pass
+        secret = base64.b16encode(os.urandom(32))
         try:
-            syslog.syslog("Updating openhab")
-            config = self.config['openhab']
-            conn = httplib.HTTPConnection("%s:%s" % (config['server'], config['port']))
-            conn.request("PUT", "/rest/items/%s/state" % item, state)
-            conn.getresponse()
-        except:
-            syslog.syslog("Error updating openhab: " + str(inst))
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(secret)
+        except (IOError, OSError) as e:
+            syslog.syslog("Can't save the session key to %s, so logins end on restart: %s" % (path, e))
+        return secret
+
+    def legacy_hash(self, name, password):
+        """
+        Hashes the legacy password with a salt derived from the session key,
+        so that it hashes the same on every start and its sessions, which
+        are signed with the hash, survive restarts.
+        """
+        salt = base64.b64encode(hmac.new(self.secret, 'legacy\0' + utf8(name), hashlib.sha256).digest()[:12])
+        return hash_password(password, salt=salt)
+
+    def legacy_hashed(self, password_hash, legacy):
+        if self.legacy is not None and self.legacy[:2] == legacy:
+            self.legacy = legacy + (password_hash,)
+            self.accounts[legacy[0]] = Account(legacy[0], password_hash)
+
+    def start(self):
+        self.pool.start()
+        reactor.addSystemEventTrigger('during', 'shutdown', self.pool.stop)  # @UndefinedVariable
+
+    def remember(self, cache, key, value):
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def sign(self, payload, account):
+        message = payload + '.' + account.password_hash
+        return hmac.new(self.secret, message, hashlib.sha256).hexdigest()
+
+    def issue(self, account, lifetime):
+        """Returns a token for account and when it expires."""
+        expires = int(time.time() + lifetime)
+        payload = '%s.%d' % (base64.urlsafe_b64encode(utf8(account.name)).rstrip('='), expires)
+        return payload + '.' + self.sign(payload, account), expires
+
+    def from_token(self, token):
+        cached = self.tokens.get(token)
+        if cached is None:
+            cached = self.verify_token(token)
+            if cached is None:
+                return None
+            self.remember(self.tokens, token, cached)
+        account, expires = cached
+        if expires < time.time():
+            del self.tokens[token]
+            return None
+        return account
+
+    def verify_token(self, token):
+        try:
+            name, expires, signature = token.split('.')
+            name = base64.urlsafe_b64decode(name + '=' * (-len(name) % 4)).decode('utf-8')
+            expires = int(expires)
+        except (ValueError, TypeError, UnicodeError):
+            return None
+        account = self.accounts.get(name)
+        if account is None:
+            return None
+        if not hmac.compare_digest(signature, self.sign(token.rsplit('.', 1)[0], account)):
+            return None
+        return account, expires
+
+    def password_key(self, name, password):
+        # Cached by keyed hash, so the passwords themselves aren't kept
+        return hmac.new(self.secret, utf8(name) + '\0' + utf8(password), hashlib.sha256).digest()
+
+    def verify_password(self, name, password):
+        """
+        Returns a Deferred firing with the account, or None if the password
+        is wrong. It fails with AuthBusy rather than queue the check behind
+        max_pending others.
+        """
+        key = self.password_key(name, password)
+        account = self.passwords.get(key)
+        if account is not None:
+            return defer.succeed(account)
+        if self.pending >= self.max_pending:
+            return defer.fail(AuthBusy())
+        account = self.accounts.get(name)
+        password_hash = account.password_hash if account is not None else UNKNOWN_USER_HASH
+        self.pending += 1
+        d = threads.deferToThreadPool(reactor, self.pool, check_password, password, password_hash)  # @UndefinedVariable
+        d.addBoth(self.password_done)
+        d.addCallback(self.password_checked, key, account)
+        return d
+
+    def password_done(self, result):
+        self.pending -= 1
+        return result
+
+    def password_checked(self, correct, key, account):
+        if not correct or account is None:
+            return None
+        self.remember(self.passwords, key, account)
+        return account
+
+    def known_account(self, request):
+        """
+        The account for a request's token or API key, or for Basic
+        credentials that have been checked before; None if there are none
+        of those, or they are wrong.
+        """
+        token = request.getCookie(self.cookie)
+        header = request.getHeader('Authorization') or ''
+        if header[:7].lower() == 'bearer ':
+            token = header[7:].strip()
+        elif 'token' in request.args:
+            token = request.args['token'][0]
+        if token:
+            account = self.from_token(token)
+            if account is not None:
+                return account
+        key = request.args.get('key', [None])[0]
+        if key is not None and self.api_key is not None and hmac.compare_digest(key, self.api_key):
+            return self.api_account
+        if request.getUser():
+            return self.passwords.get(self.password_key(request.getUser(), request.getPassword()))
+        return None
 
-    def toggle(self, doorId):
-        for d in self.doors:
-            if d.id == doorId:
-                syslog.syslog('%s: toggled' % d.name)
-                d.toggle_relay()
-                return
+class Controller(object):
+    provider_types = {'gpio': GpioProvider, 'mcp23017': Mcp23017Provider, 'nodes': NodeProvider}
+    status_loop_restart_delay = 1
+    channel_types = {'smtp': SmtpChannel, 'pushbullet': PushbulletChannel,
+                     'pushover': PushoverChannel, 'telegram': TelegramChannel}
+
+    def __init__(self, config, config_file=None):
+        """
+        config is the compiled configuration (see load_config). If
+        config_file is given, it is watched and reloaded as it changes.
+        """
+        self.config = config
+        self.config_file = config_file
+        self.config_mtime = None
+        if config_file is not None:
+            self.config_mtime = os.stat(config_file).st_mtime
+        self.running = False
+        self.metrics = Metrics()
+        self.providers = {}
+        self.status_loops = {}
+        self.doors = DoorRegistry(Door(n, c, self.get_provider(c.provider)) for (n, c) in config.doors)
+        for name, provider_config in config.providers:
+            self.get_provider(name)
+        self.uplink = None
+        if config.upstream is not None:
+            self.uplink = UplinkFactory(self, config.upstream)
+        self.updateHandler = UpdateHandler(self)
+        self.eventHandler = EventStreamHandler(self)
+        self.auth = Auth(config)
+
+        self.notifier = Notifier(config.alerts, self.metrics)
+        self.add_channels(config.alerts)
+        if not config.alerts.alert_type:
+            syslog.syslog("No alerts configured")
+        self.alert_rules = AlertRules(self, config.alerts) if config.config.use_alerts else None
+        self.http_pool = HTTPConnectionPool(reactor, persistent=True)
+        self.integrations = self.make_integrations(config)
+
+        self.use_interrupts = config.config.state_detection == 'interrupt'
+        self.state_waiters = {}
+        self.start_time = time.time()
+        self.last_sample_time = None
+        self.reactor_monitor = ReactorMonitor()
+        self.watchdog = Watchdog(self)
+        self.history = EventHistory(config.history)
+        for door in self.doors:
+            if isinstance(door, Door):
+                self.restore_travel_times(door)
+                door.on_travel = self.travel_measured
+
+        metrics = self.metrics
+        self.status_loop_time = metrics.histogram('garage_status_loop_seconds',
+                                                  'Time taken to check every door of a provider', ('provider',))
+        self.gpio_read_time = metrics.histogram('garage_gpio_read_seconds',
+                                                'Time taken to read door sensors', ('provider',))
+        self.sample_errors = metrics.counter('garage_sample_errors_total',
+                                             'Door sensor reads that failed or timed out', ('provider',))
+        self.loop_restarts = metrics.counter('garage_status_loop_restarts_total',
+                                             'Status loops restarted after an error', ('provider',))
+        self.faults = metrics.counter('garage_faults_total',
+                                      'Errors caught in door updates, integrations and alerts', ('component',))
+        self.relay_pulses = metrics.counter('garage_relay_pulses_total',
+                                            'Relay pulses sent to each door', ('door',))
+        self.transitions = metrics.counter('garage_door_transitions_total',
+                                           'Door state changes', ('door', 'state'))
+        metrics.gauge('garage_door_travel_seconds', 'Estimated time for each door to open or close',
+                      lambda: [((d.id, direction), value) for d in self.doors if isinstance(d, Door)
+                               for direction, value in (('open', d.time_to_open), ('close', d.time_to_close))],
+                      ('door', 'direction'))
+        metrics.gauge('garage_reactor_lag_seconds', 'Most recent reactor loop lag',
+                      lambda: self.reactor_monitor.lag)
+        metrics.gauge('garage_reactor_max_lag_seconds', 'Worst reactor loop lag since startup',
+                      lambda: self.reactor_monitor.max_lag)
+        metrics.gauge('garage_last_sample_age_seconds', 'Seconds since each provider last read its doors',
+                      lambda: [((p.name,), time.time() - p.last_sample_time) for p in self.providers.values()
+                               if p.last_sample_time is not None],
+                      ('provider',))
+        metrics.gauge('garage_healthy', '1 while every status loop is running and reading its doors',
+                      lambda: 0 if list(self.problems()) else 1)
+        metrics.gauge('garage_update_waiters', 'Long-poll requests waiting on /upd',
+                      lambda: len(self.updateHandler.delayed_requests))
+        metrics.gauge('garage_event_streams', 'Open /evt event streams',
+                      lambda: len(self.eventHandler.streams))
+
+    def get_provider(self, name):
+        provider = self.providers.get(name)
+        if provider is None:
+            provider_config = dict(self.config.providers).get(name)
+            if provider_config is None:
+                provider_config = PROVIDER_CONFIG.make(type='gpio')
+            provider = self.providers[name] = self.provider_types[provider_config.type](name, provider_config, self)
+            if self.running:
+                self.start_provider(provider)
+        return provider
+
+    def add_channels(self, alerts, names=None):
+        for name in alerts.alert_type:
+            if names is not None and name not in names:
+                continue
+            syslog.syslog("we are using %s" % name)
+            if name in self.channel_types:
+                self.notifier.add_channel(self.channel_types[name](getattr(alerts, name), alerts))
+
+    def make_integrations(self, config):
+        integrations = []
+        if config.config.use_openhab:
+            integrations.append(OpenhabIntegration(config.openhab, self.http_pool))
+        if config.config.use_ifttt:
+            integrations.append(IftttIntegration(config.ifttt, self.http_pool))
+        if config.config.use_mqtt:
+            integrations.append(MqttIntegration(self, config.mqtt))
+        return integrations
+
+    def start_integrations(self):
+        for integration in self.integrations:
+            self.guarded(integration.name, integration.start)
+
+    def stop_integrations(self):
+        for integration in self.integrations:
+            self.guarded(integration.name, integration.stop)
+
+    def guarded(self, component, function, *args):
+        """
+        Calls function(*args), logging and counting anything it raises
+        instead of passing it on, so that one faulty part can't stop the
+        doors being monitored.
+        """
+        try:
+            return function(*args)
+        except Exception:
+            self.faults.inc((component,))
+            syslog.syslog("Error in %s:" % component)
+            for line in traceback.format_exc().splitlines():
+                syslog.syslog(line)
+
+    def restore_travel_times(self, door):
+        """Picks up the travel time estimates a door had when we last ran."""
+        restored = {}
+        for event in reversed(self.history.query(door=door.id)):
+            if event[2] == 'travel':
+                direction, measured, estimate = event[3]
+                restored.setdefault(direction, estimate)
+        door.time_to_open = restored.get('open', door.time_to_open)
+        door.time_to_close = restored.get('close', door.time_to_close)
+
+    def travel_measured(self, door, direction, measured, estimate):
+        syslog.syslog('%s: %s took %.1fs, now expecting %.1fs' % (door.name, direction, measured, estimate))
+        self.history.record(door.id, 'travel', (direction, round(measured, 2), round(estimate, 2)))
+
+    def status_check(self, provider):
+        """Samples and updates every door of a provider; the status loop waits for the Deferred returned."""
+        start = time.time()
+        d = self.check_doors(provider, list(provider.doors))
+        d.addCallback(lambda _: self.status_loop_time.observe(time.time() - start, (provider.name,)))
+        return d
+
+    def check_door(self, door):
+        return self.check_doors(door.provider, [door])
+
+    def check_doors(self, provider, doors):
+        """
+        Reads the doors' sensors and updates their states. Returns a
+        Deferred that fires when that is done, even if the read failed.
+        """
+        if provider.sampling_for() > self.config.config.sample_timeout:
+            # A read has hung; more would only queue up behind it
+            return defer.succeed(None)
+        d = provider.read(doors)
+        d.addTimeout(self.config.config.sample_timeout, reactor)
+        d.addCallbacks(self.sampled, self.sample_failed, (provider, doors), errbackArgs=(provider,))
+        return d
+
+    def sampled(self, duration, provider, doors):
+        self.last_sample_time = provider.last_sample_time = time.time()
+        self.gpio_read_time.observe(duration, (provider.name,))
+        if provider.sample_error is not None:
+            syslog.syslog("Reading the %s sensors again" % provider.name)
+            provider.sample_error = None
+        current = set(provider.doors)
+        for door in doors:
+            # skipping any door removed while its sensors were read
+            if door in current:
+                self.guarded('doors', self.update_door, door)
+
+    def sample_failed(self, failure, provider):
+        self.sample_errors.inc((provider.name,))
+        error = failure.getErrorMessage()
+        if failure.check(defer.TimeoutError):
+            error = "no answer after %ss" % self.config.config.sample_timeout
+        if error != provider.sample_error:
+            syslog.syslog("Can't read the %s sensors: %s" % (provider.name, error))
+            provider.sample_error = error
+
+    def update_door(self, door):
+        new_state = door.get_state()
+        now = time.time()
+        if (door.last_state != new_state):
+            syslog.syslog('%s: %s => %s' % (door.name, door.last_state, new_state))
+            self.transitions.inc((door.id, new_state))
+            self.history.record(door.id, 'state', new_state)
+            old_state, door.last_state = door.last_state, new_state
+            door.last_state_time = now
+            self.updateHandler.publish(door)
+            self.eventHandler.publish()
+            if self.uplink is not None:
+                self.guarded('upstream', self.uplink.publish, door)
+            self.notify_state_waiters(door)
+            for integration in self.integrations:
+                self.guarded(integration.name, integration.state_changed, door, old_state, new_state)
+            if self.alert_rules is not None:
+                self.guarded('alerts', self.alert_rules.state_changed, door, old_state, new_state)
+            if new_state == 'stuck' and self.config.config.use_alerts:
+                title = "%s's garage door is stuck" % door.name
+                if door.last_action is not None and door.last_action_time is not None:
+                    message = "%s's garage door started to %s but hasn't finished after %s" % (
+                        door.name, door.last_action, elapsed_time(int(now - door.last_action_time)))
+                else:
+                    # e.g. a door whose node reported it stuck; we didn't see it start
+                    message = "%s's garage door has been stuck since %s" % (
+                        door.name, time.strftime('%H:%M', time.localtime(door.last_state_time)))
+                self.guarded('alerts', self.send_msg, door, title, message)
+
+        if self.use_interrupts:
+            self.schedule_recheck(door, new_state)
+
+    def schedule_recheck(self, door, state):
+        """
+        With edge-triggered detection some transitions never produce an edge
+        (opening => open, a door becoming stuck), so arrange for the door to
+        be sampled again when the next one is due.
+        """
+        now = time.time()
+        deadline = door.motion_deadline()
+        if state in ('opening', 'closing') and deadline is not None:
+            delay = deadline - now
+        else:
+            delay = None
+
+        if door.recheck_call is not None and door.recheck_call.active():
+            door.recheck_call.cancel()
+        door.recheck_call = None
+        if delay is not None:
+            door.recheck_call = reactor.callLater(max(delay, 0) + 0.01, self.check_door, door)  # @UndefinedVariable
 
-    def get_updates(self, lastupdate):
-        updates = []
-        for d in self.doors:
-            if d.last_state_time >= lastupdate:
-                updates.append((d.id, d.last_state, d.last_state_time))
-        return updates
+    def edge_detected(self, door):
+        # Called from the RPi.GPIO event thread; hand over to the reactor.
+        reactor.callFromThread(self.debounce_edge, door)  # @UndefinedVariable
 
-    def get_config_with_default(self, config, param, default):
-        if not config:
-            return default
-        if not param in config:
-            return default
-        return config[param]
+    def debounce_edge(self, door):
+        if door.debounce_call is not None and door.debounce_call.active():
+            door.debounce_call.reset(self.config.config.debounce_time)
+        else:
+            door.debounce_call = reactor.callLater(self.config.config.debounce_time, self.check_door, door)  # @UndefinedVariable
+
+    def send_msg(self, door, title, message):
+        self.history.record(door.id, 'alert', title)
+        self.notifier.notify(door, title, message)
+
+    def toggle(self, doorId):
+        d = self.doors.get(doorId)
+        if d is not None:
+            syslog.syslog('%s: toggled' % d.name)
+            self.relay_pulses.inc((d.id,))
+            self.history.record(d.id, 'toggle', d.last_state)
+            pulse = d.toggle_relay()
+            if self.use_interrupts:
+                pulse.addCallback(self.check_toggled_door)
+            return pulse
+
+    def check_toggled_door(self, door):
+        return self.check_door(door).addCallback(lambda _: door)
+
+    def command_door(self, door, command):
+        """
+        Carries out an API command ('toggle', 'open' or 'close'). Returns the
+        relay pulse Deferred, or None if the command doesn't call for a pulse.
+        """
+        if self.command_pulses(door, command):
+            return self.toggle(door.id)
+        return None
+
+    def watch_pulse(self, pulse, door):
+        """
+        Logs it if a relay pulse that nobody waits for fails. Returns False
+        if it has failed already, as it does when the relay can't be pressed.
+        """
+        if pulse is None:
+            return True
+        failures = []
+        def failed(failure):
+            syslog.syslog("%s: relay pulse failed: %s" % (door.name, failure.getErrorMessage()))
+            failures.append(failure)
+        pulse.addErrback(failed)
+        return not failures
+
+    def command_pulses(self, door, command):
+        """
+        Whether command_door would pulse the relay: 'open' and 'close' only
+        do so from the opposite resting state, so they do nothing to a door
+        that is already there or still moving.
+        """
+        return command == "toggle" or (command == "open" and door.last_state == "closed") \
+            or (command == "close" and door.last_state == "open")
+
+    def wait_for_state(self, door, states, timeout):
+        """
+        Returns a Deferred that fires with the door's state once it is one of
+        states, or with None after timeout seconds.
+        """
+        if door.last_state in states:
+            return defer.succeed(door.last_state)
+        d = defer.Deferred()
+        waiter = (states, d)
+        self.state_waiters.setdefault(door.id, []).append(waiter)
+        def expire():
+            self.state_waiters[door.id].remove(waiter)
+            d.callback(None)
+        timer = reactor.callLater(timeout, expire)  # @UndefinedVariable
+        def reached(state):
+            if timer.active():
+                timer.cancel()
+            return state
+        return d.addCallback(reached)
+
+    def notify_state_waiters(self, door):
+        waiters = self.state_waiters.get(door.id)
+        if waiters:
+            ready = [w for w in waiters if door.last_state in w[0]]
+            for waiter in ready:
+                waiters.remove(waiter)
+                waiter[1].callback(door.last_state)
 
     def run(self):
-        task.LoopingCall(self.status_check).start(0.5)
-        root = File('www')
-        root.putChild('st', StatusHandler(self))
-        root.putChild('upd', self.updateHandler)
-        root.putChild('cfg', ConfigHandler(self))
-        root.putChild('upt', UptimeHandler(self))
-
-        if self.config['config']['use_auth']:
-            clk = ClickHandler(self)
-            args={self.config['site']['username']:self.config['site']['password']}
-            checker = checkers.InMemoryUsernamePasswordDatabaseDontUse(**args)
-            realm = HttpPasswordRealm(clk)
-            p = portal.Portal(realm, [checker])
-            credentialFactory = BasicCredentialFactory("Garage Door Controller")
-            protected_resource = HTTPAuthSessionWrapper(p, [credentialFactory])
-            root.putChild('clk', protected_resource)
-            cla = CloseHandler(self)
-            cla_args={self.config['site']['username']:self.config['site']['password']}
-            cla_checker = checkers.InMemoryUsernamePasswordDatabaseDontUse(**cla_args)
-            cla_realm = HttpPasswordRealm(cla)
-            cla_p = portal.Portal(cla_realm, [cla_checker])
-            credentialFactory = BasicCredentialFactory("Garage Door Controller")
-            cla_protected_resource = HTTPAuthSessionWrapper(cla_p, [credentialFactory])
-            root.putChild('cla', cla_protected_resource)
+        self.start()
+        reactor.run()  # @UndefinedVariable
+
+    def start(self):
+        """Starts monitoring the doors and serving the web app, without running the reactor."""
+        self.running = True
+        self.notifier.start()
+        self.reactor_monitor.start()
+        self.history.start()
+        for provider in self.providers.values():
+            self.start_provider(provider)
+        self.start_integrations()
+        reactor.addSystemEventTrigger('before', 'shutdown', self.stop_integrations)  # @UndefinedVariable
+        reactor.addSystemEventTrigger('during', 'shutdown', self.http_pool.closeCachedConnections)  # @UndefinedVariable
+        if self.config_file is not None:
+            signal.signal(signal.SIGHUP, lambda signum, frame: reactor.callFromThread(self.reload_config))  # @UndefinedVariable
+            if self.config.config.reload_interval:
+                task.LoopingCall(self.check_config_file).start(self.config.config.reload_interval, now=False)
+        if self.uplink is not None:
+            upstream = self.config.upstream
+            reactor.connectTCP(upstream.host, upstream.port, self.uplink)  # @UndefinedVariable
+        site_config = self.config.site
+        root = StaticAssets('www', site_config.asset_cache_max_size)
+        self.auth.start()
+        protect = lambda resource, api=False: Protected(self.auth, resource, api)
+        root.putChild('st', protect(StatusHandler(self)))
+        root.putChild('upd', protect(self.updateHandler))
+        root.putChild('evt', protect(self.eventHandler))
+        self.eventHandler.start()
+        root.putChild('cfg', protect(ConfigHandler(self)))
+        root.putChild('upt', protect(UptimeHandler(self)))
+        root.putChild('health', HealthHandler(self))
+        root.putChild('metrics', protect(MetricsHandler(self)))
+        root.putChild('history', protect(HistoryHandler(self)))
+        root.putChild('clk', protect(ClickHandler(self)))
+        root.putChild('cla', protect(CloseHandler(self)))
+        root.putChild('login', LoginHandler(self.auth))
+        root.putChild('logout', LogoutHandler())
+
+        if self.config.config.allow_api:
+            root.putChild('api', protect(APIHandler(self), api=True))
+            root.putChild('bat', protect(BatchHandler(self), api=True))
+
+        site = InstrumentedSite(root, self.metrics)
+
+        if not self.config.config.use_https:
+            reactor.listenTCP(site_config.port, site)  # @UndefinedVariable
+        else:
+            sslContext = ssl.DefaultOpenSSLContextFactory(site_config.ssl_key, site_config.ssl_cert)
+            reactor.listenSSL(site_config.port_secure, site, sslContext)  # @UndefinedVariable
+
+        self.watchdog.start()
+        sd_notify('READY=1')
+        reactor.addSystemEventTrigger('before', 'shutdown', sd_notify, 'STOPPING=1')  # @UndefinedVariable
+
+    def start_provider(self, provider):
+        provider.start()
+        if self.use_interrupts and provider.supports_edges:
+            for door in provider.doors:
+                provider.watch(door, self.edge_detected)
+        self.start_status_loop(provider)
+
+    def status_interval(self, provider):
+        if self.use_interrupts and provider.supports_edges:
+            # Slow poll to catch any edges that were missed
+            return self.config.config.fallback_poll_interval
+        return self.config.config.poll_interval
+
+    def start_status_loop(self, provider):
+        loop = self.status_loops.get(provider.name)
+        if loop is not None and loop.running:
+            loop.stop()
+        loop = self.status_loops[provider.name] = task.LoopingCall(self.status_check, provider)
+        loop.start(self.status_interval(provider)).addErrback(self.status_loop_failed, provider, loop)
+
+    def status_loop_failed(self, failure, provider, loop):
+        # Failed reads are dealt with in check_doors, so this is a bug; keep the doors monitored regardless
+        self.loop_restarts.inc((provider.name,))
+        syslog.syslog("The %s status loop failed; restarting it:" % provider.name)
+        for line in failure.getTraceback().splitlines():
+            syslog.syslog(line)
+        reactor.callLater(self.status_loop_restart_delay, self.restart_status_loop, provider, loop)  # @UndefinedVariable
+
+    def restart_status_loop(self, provider, loop):
+        # unless it has been replaced in the meantime
+        if self.status_loops.get(provider.name) is loop and not loop.running:
+            self.start_status_loop(provider)
+
+    def problems(self):
+        """Whatever is keeping the doors from being monitored, for the watchdog and /health."""
+        timeout = self.config.config.sample_timeout
+        now = time.time()
+        for name, provider in sorted(self.providers.items()):
+            loop = self.status_loops.get(name)
+            if loop is None or not loop.running:
+                yield "the %s status loop has stopped" % name
+            elif provider.sampling_for() > timeout:
+                yield "reading the %s sensors has hung" % name
+            else:
+                last = provider.last_sample_time or loop.starttime
+                if now - last > 2 * self.status_interval(provider) + timeout:
+                    yield "the %s sensors have not been read since %s" % (
+                        name, time.strftime('%H:%M:%S', time.localtime(last)))
+
+    def check_config_file(self):
+        try:
+            mtime = os.stat(self.config_file).st_mtime
+        except OSError:
+            return
+        if mtime != self.config_mtime:
+            self.config_mtime = mtime
+            self.reload_config()
+
+    def reload_config(self):
+        """
+        Re-reads the config file and applies whatever changed, leaving
+        untouched doors, channels and clients alone. A config with errors
+        is logged and ignored.
+        """
+        try:
+            config = load_config(self.config_file)
+        except ConfigError as e:
+            syslog.syslog("Not reloading: %s" % e)
+            return
+        old, self.config = self.config, config
+        if config == old:
+            return
+        syslog.syslog("Reloading the configuration")
+        self.auth.configure(config)
+        self.apply_door_changes(dict(old.doors), dict(config.doors))
+        if config.alerts != old.alerts or config.config.use_alerts != old.config.use_alerts:
+            self.apply_alert_changes(old.alerts)
+        if self.integration_settings(config) != self.integration_settings(old):
+            self.stop_integrations()
+            self.integrations = self.make_integrations(config)
+            self.start_integrations()
+        if (config.config.poll_interval, config.config.fallback_poll_interval) != \
+                (old.config.poll_interval, old.config.fallback_poll_interval):
+            for provider in self.providers.values():
+                self.start_status_loop(provider)
+        for setting in self.restart_needed(old, config):
+            syslog.syslog("%s changed; restart the controller to apply it" % setting)
+
+    def integration_settings(self, config):
+        settings = config.config
+        return (settings.use_openhab, settings.use_ifttt, settings.use_mqtt,
+                config.openhab, config.ifttt, config.mqtt)
+
+    def rewired(self, old, new):
+        return (old.provider, old.relay_pin, old.state_pin, old.open_state_pin, old.simulation) != \
+               (new.provider, new.relay_pin, new.state_pin, new.open_state_pin, new.simulation)
+
+    def apply_door_changes(self, old, new):
+        for doorId, door_config in old.items():
+            if doorId not in new or self.rewired(door_config, new[doorId]):
+                self.remove_door(self.doors.get(doorId))
+        # In the order of the config, so a new or rewired door goes where it
+        # would have been had the controller started with this config
+        for index, (doorId, door_config) in enumerate(sorted(new.items())):
+            door = self.doors.get(doorId)
+            if door is None:
+                self.add_door(doorId, door_config, index)
+            elif door_config != old[doorId]:
+                door.configure(door_config)
+
+    def add_door(self, doorId, config, index=None):
+        syslog.syslog("Adding door %s" % doorId)
+        provider = self.get_provider(config.provider)
+        door = Door(doorId, config, provider)
+        self.doors.add(door, index)
+        self.restore_travel_times(door)
+        door.on_travel = self.travel_measured
+        if self.running:
+            if self.use_interrupts and provider.supports_edges:
+                provider.watch(door, self.edge_detected)
+            self.check_door(door)
+
+    def remove_door(self, door):
+        syslog.syslog("Removing door %s" % door.id)
+        for call in (door.debounce_call, door.recheck_call):
+            if call is not None and call.active():
+                call.cancel()
+        door.provider.remove_door(door)
+        self.doors.remove(door)
+        for integration in self.integrations:
+            self.guarded(integration.name, integration.door_removed, door)
+        if self.alert_rules is not None:
+            self.alert_rules.forget(door)
+
+    def apply_alert_changes(self, old):
+        alerts = self.config.alerts
+        inherited = ('timeout', 'rate_limit', 'rate_burst')
+        changed = set(name for name in self.channel_types
+                      if getattr(alerts, name) != getattr(old, name) or
+                      [getattr(alerts, i) for i in inherited] != [getattr(old, i) for i in inherited])
+        for channel in list(self.notifier.channels):
+            if channel.name not in alerts.alert_type or channel.name in changed:
+                self.notifier.remove_channel(channel)
+        self.notifier.configure(alerts)
+        running = set(channel.name for channel in self.notifier.channels)
+        self.add_channels(alerts, set(alerts.alert_type) - running)
+
+        if self.alert_rules is not None:
+            self.alert_rules.stop()
+            self.alert_rules = None
+        if self.config.config.use_alerts:
+            self.alert_rules = AlertRules(self, alerts)
+            # Doors that are already open start their timers over
+            for door in self.doors:
+                if door.last_state not in ('closed', 'unknown'):
+                    self.alert_rules.state_changed(door, 'unknown', door.last_state)
+
+    def restart_needed(self, old, new):
+        """The settings that changed but are only read at startup."""
+        for section in ('providers', 'upstream', 'history'):
+            if getattr(old, section) != getattr(new, section):
+                yield section
+        # The web login is read again on reload
+        if old.site._replace(username=None, password=None) != new.site._replace(username=None, password=None):
+            yield 'site'
+        for setting in ('use_https', 'allow_api', 'gpio_backend', 'state_detection',
+                        'update_history', 'event_heartbeat', 'reload_interval'):
+            if getattr(old.config, setting) != getattr(new.config, setting):
+                yield 'config.' + setting
+
+class StaticAsset(Resource):
+    """
+    One file from www/, held in memory along with its gzip (and, when the
+    brotli module is installed, brotli) compressed forms.
+    """
+    isLeaf = True
+
+    def __init__(self, data, content_type):
+        Resource.__init__(self)
+        self.content_type = content_type
+        self.set_data(data)
+
+    def set_data(self, data):
+        self.hash = hashlib.sha1(data).hexdigest()
+        self.version = self.hash[:12]
+        self.encodings = [('identity', data)]
+        if brotli is not None:
+            self.add_encoding('br', data, brotli.compress(data))
+        buf = io.BytesIO()
+        f = gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=9, mtime=0)
+        f.write(data)
+        f.close()
+        self.add_encoding('gzip', data, buf.getvalue())
+
+    def add_encoding(self, encoding, data, compressed):
+        # Images and the like don't get any smaller
+        if len(compressed) < len(data) * 0.9:
+            self.encodings.insert(0, (encoding, compressed))
+
+    def choose_encoding(self, request):
+        accept = request.getHeader('Accept-Encoding') or ''
+        accepted = set(part.split(';')[0].strip() for part in accept.split(','))
+        for encoding, data in self.encodings:
+            if encoding in accepted or encoding == 'identity':
+                return encoding, data
+
+    def render(self, request):
+        encoding, data = self.choose_encoding(request)
+        etag = '"%s-%s"' % (self.hash, encoding)
+        request.setHeader('Content-Type', self.content_type)
+        request.setHeader('ETag', etag)
+        request.setHeader('Vary', 'Accept-Encoding')
+        if request.args.get('v', [None])[0] == self.version:
+            # Fingerprinted URLs change whenever the file does
+            request.setHeader('Cache-Control', 'public, max-age=31536000, immutable')
+        else:
+            request.setHeader('Cache-Control', 'no-cache')
+
+        if_none_match = request.getHeader('If-None-Match')
+        if if_none_match is not None and (etag in if_none_match or if_none_match.strip() == '*'):
+            request.setResponseCode(304)
+            return ''
+        if encoding != 'identity':
+            request.setHeader('Content-Encoding', encoding)
+        return data
+
+class StaticAssets(Resource):
+    """
+    Serves the web app. Files up to max_size are loaded and compressed once
+    at startup and answered from memory with strong ETags; larger files are
+    left to twisted's File. HTML pages have their links to other assets
+    rewritten to carry a content hash (?v=...), so browsers can cache those
+    assets indefinitely and only revalidate the pages themselves.
+    """
+    link_re = re.compile(r'((?:src|href)=")([^"?#:]+)(")')
+
+    def __init__(self, path, max_size):
+        Resource.__init__(self)
+        self.path = path
+        self.fallback = File(path)
+        self.assets = {}
+        for directory, _, files in os.walk(path):
+            for name in files:
+                filename = os.path.join(directory, name)
+                if os.path.getsize(filename) > max_size:
+                    continue
+                with open(filename, 'rb') as f:
+                    data = f.read()
+                content_type = File.contentTypes.get(os.path.splitext(name)[1].lower(),
+                                                     mimetypes.guess_type(name)[0] or 'application/octet-stream')
+                url = os.path.relpath(filename, path).replace(os.sep, '/')
+                self.assets[url] = StaticAsset(data, content_type)
+
+        for url, asset in self.assets.items():
+            if asset.content_type == 'text/html':
+                asset.set_data(self.fingerprint_links(url, asset.encodings[-1][1]))
+
+    def fingerprint_links(self, url, html):
+        base = os.path.dirname(url)
+        def replace(match):
+            link = match.group(2)
+            if link.startswith('/'):
+                target = link.lstrip('/')
+            else:
+                target = os.path.normpath(os.path.join(base, link)).replace(os.sep, '/')
+            asset = self.assets.get(target)
+            if asset is None:
+                return match.group(0)
+            return '%s%s?v=%s%s' % (match.group(1), link, asset.version, match.group(3))
+        return self.link_re.sub(replace, html)
+
+    def getChild(self, name, request):
+        url = '/'.join([name] + request.postpath)
+        if url == '' or url.endswith('/'):
+            url += 'index.html'
+        asset = self.assets.get(url)
+        if asset is None:
+            return self.fallback.getChildWithDefault(name, request)
+        request.prepath.extend(request.postpath)
+        request.postpath = []
+        return asset
+
+class Protected(Resource):
+    """
+    Lets a request through to resource once Auth knows who it comes from,
+    leaving the account in request.account for the resource to check door
+    permissions against. With use_auth off everyone is let through as
+    ANONYMOUS, except to API resources, which always need a key, token or
+    password.
+    """
+    isLeaf = True
+
+    def __init__(self, auth, resource, api=False):
+        Resource.__init__(self)
+        self.auth = auth
+        self.resource = resource
+        self.api = api
+
+    def render(self, request):
+        if not self.auth.enabled and not self.api:
+            return self.serve(request, ANONYMOUS)
+        account = self.auth.known_account(request)
+        if account is not None:
+            return self.serve(request, account)
+        if not request.getUser():
+            return self.refuse(request)
+        finished = request.notifyFinish()
+        finished.addErrback(lambda _: None)
+        d = self.auth.verify_password(request.getUser(), request.getPassword())
+        d.addCallback(self.verified, request, finished)
+        d.addErrback(self.failed, request, finished)
+        return server.NOT_DONE_YET
+
+    def verified(self, account, request, finished):
+        if finished.called:
+            return
+        body = self.serve(request, account) if account is not None else self.refuse(request)
+        if body is not server.NOT_DONE_YET:
+            request.write(body)
+            request.finish()
+
+    def failed(self, failure, request, finished):
+        if finished.called:
+            return
+        if failure.check(AuthBusy):
+            request.setResponseCode(503)
+            request.setHeader('Retry-After', '1')
+            request.write('Error: Too many logins at once, try again')
         else:
-            root.putChild('clk', ClickHandler(self))
-            root.putChild('cla', CloseHandler(self))
+            syslog.syslog("Error serving %s: %s" % (request.path, failure.getErrorMessage()))
+            request.setResponseCode(500)
+            request.write('Error: %s' % failure.getErrorMessage())
+        request.finish()
+
+    def serve(self, request, account):
+        request.account = account
+        return self.resource.render(request)
+
+    def refuse(self, request):
+        request.setResponseCode(401)
+        # Not Basic, so that browsers leave asking to the web app's own login form
+        request.setHeader('WWW-Authenticate', 'Bearer realm="%s"' % self.auth.realm)
+        return 'Error: Not authorized'
+
+class LoginHandler(Resource):
+    """
+    Checks a username and password given as POST arguments and answers with
+    a token. A browser session (the default) also gets the token as a
+    cookie; with type=api the token lasts api_token_lifetime instead, for
+    scripts to send as "Authorization: Bearer <token>".
+    """
+    isLeaf = True
+
+    def __init__(self, auth):
+        Resource.__init__(self)
+        self.auth = auth
 
-        if self.config['config']['allow_api']:
-            root.putChild('api', APIHandler(self))
+    def render_POST(self, request):
+        request.setHeader('Content-Type', 'application/json')
+        request.setHeader('Cache-Control', 'no-store')
+        args = request.args
+        name = args.get('username', [''])[0]
+        password = args.get('password', [''])[0]
+        api = args.get('type', ['session'])[0] == 'api'
+        finished = request.notifyFinish()
+        finished.addErrback(lambda _: None)
+        d = self.auth.verify_password(name, password)
+        d.addCallback(self.verified, request, finished, api)
+        d.addErrback(self.failed, request, finished)
+        return server.NOT_DONE_YET
 
-        site = server.Site(root)
+    def failed(self, failure, request, finished):
+        if finished.called:
+            return
+        if failure.check(AuthBusy):
+            request.setResponseCode(503)
+            request.setHeader('Retry-After', '1')
+            request.write(json.dumps({'error': 'Too many logins at once, try again'}))
+        else:
+            syslog.syslog("Error logging in: %s" % failure.getErrorMessage())
+            request.setResponseCode(500)
+            request.write(json.dumps({'error': failure.getErrorMessage()}))
+        request.finish()
 
-        if not self.get_config_with_default(self.config['config'], 'use_https', False):
-            reactor.listenTCP(self.config['site']['port'], site)  # @UndefinedVariable
-            reactor.run()  # @UndefinedVariable
+    def verified(self, account, request, finished, api):
+        if finished.called:
+            return
+        if account is None:
+            request.setResponseCode(401)
+            request.write(json.dumps({'error': 'Wrong username or password'}))
         else:
-            sslContext = ssl.DefaultOpenSSLContextFactory(self.config['site']['ssl_key'], self.config['site']['ssl_cert'])
-            reactor.listenSSL(self.config['site']['port_secure'], site, sslContext)  # @UndefinedVariable
-            reactor.run()  # @UndefinedVariable
+            lifetime = self.auth.api_token_lifetime if api else self.auth.session_lifetime
+            token, expires = self.auth.issue(account, lifetime)
+            if not api:
+                request.addCookie(Auth.cookie, token, path='/', max_age=str(int(lifetime)),
+                                  secure=self.auth.secure, httpOnly=True, sameSite='strict')
+            request.write(json.dumps({'token': token, 'expires': expires, 'user': account.name,
+                                      'doors': sorted(account.doors) if account.doors is not None else None,
+                                      'read_only': account.read_only}))
+        request.finish()
+
+class LogoutHandler(Resource):
+    isLeaf = True
+
+    def render_POST(self, request):
+        request.addCookie(Auth.cookie, '', path='/', max_age='0', httpOnly=True, sameSite='strict')
+        return 'OK'
 
 class ClickHandler(Resource):
     isLeaf = True
@@ -353,7 +3109,13 @@ class ClickHandler(Resource):
 
     def render(self, request):
         door = request.args['id'][0]
-        self.controller.toggle(door)
+        if not request.account.can_control(door):
+            request.setResponseCode(403)
+            return 'Error: Not allowed'
+        pulse = self.controller.toggle(door)
+        if not self.controller.watch_pulse(pulse, self.controller.doors.get(door)):
+            request.setResponseCode(500)
+            return 'Error: The relay could not be pressed'
         return 'OK'
 
 class CloseHandler(Resource):
@@ -362,12 +3124,14 @@ class CloseHandler(Resource):
     def __init__ (self, controller):
         Resource.__init__(self)
         self.controller = controller
-        self.doors = [Door(n, c) for (n, c) in sorted(controller.config['doors'].items())]
 
     def render(self, request):
-        for d in self.doors:
-            if d.get_state() == "open":
-                self.controller.toggle(d.id)
+        if request.account.read_only:
+            request.setResponseCode(403)
+            return 'Error: Not allowed'
+        for d in self.controller.doors:
+            if d.last_state == "open" and request.account.can_control(d.id):
+                self.controller.watch_pulse(self.controller.toggle(d.id), d)
         return 'OK'
 
 class APIHandler(Resource):
@@ -376,33 +3140,158 @@ class APIHandler(Resource):
     def __init__ (self, controller):
         Resource.__init__(self)
         self.controller = controller
-        self.doors = [Door(n, c) for (n, c) in sorted(controller.config['doors'].items())]
 
     def render(self, request):
-        key = request.args['key'][0]
         command = request.args['command'][0]
         doorId = request.args['id'][0]
-        if key == self.controller.config['config']['api_key']:
-            for d in self.doors:
-                if d.id == doorId or d.id == "all_doors":
-                    state = d.get_state()
-                    if command == "toggle":
-                        self.controller.toggle(doorId)
-                        return 'OK'
-                    elif command == "open":
-                        if state == "closed":
-                            self.controller.toggle(doorId)
-                        return 'OK'
-                    elif command == "close":
-                        if state == "open":
-                            self.controller.toggle(doorId)
-                        return 'OK'
-                    else:
-                        request.setResponseCode(400)
-                        return 'Error: Command not implemented'
+        account = request.account
+        if command not in ("toggle", "open", "close"):
+            request.setResponseCode(400)
+            return 'Error: Command not implemented'
+        if doorId == "all_doors":
+            doors = [d for d in self.controller.doors if account.can_control(d.id)]
+        elif doorId in self.controller.doors:
+            if not account.can_control(doorId):
+                request.setResponseCode(403)
+                return 'Error: Not allowed'
+            doors = [self.controller.doors.get(doorId)]
         else:
-            request.setResponseCode(403)
-            return 'Error: API error'
+            request.setResponseCode(404)
+            return 'Error: Unknown door'
+        failed = [d.id for d in doors
+                  if not self.controller.watch_pulse(self.controller.command_door(d, command), d)]
+        if failed:
+            request.setResponseCode(500)
+            return 'Error: The relay could not be pressed for %s' % utf8(', '.join(failed))
+        return 'OK'
+
+class BatchHandler(Resource):
+    """
+    Runs several API commands in one request. The body is a JSON list of
+    {"door": id, "command": "open"|"close"|"toggle"} operations, or an
+    object holding that list as "operations" along with any of:
+    - "stagger": seconds between consecutive relay pulses (default 0), to
+      avoid starting every opener motor at once.
+    - "wait": if true, respond once every door has reached its target
+      state, or after "timeout" seconds (default 60). Doors that won't
+      get there from this command (see will_reach) are answered at once.
+    The response lists the outcome for each door.
+    """
+    isLeaf = True
+    commands = ("toggle", "open", "close")
+
+    def __init__ (self, controller):
+        Resource.__init__(self)
+        self.controller = controller
+
+    def render_POST(self, request):
+        request.setHeader('Content-Type', 'application/json')
+        try:
+            body = json.loads(request.content.read())
+        except ValueError:
+            request.setResponseCode(400)
+            return json.dumps({'error': 'Request body is not JSON'})
+        if isinstance(body, list):
+            body = {'operations': body}
+        if not isinstance(body, dict):
+            request.setResponseCode(400)
+            return json.dumps({'error': 'Request body must be a list of operations or an object'})
+        operations = body.get('operations')
+        errors = self.validate(operations, request.account)
+        try:
+            stagger = float(body.get('stagger', 0))
+            timeout = float(body.get('timeout', 60))
+        except (TypeError, ValueError):
+            errors.append('stagger and timeout must be numbers')
+        else:
+            if stagger < 0 or timeout < 0:
+                errors.append('stagger and timeout must not be negative')
+        if errors:
+            request.setResponseCode(400)
+            return json.dumps({'error': errors})
+
+        wait = bool(body.get('wait', False))
+        results = []
+        delay = 0
+        for op in operations:
+            door = self.controller.doors.get(op['door'])
+            target = self.target_states(door, op['command'])
+            if not self.controller.command_pulses(door, op['command']):
+                d = defer.succeed(None)
+                action = 'none'
+            else:
+                d = task.deferLater(reactor, delay, self.controller.command_door, door, op['command'])
+                delay += stagger
+                action = 'pulse'
+            waiting = wait and self.will_reach(door, target, action)
+            if waiting:
+                d.addCallback(lambda _, door=door, target=target: self.controller.wait_for_state(door, target, timeout))
+            d.addCallback(self.result, door, op['command'], action, waiting)
+            d.addErrback(self.failed, door, op['command'])
+            results.append(d)
+
+        finished = request.notifyFinish()
+        finished.addErrback(lambda _: None)
+        defer.gatherResults(results).addCallback(self.respond, request, finished)
+        return server.NOT_DONE_YET
+
+    def validate(self, operations, account):
+        if not isinstance(operations, list) or not operations:
+            return ['Expected a list of operations']
+        errors = []
+        seen = set()
+        for op in operations:
+            if not isinstance(op, dict) or 'door' not in op or 'command' not in op:
+                errors.append('Each operation needs a door and a command')
+            elif not isinstance(op['door'], basestring):
+                errors.append('Door ids must be strings: %s' % json.dumps(op['door']))
+            elif op['door'] not in self.controller.doors:
+                errors.append('Unknown door: %s' % op['door'])
+            elif op['command'] not in self.commands:
+                errors.append('Unknown command for %s: %s' % (op['door'], op['command']))
+            elif not account.can_control(op['door']):
+                errors.append('Not allowed: %s' % op['door'])
+            elif op['door'] in seen:
+                errors.append('%s appears more than once' % op['door'])
+            else:
+                seen.add(op['door'])
+        return errors
+
+    def target_states(self, door, command):
+        if command == 'open' or (command == 'toggle' and door.last_state == 'closed'):
+            return ('open',)
+        return ('closed',)
+
+    def will_reach(self, door, target, action):
+        """
+        Whether it is worth waiting for door to reach target. A pulse only
+        gets there from a door at rest: one that is moving just stops. A
+        command that didn't pulse only gets there if the door is already
+        there or on its way.
+        """
+        if action == 'pulse':
+            return door.last_state in ('open', 'closed')
+        heading = {'open': 'opening', 'closed': 'closing'}[target[0]]
+        return door.last_state in target or door.last_state == heading
+
+    def result(self, reached, door, command, action, wait):
+        if not wait:
+            outcome = 'sent' if action == 'pulse' else 'ok'
+        else:
+            outcome = 'ok' if reached is not None else 'timeout'
+        return {'door': door.id, 'command': command, 'action': action,
+                'result': outcome, 'state': door.last_state}
+
+    def failed(self, failure, door, command):
+        syslog.syslog("Error running %s on %s: %s" % (command, door.name, failure.getErrorMessage()))
+        return {'door': door.id, 'command': command, 'result': 'error',
+                'error': failure.getErrorMessage(), 'state': door.last_state}
+
+    def respond(self, results, request, finished):
+        # finished has already fired if the client went away
+        if not finished.called:
+            request.write(json.dumps({'results': results}))
+            request.finish()
 
 class StatusHandler(Resource):
     isLeaf = True
@@ -412,10 +3301,9 @@ class StatusHandler(Resource):
         self.controller = controller
 
     def render(self, request):
-        door = request.args['id'][0]
-        for d in self.controller.doors:
-            if (d.id == door):
-                return d.last_state
+        d = self.controller.doors.get(request.args['id'][0])
+        if d is not None and request.account.can_see(d.id):
+            return d.last_state
         return ''
 
 class ConfigHandler(Resource):
@@ -427,47 +3315,227 @@ class ConfigHandler(Resource):
     def render(self, request):
         request.setHeader('Content-Type', 'application/json')
 
-        return json.dumps([(d.id, d.name, d.last_state, d.last_state_time)
-                            for d in self.controller.doors])
+        return json.dumps(request.account.visible([(d.id, d.name, d.last_state, d.last_state_time)
+                                                   for d in self.controller.doors]))
 
 
 class UptimeHandler(Resource):
     isLeaf = True
-    def __init__ (self, controller):
+    def __init__ (self, controller, ttl=30):
         Resource.__init__(self)
+        self.controller = controller
+        self.ttl = ttl
+        self.response = None
+        self.response_time = 0
 
     def render(self,request):
         request.setHeader('Content-Type', 'application/json')
-        uptime = subprocess.check_output(['uptime', '-p']).strip()
-        uptime = uptime.replace("up ", "")
-        uptime = uptime.split(",")[0].replace(",","").strip()
-        if (uptime == "up"):
-            uptime = "0 mins"
-        return json.dumps("Uptime: " + uptime)
+        now = time.time()
+        if self.response is None or now - self.response_time >= self.ttl:
+            uptime = system_uptime(self.controller.start_time)
+            self.response = json.dumps("Uptime: " + pretty_uptime(uptime))
+            self.response_time = now
+        return self.response
+
+class HealthHandler(Resource):
+    isLeaf = True
+    def __init__ (self, controller):
+        Resource.__init__(self)
+        self.controller = controller
+
+    def render(self, request):
+        request.setHeader('Content-Type', 'application/json')
+        request.setHeader('Cache-Control', 'no-cache')
+        controller = self.controller
+        monitor = controller.reactor_monitor
+        now = time.time()
+        last_sample = controller.last_sample_time
+        problems = list(controller.problems())
+        if problems:
+            request.setResponseCode(503)
+        providers = {}
+        for name, provider in controller.providers.items():
+            loop = controller.status_loops.get(name)
+            providers[name] = {
+                'running': loop is not None and loop.running,
+                'last_sample_age': None if provider.last_sample_time is None else now - provider.last_sample_time,
+                'sampling_for': provider.sampling_for(),
+                'sample_error': provider.sample_error,
+                'loop_restarts': controller.loop_restarts.values.get((name,), 0),
+            }
+        return json.dumps({
+            'status': 'unhealthy' if problems else 'ok',
+            'problems': problems,
+            'uptime': system_uptime(controller.start_time),
+            'daemon_uptime': now - controller.start_time,
+            'reactor_lag': monitor.lag,
+            'max_reactor_lag': monitor.max_lag,
+            'last_sample_time': last_sample,
+            'last_sample_age': None if last_sample is None else now - last_sample,
+            'providers': providers,
+            'faults': dict((labels[0], count) for labels, count in controller.faults.values.items()),
+        })
+
+class HistoryHandler(Resource):
+    isLeaf = True
+    def __init__ (self, controller):
+        Resource.__init__(self)
+        self.controller = controller
+
+    def render(self, request):
+        request.setHeader('Content-Type', 'application/json')
+        args = request.args
+        try:
+            start = float(args['start'][0]) if 'start' in args else None
+            end = float(args['end'][0]) if 'end' in args else None
+            limit = int(args['limit'][0]) if 'limit' in args else 100
+        except ValueError:
+            request.setResponseCode(400)
+            return json.dumps('Error: start, end and limit must be numbers')
+        door = args['door'][0] if 'door' in args else None
+        account = request.account
+        if door is not None and not account.can_see(door):
+            request.setResponseCode(403)
+            return json.dumps('Error: Not allowed')
+        events = self.controller.history.query(start, end, door, limit)
+        return json.dumps([event for event in events if account.can_see(event[1])])
+
+class MetricsHandler(Resource):
+    isLeaf = True
+    def __init__ (self, controller):
+        Resource.__init__(self)
+        self.controller = controller
+
+    def render(self, request):
+        # Metrics cover every door
+        if request.account.doors is not None:
+            request.setResponseCode(403)
+            return 'Error: Not allowed'
+        request.setHeader('Content-Type', 'text/plain; version=0.0.4')
+        return self.controller.metrics.render()
+
+class InstrumentedSite(server.Site):
+    """
+    A Site that records how long requests take, labelled by the resource
+    that served them. Static files are counted together. Long polls and
+    event streams are held open until there is news, so how long they take
+    says nothing about latency; the handlers set request.held when they
+    park a request, and those go in a histogram of their own.
+    """
+    resources = ('st', 'upd', 'evt', 'cfg', 'clk', 'cla', 'api', 'bat', 'upt', 'health', 'metrics',
+                 'history', 'login', 'logout')
+
+    def __init__(self, resource, metrics, *args, **kwargs):
+        server.Site.__init__(self, resource, *args, **kwargs)
+        self.request_time = metrics.histogram('garage_http_request_seconds',
+                                              'Time taken to answer HTTP requests', ('resource',))
+        self.held_time = metrics.histogram('garage_http_held_seconds',
+                                           'Time long polls and event streams were held open', ('resource',),
+                                           buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600))
+
+    def getResourceFor(self, request):
+        start = time.time()
+        resource = server.Site.getResourceFor(self, request)
+        name = request.prepath[0] if request.prepath else ''
+        if name not in self.resources:
+            name = 'static'
+        request.notifyFinish().addBoth(self.request_finished, request, name, start)
+        return resource
+
+    def request_finished(self, result, request, name, start):
+        histogram = self.held_time if getattr(request, 'held', False) else self.request_time
+        histogram.observe(time.time() - start, (name,))
 
 class UpdateHandler(Resource):
+    """
+    Long-poll endpoint for door state changes.
+
+    Every change is given a sequence number and kept in a bounded buffer of
+    recent events. A client passes the last sequence number it has seen as
+    'since' and gets back every later event, waiting for the next one if it
+    is already up to date. Clients that only send the older 'lastupdate'
+    timestamp are still supported.
+
+    With 'full', the reply also carries every door's name and the uptime
+    and is sent at once, so a client can draw its first page from one
+    request and then follow the sequence numbers.
+
+    Sequence numbers start from the time the controller started, in
+    milliseconds, so a client that was following an earlier run is either
+    behind the buffer or ahead of it, and gets the current state either way.
+
+    Clients only hear about the doors their account may see.
+    """
     isLeaf = True
     def __init__(self, controller):
         Resource.__init__(self)
-        self.delayed_requests = []
         self.controller = controller
+        self.seq = int(time.time() * 1000)
+        self.events = collections.deque(maxlen=controller.config.config.update_history)
+        self.delayed_requests = {}
+
+    def publish(self, door):
+        """Record a door state change and answer the waiting requests."""
+        self.seq += 1
+        self.events.append((self.seq, (door.id, door.last_state, door.last_state_time)))
+        self.handle_updates()
+
+    def snapshot(self):
+        return [(d.id, d.last_state, d.last_state_time) for d in self.controller.doors]
+
+    def full_state(self, account):
+        """Everything the web client needs to draw its first page."""
+        uptime = system_uptime(self.controller.start_time)
+        return {'doors': account.visible([(d.id, d.name, d.last_state, d.last_state_time)
+                                          for d in self.controller.doors]),
+                'uptime': "Uptime: " + pretty_uptime(uptime)}
+
+    def get_updates(self, since):
+        if since == self.seq:
+            return []
+        if since > self.seq or not self.events or since < self.events[0][0] - 1:
+            # Too far behind for the buffer, or from before a restart; send the current state instead
+            return self.snapshot()
+        return [update for (seq, update) in self.events if seq > since]
 
     def handle_updates(self):
-        for request in self.delayed_requests:
-            updates = self.controller.get_updates(request.lastupdate)
-            if updates != []:
-                self.send_updates(request, updates)
-                self.delayed_requests.remove(request)
-
-    def format_updates(self, request, update):
-        response = json.dumps({'timestamp': int(time.time()), 'update':update})
-        if hasattr(request, 'jsonpcallback'):
+        waiters, self.delayed_requests = self.delayed_requests, {}
+        # Waiters are nearly always at the same sequence number and see the
+        # same doors, so each distinct response is only built once.
+        responses = {}
+        for request, timeout in waiters.items():
+            key = (request.since, request.jsonpcallback, request.account.doors)
+            if key not in responses:
+                updates = request.account.visible(self.get_updates(request.since))
+                responses[key] = self.format_updates(request, updates) if updates else None
+            if responses[key] is None:
+                # Nothing this client may see changed; keep it waiting
+                self.delayed_requests[request] = timeout
+                continue
+            timeout.cancel()
+            self.send_response(request, responses[key])
+
+    def expire(self, request):
+        if self.delayed_requests.pop(request, None) is not None:
+            self.send_response(request, self.format_updates(request, []))
+
+    def forget(self, request):
+        timeout = self.delayed_requests.pop(request, None)
+        if timeout is not None and timeout.active():
+            timeout.cancel()
+
+    def format_updates(self, request, update, full=None):
+        response = {'timestamp': int(time.time()), 'seq': self.seq, 'update':update}
+        if full is not None:
+            response.update(full)
+        response = json.dumps(response)
+        if request.jsonpcallback is not None:
             return request.jsonpcallback +'('+response+')'
         else:
             return response
 
-    def send_updates(self, request, updates):
-        request.write(self.format_updates(request, updates))
+    def send_response(self, request, response):
+        request.write(response)
         request.finish()
 
     def render(self, request):
@@ -479,29 +3547,173 @@ class UpdateHandler(Resource):
         args = request.args
 
         # set jsonp callback handler name if it exists
-        if 'callback' in args:
-            request.jsonpcallback =  args['callback'][0]
+        request.jsonpcallback = args['callback'][0] if 'callback' in args else None
 
-        # set lastupdate if it exists
-        if 'lastupdate' in args:
-            request.lastupdate = float(args['lastupdate'][0])
+        try:
+            since = int(args['since'][0]) if 'since' in args else None
+            lastupdate = float(args['lastupdate'][0]) if 'lastupdate' in args else 0
+        except ValueError:
+            request.setResponseCode(400)
+            return json.dumps('Error: since and lastupdate must be numbers')
+
+        if 'full' in args:
+            request.since = self.seq
+            return self.format_updates(request, [], self.full_state(request.account))
+        elif since is not None:
+            request.since = since
+            updates = request.account.visible(self.get_updates(request.since))
         else:
-            request.lastupdate = 0
-
-            #print "request received " + str(request.lastupdate)
+            # older clients identify themselves by timestamp
+            updates = request.account.visible([(d.id, d.last_state, d.last_state_time)
+                                               for d in self.controller.doors if d.last_state_time >= lastupdate])
+            request.since = self.seq
 
         # Can we accommodate this request now?
-        updates = self.controller.get_updates(request.lastupdate)
         if updates != []:
             return self.format_updates(request, updates)
 
+        if len(self.delayed_requests) >= self.controller.config.config.max_update_waiters:
+            request.setResponseCode(503)
+            request.setHeader('Retry-After', '10')
+            return self.format_updates(request, [])
 
-        request.notifyFinish().addErrback(lambda x: self.delayed_requests.remove(request))
-        self.delayed_requests.append(request)
+        request.held = True
+        request.notifyFinish().addErrback(lambda x: self.forget(request))
+        self.delayed_requests[request] = reactor.callLater(self.controller.config.config.update_timeout,
+                                                           self.expire, request)  # @UndefinedVariable
 
         # tell the client we're not done yet
         return server.NOT_DONE_YET
 
+class EventStreamHandler(Resource):
+    """
+    Server-Sent Events stream of door state changes. Each client keeps one
+    connection open and is sent every change as it happens, using the same
+    sequence numbers and payload as /upd. A reconnecting client resumes from
+    the Last-Event-ID its browser sends (or a 'since' argument). A new
+    client that asks for 'full' is first sent a 'state' event with the same
+    payload as /upd?full.
+    """
+    isLeaf = True
+    def __init__(self, controller):
+        Resource.__init__(self)
+        self.controller = controller
+        self.updates = controller.updateHandler
+        self.streams = set()
+        self.heartbeat = task.LoopingCall(self.send_heartbeat)
+
+    def start(self):
+        self.heartbeat.start(self.controller.config.config.event_heartbeat, now=False)
+
+    def publish(self):
+        """Send the most recent event to every connected client."""
+        if not self.streams:
+            return
+        seq, update = self.updates.events[-1]
+        message = self.format_event(seq, [update])
+        for request in list(self.streams):
+            if request.account.can_see(update[0]):
+                request.write(message)
+
+    def send_heartbeat(self):
+        for request in list(self.streams):
+            request.write(':\n\n')
+
+    def format_event(self, seq, updates, event='update', full=None):
+        data = {'timestamp': int(time.time()), 'seq': seq, 'update': updates}
+        if full is not None:
+            data.update(full)
+        return 'id: %d\nevent: %s\ndata: %s\n\n' % (seq, event, json.dumps(data))
+
+    def render(self, request):
+        if len(self.streams) >= self.controller.config.config.max_event_streams:
+            request.setResponseCode(503)
+            request.setHeader('Retry-After', '10')
+            return ''
+
+        since = request.getHeader('Last-Event-ID')
+        if since is None and 'since' in request.args:
+            since = request.args['since'][0]
+        if since is not None:
+            try:
+                since = int(since)
+            except ValueError:
+                request.setResponseCode(400)
+                return 'Error: since must be a number'
+
+        request.setHeader('Content-Type', 'text/event-stream')
+        request.setHeader('Cache-Control', 'no-cache')
+
+        request.write('retry: 3000\n\n')
+        if since is not None:
+            updates = self.updates.get_updates(since)
+        elif 'full' in request.args:
+            request.write(self.format_event(self.updates.seq, [], 'state',
+                                            self.updates.full_state(request.account)))
+            updates = []
+        else:
+            updates = self.updates.snapshot()
+        updates = request.account.visible(updates)
+        if updates:
+            request.write(self.format_event(self.updates.seq, updates))
+
+        request.held = True
+        self.streams.add(request)
+        request.notifyFinish().addBoth(lambda x: self.streams.discard(request))
+        return server.NOT_DONE_YET
+
+def use_gpio_backend(name):
+    """
+    Selects the module used to drive the GPIO pins: 'rpi' for RPi.GPIO on a
+    Raspberry Pi, or 'sim' for the simulator in simgpio.py. The pins are
+    reset the first time a backend is selected only, as providers added
+    by a reload share the pins of the doors already running.
+    """
+    global gpio, gpio_backend
+    if name == gpio_backend:
+        return
+    if name == 'rpi':
+        import RPi.GPIO as gpio
+    elif name == 'sim':
+        import simgpio as gpio
+    else:
+        raise ValueError("Unknown gpio_backend: %s" % name)
+    gpio_backend = name
+    gpio.setwarnings(False)
+    gpio.cleanup()
+    gpio.setmode(gpio.BCM)
+
+def system_uptime(fallback_start):
+    """
+    Returns the system uptime in seconds, read from /proc/uptime. Where that
+    is not available the time since fallback_start is used instead.
+    """
+    try:
+        with open('/proc/uptime') as f:
+            return float(f.read().split()[0])
+    except (IOError, ValueError, IndexError):
+        return time.time() - fallback_start
+
+def pretty_uptime(seconds):
+    """
+    Returns the largest whole unit of an amount of seconds, in the style of
+    the first part of `uptime -p` (e.g. "3 days").
+    """
+    parts = [('year', 60 * 60 * 24 * 365),
+             ('week', 60 * 60 * 24 * 7),
+             ('day', 60 * 60 * 24),
+             ('hour', 60 * 60),
+             ('minute', 60)]
+
+    for name, length in parts:
+        value = int(seconds // length)
+        if value > 0:
+            return '%d %s%s' % (value, name, ('', 's')[value > 1])
+    return '0 mins'
+
+def escape_label(value):
+    return unicode(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').encode('utf-8')
+
 def elapsed_time(seconds, suffixes=['y','w','d','h','m','s'], add_s=False, separator=' '):
     """
     Takes an amount of seconds and turns it into a human-readable amount of time.
@@ -534,7 +3746,10 @@ def elapsed_time(seconds, suffixes=['y','w','d','h','m','s'], add_s=False, separ
 
 if __name__ == '__main__':
     syslog.openlog('garage_controller')
-    config_file = open('config.json')
-    controller = Controller(json.load(config_file))
-    config_file.close()
+    try:
+        config = load_config('config.json')
+    except ConfigError as e:
+        syslog.syslog(str(e))
+        sys.exit(str(e))
+    controller = Controller(config, 'config.json')
     controller.run()
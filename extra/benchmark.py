@@ -0,0 +1,204 @@
+"""
+Load test for the controller, using the simulated GPIO backend.
+
+Starts a controller with many virtual doors in a child process, then drives
+it with concurrent /upd long-poll clients and a stream of clicks and API
+calls. Reports how long the status loop takes, reactor lag, the delay
+between a state change being published and each client receiving it, and
+the controller's memory use.
+
+Run from the top of the repository, e.g.
+
+    python extra/benchmark.py --doors 200 --clients 2000 --duration 30
+
+Thousands of clients need a matching open file limit (ulimit -n).
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from twisted.internet import reactor, task, defer
+from twisted.web.client import Agent, HTTPConnectionPool, readBody
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def make_config(args, history_file):
+    doors = {}
+    for n in range(args.doors):
+        doors['door%03d' % n] = {
+            "name": "Door %d" % n,
+            "relay_pin": 1000 + n,
+            "state_pin": 5000 + n,
+            "time_to_open": args.travel_time,
+            "time_to_close": args.travel_time,
+            "simulation": {"bounce_time": args.bounce_time}
+        }
+    return {
+        "config": {
+            "gpio_backend": "sim",
+            "state_detection": "interrupt" if args.interrupts else "poll",
+            "use_https": False,
+            "use_auth": False,
+            "use_alerts": False,
+            "use_openhab": False,
+            "use_ifttt": False,
+            "allow_api": True,
+            "api_key": "benchmark",
+            "max_update_waiters": args.clients * 2
+        },
+        "alerts": {"time_to_wait": 10, "alert_type": None},
+        "history": {"file": history_file},
+        "site": {"port": args.port},
+        "doors": doors
+    }
+
+def percentiles(values):
+    if not values:
+        return {}
+    values = sorted(values)
+    pick = lambda p: values[min(int(len(values) * p), len(values) - 1)]
+    return {'count': len(values), 'p50': pick(0.5), 'p90': pick(0.9),
+            'p99': pick(0.99), 'max': values[-1]}
+
+def serve(config_file, stats_file):
+    """Runs the controller under test; writes its statistics on SIGTERM."""
+    sys.path.insert(0, ROOT)
+    import controller
+    c = controller.Controller(controller.load_config(config_file))
+
+    loop_times = []
+    status_check = c.status_check
+    def timed_status_check(provider):
+        start = time.time()
+        d = defer.maybeDeferred(status_check, provider)
+        d.addCallback(lambda _: loop_times.append(time.time() - start))
+        return d
+    c.status_check = timed_status_check
+
+    def write_stats():
+        with open(stats_file, 'w') as f:
+            json.dump({
+                'status_loop': percentiles(loop_times),
+                'max_reactor_lag': c.reactor_monitor.max_lag,
+                'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            }, f)
+    reactor.addSystemEventTrigger('before', 'shutdown', write_stats)
+    c.run()
+
+class LoadGenerator(object):
+    def __init__(self, args):
+        self.args = args
+        self.base = 'http://127.0.0.1:%d/' % args.port
+        pool = HTTPConnectionPool(reactor, persistent=True)
+        pool.maxPersistentPerHost = args.clients + 10
+        self.agent = Agent(reactor, pool=pool)
+        self.latencies = []
+        self.requests = 0
+        self.errors = 0
+        self.running = True
+
+    def get(self, path):
+        self.requests += 1
+        d = self.agent.request('GET', self.base + path)
+        d.addCallback(readBody)
+        return d
+
+    @defer.inlineCallbacks
+    def long_poll_client(self):
+        since = 0
+        while self.running:
+            try:
+                body = yield self.get('upd?since=%d' % since)
+            except Exception:
+                self.errors += 1
+                yield task.deferLater(reactor, 1, lambda: None)
+                continue
+            received = time.time()
+            response = json.loads(body)
+            if since:
+                for door, state, changed in response['update']:
+                    self.latencies.append(received - changed)
+            since = response['seq']
+
+    def click(self):
+        door = 'door%03d' % random.randrange(self.args.doors)
+        if random.random() < 0.5:
+            d = self.get('clk?id=' + door)
+        else:
+            d = self.get('api?key=benchmark&command=toggle&id=' + door)
+        d.addErrback(self.failed)
+
+    def failed(self, failure):
+        self.errors += 1
+
+    def start(self):
+        for _ in range(self.args.clients):
+            self.long_poll_client()
+        task.LoopingCall(self.click).start(1.0 / self.args.clicks, now=False)
+
+def wait_for_server(port, timeout=30):
+    import socket
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), 1).close()
+            return
+        except socket.error:
+            time.sleep(0.2)
+    raise RuntimeError("controller did not start")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--doors', type=int, default=200)
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--clicks', type=float, default=20, help='clicks and API calls per second')
+    parser.add_argument('--duration', type=float, default=30, help='seconds')
+    parser.add_argument('--travel-time', type=float, default=5, help='door travel time in seconds')
+    parser.add_argument('--bounce-time', type=float, default=0.05, help='sensor bounce in seconds')
+    parser.add_argument('--interrupts', action='store_true', help='use interrupt-driven state detection')
+    parser.add_argument('--port', type=int, default=18081)
+    parser.add_argument('--serve', nargs=2, metavar=('CONFIG', 'STATS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(*args.serve)
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    workdir = tempfile.mkdtemp(prefix='garage-benchmark-')
+    config_file = os.path.join(workdir, 'config.json')
+    stats_file = os.path.join(workdir, 'stats.json')
+    with open(config_file, 'w') as f:
+        json.dump(make_config(args, os.path.join(workdir, 'history.log')), f)
+
+    server = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--serve', config_file, stats_file],
+                              cwd=ROOT)
+    try:
+        wait_for_server(args.port)
+        load = LoadGenerator(args)
+        reactor.callWhenRunning(load.start)
+        reactor.callLater(args.duration, reactor.stop)  # @UndefinedVariable
+        reactor.run()  # @UndefinedVariable
+        load.running = False
+    finally:
+        server.terminate()
+        server.wait()
+
+    with open(stats_file) as f:
+        stats = json.load(f)
+    stats['notification_latency'] = percentiles(load.latencies)
+    stats['requests'] = load.requests
+    stats['errors'] = load.errors
+    print(json.dumps(stats, indent=2, sort_keys=True))
+
+if __name__ == '__main__':
+    main()
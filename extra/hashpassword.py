@@ -0,0 +1,32 @@
+"""
+Prints a password hash for the password_hash of a user in the auth.users
+section of config.json.
+
+Run from the top of the repository, e.g.
+
+    python extra/hashpassword.py
+"""
+
+import argparse
+import getpass
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import controller
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--iterations', type=int, default=controller.PASSWORD_HASH_ITERATIONS,
+                        help='PBKDF2 iterations; fewer make logins quicker on slow Pis')
+    args = parser.parse_args()
+
+    password = getpass.getpass('Password: ')
+    if password != getpass.getpass('Again: '):
+        sys.exit("The passwords don't match")
+    print(controller.hash_password(password, args.iterations))
+
+if __name__ == '__main__':
+    main()
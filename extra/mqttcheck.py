@@ -0,0 +1,201 @@
+"""
+Checks the MQTT integration against a stand-in broker on this machine.
+
+Starts a minimal MQTT broker in this process and a simulated controller
+with use_mqtt on in a child process, then checks that:
+- every door's state is published, retained, along with Home Assistant
+  discovery and an "online" status,
+- an OPEN command on a door's set topic opens it,
+- changes made while the broker is down are sent once it is back, and the
+  broker's last will marks the controller offline in between.
+
+Run from the top of the repository, e.g.
+
+    python extra/mqttcheck.py --doors 3
+"""
+
+import argparse
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+from twisted.internet import reactor, task, defer
+from twisted.internet.protocol import Factory, Protocol
+from twisted.web.client import Agent, readBody
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import mqtt
+
+KEY = 'mqttcheck'
+
+class BrokerProtocol(Protocol):
+    def __init__(self, broker):
+        self.broker = broker
+        self.buffer = b''
+        self.filters = []
+        self.will = None
+
+    def dataReceived(self, data):
+        packets, self.buffer = mqtt.read_packets(self.buffer + data)
+        for kind, flags, body in packets:
+            self.packet_received(kind, flags, body)
+
+    def packet_received(self, kind, flags, body):
+        if kind == mqtt.CONNECT:
+            _, pos = mqtt.decode_string(body)
+            level, connect_flags, keepalive = struct.unpack('!BBH', body[pos:pos + 4])
+            _, pos = mqtt.decode_string(body, pos + 4)
+            if connect_flags & 0x04:
+                topic, pos = mqtt.decode_string(body, pos)
+                message, pos = mqtt.decode_string(body, pos)
+                self.will = (topic.decode('utf-8'), message, bool(connect_flags & 0x20))
+            self.broker.clients.add(self)
+            self.transport.write(mqtt.packet(mqtt.CONNACK, 0, b'\x00\x00'))
+        elif kind == mqtt.PUBLISH:
+            topic, payload, qos, retain, packet_id = mqtt.parse_publish(flags, body)
+            if qos:
+                self.transport.write(mqtt.packet(mqtt.PUBACK, 0, struct.pack('!H', packet_id)))
+            self.broker.publish(topic.decode('utf-8'), payload, retain)
+        elif kind == mqtt.SUBSCRIBE:
+            packet_id = body[:2]
+            pos = 2
+            granted = b''
+            while pos < len(body):
+                topic_filter, pos = mqtt.decode_string(body, pos)
+                pos += 1
+                self.filters.append(topic_filter.decode('utf-8'))
+                granted += b'\x00'
+            self.transport.write(mqtt.packet(mqtt.SUBACK, 0, packet_id + granted))
+            for topic, payload in sorted(self.broker.retained.items()):
+                self.deliver(topic, payload, True)
+        elif kind == mqtt.PINGREQ:
+            self.transport.write(mqtt.packet(mqtt.PINGRESP, 0))
+        elif kind == mqtt.DISCONNECT:
+            self.will = None
+            self.transport.loseConnection()
+
+    def deliver(self, topic, payload, retain):
+        if any(mqtt.topic_matches(f, topic) for f in self.filters):
+            self.transport.write(mqtt.publish_packet(topic, payload, 0, retain))
+
+    def connectionLost(self, reason):
+        self.broker.clients.discard(self)
+        if self.will is not None:
+            self.broker.publish(*self.will)
+
+class Broker(Factory):
+    """Just enough of an MQTT broker: QoS 0 delivery, retained messages and last wills."""
+
+    def __init__(self):
+        self.clients = set()
+        self.retained = {}
+        self.messages = []
+
+    def buildProtocol(self, addr):
+        return BrokerProtocol(self)
+
+    def publish(self, topic, payload, retain):
+        self.messages.append((time.time(), topic, payload))
+        if retain:
+            if payload:
+                self.retained[topic] = payload
+            else:
+                self.retained.pop(topic, None)
+        for client in list(self.clients):
+            client.deliver(topic, payload, False)
+
+def controller_config(args, workdir):
+    doors = {}
+    for d in range(args.doors):
+        doors['door%d' % d] = {"name": "Door %d" % d, "relay_pin": 100 + d, "state_pin": 200 + d,
+                               "time_to_open": args.travel_time, "time_to_close": args.travel_time}
+    return {
+        "config": {"gpio_backend": "sim", "use_mqtt": True, "allow_api": True, "api_key": KEY},
+        "mqtt": {"host": "127.0.0.1", "port": args.broker_port, "client_id": "mqttcheck", "keepalive": 5},
+        "history": {"file": os.path.join(workdir, 'history.log')},
+        "auth": {"secret_file": os.path.join(workdir, 'session.key')},
+        "site": {"port": args.port},
+        "doors": doors,
+    }
+
+@defer.inlineCallbacks
+def wait_for(condition, what, timeout=30):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise RuntimeError("timed out waiting for " + what)
+        yield task.deferLater(reactor, 0.1, lambda: None)
+
+@defer.inlineCallbacks
+def check(args, broker, listen):
+    retained = broker.retained
+    doors = ['door%d' % d for d in range(args.doors)]
+    yield wait_for(lambda: all(retained.get('garage/%s/state' % d) == b'closed' for d in doors),
+                   "every door's state")
+    yield wait_for(lambda: retained.get('garage/status') == b'online', "the online status")
+    for d in doors:
+        config = json.loads(retained['homeassistant/cover/mqttcheck/%s/config' % d])
+        assert config['command_topic'] == 'garage/%s/set' % d, config
+    print("States, status and discovery for %d doors are retained" % len(doors))
+
+    start = time.time()
+    broker.publish('garage/door0/set', b'OPEN', False)
+    yield wait_for(lambda: retained.get('garage/door0/state') == b'open', "door0 to open")
+    print("OPEN command carried out in %.2fs" % (time.time() - start))
+
+    # Take the broker away and change a door while it is gone
+    yield listen.stopListening()
+    for client in list(broker.clients):
+        client.transport.abortConnection()
+    yield wait_for(lambda: retained.get('garage/status') == b'offline', "the last will")
+    print("Broker down; last will published")
+    agent = Agent(reactor)
+    response = yield agent.request(b'GET', ('http://127.0.0.1:%d/api?key=%s&command=open&id=door1' %
+                                            (args.port, KEY)).encode('ascii'))
+    yield readBody(response)
+    yield task.deferLater(reactor, args.travel_time + 1, lambda: None)
+    reconnected = time.time()
+    listen = reactor.listenTCP(args.broker_port, broker, interface='127.0.0.1')  # @UndefinedVariable
+    yield wait_for(lambda: retained.get('garage/door1/state') == b'open', "the buffered door1 state", 90)
+    assert retained.get('garage/status') == b'online'
+    print("Buffered change delivered %.2fs after the broker came back" % (time.time() - reconnected))
+    yield listen.stopListening()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--doors', type=int, default=3)
+    parser.add_argument('--travel-time', type=float, default=1, help='door travel time in seconds')
+    parser.add_argument('--port', type=int, default=18181, help='web port of the controller')
+    parser.add_argument('--broker-port', type=int, default=18883, help='port for the stand-in broker')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='garage-mqttcheck-')
+    config_file = os.path.join(workdir, 'config.json')
+    with open(config_file, 'w') as f:
+        json.dump(controller_config(args, workdir), f)
+
+    broker = Broker()
+    listen = reactor.listenTCP(args.broker_port, broker, interface='127.0.0.1')  # @UndefinedVariable
+    code = "import sys, controller; controller.Controller(controller.load_config(sys.argv[1])).run()"
+    process = subprocess.Popen([sys.executable, '-c', code, config_file], cwd=ROOT)
+    result = []
+    def done(outcome):
+        result.append(outcome)
+        reactor.stop()  # @UndefinedVariable
+    check(args, broker, listen).addBoth(done)
+    try:
+        reactor.run()  # @UndefinedVariable
+    finally:
+        process.terminate()
+        process.wait()
+    if not result or hasattr(result[0], 'getErrorMessage'):
+        sys.exit("Failed: %s" % (result[0].getErrorMessage() if result else 'interrupted'))
+
+if __name__ == '__main__':
+    main()
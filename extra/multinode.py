@@ -0,0 +1,164 @@
+"""
+Stands up several simulated controller nodes behind one aggregator, each in
+its own process, on this machine.
+
+Every node simulates --doors doors and pushes their state to the
+aggregator, which shows all of them on http://localhost:<port>/. With
+--check, the script toggles one door on every node through the
+aggregator's API, waits for the change to come back through /upd, then
+makes a jammed door on the first node go stuck and checks that the
+aggregator raises the stuck alert for it, and exits; otherwise it runs
+until interrupted.
+
+Run from the top of the repository, e.g.
+
+    python extra/multinode.py --nodes 3 --doors 4 --check
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    from urllib2 import urlopen
+except ImportError:
+    from urllib.request import urlopen
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KEY = 'multinode'
+
+def base_config(port, history_file):
+    return {
+        "config": {
+            "gpio_backend": "sim",
+            "use_https": False,
+            "use_auth": False,
+            "use_alerts": False,
+            "use_openhab": False,
+            "use_ifttt": False,
+            "allow_api": True,
+            "api_key": KEY
+        },
+        "alerts": {"time_to_wait": 10, "alert_type": None},
+        "history": {"file": history_file},
+        "site": {"port": port},
+        "doors": {}
+    }
+
+def node_config(n, args, workdir):
+    config = base_config(args.port + 1 + n, os.path.join(workdir, 'node%d.log' % n))
+    for d in range(args.doors):
+        config['doors']['door%d' % d] = {
+            "name": "Node %d door %d" % (n, d),
+            "relay_pin": 100 + d,
+            "state_pin": 200 + d,
+            "time_to_open": args.travel_time,
+            "time_to_close": args.travel_time
+        }
+    if n == 0 and args.check:
+        # never moves, and its sensor says it is neither open nor closed
+        config['doors']['jammed'] = {
+            "name": "Node 0 jammed door",
+            "relay_pin": 150,
+            "state_pin": 250,
+            "open_state_pin": 251,
+            "time_to_open": 1,
+            "time_to_close": 1,
+            "simulation": {"jammed": True, "stuck_sensor": 1}
+        }
+    config['upstream'] = {"host": "127.0.0.1", "port": args.node_port, "node": "node%d" % n, "key": KEY}
+    return config
+
+def aggregator_config(args, workdir):
+    config = base_config(args.port, os.path.join(workdir, 'aggregator.log'))
+    config['providers'] = {"nodes": {"type": "nodes", "port": args.node_port, "key": KEY}}
+    config['config']['use_alerts'] = True
+    return config
+
+def start(config, name, workdir):
+    config_file = os.path.join(workdir, name + '.json')
+    with open(config_file, 'w') as f:
+        json.dump(config, f)
+    code = "import sys, controller; controller.Controller(controller.load_config(sys.argv[1])).run()"
+    return subprocess.Popen([sys.executable, '-c', code, config_file], cwd=ROOT)
+
+def get(port, path, timeout=30):
+    return json.loads(urlopen('http://127.0.0.1:%d/%s' % (port, path), timeout=timeout).read())
+
+def wait_for_doors(port, count, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            doors = get(port, 'cfg')
+            if len(doors) >= count and all(d[2] != 'unknown' for d in doors):
+                return doors
+        except IOError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("the aggregator did not see all %d doors" % count)
+
+def check(args):
+    doors = wait_for_doors(args.port, args.nodes * args.doors + 1)
+    print("Aggregator sees %d doors" % len(doors))
+    since = get(args.port, 'upd?since=0')['seq']
+    targets = set('node%d_door0' % n for n in range(args.nodes))
+    start_time = time.time()
+    for door in targets:
+        urlopen('http://127.0.0.1:%d/api?key=%s&command=toggle&id=%s' % (args.port, KEY, door)).read()
+    changed = set()
+    while not targets <= changed and time.time() - start_time < 30:
+        response = get(args.port, 'upd?since=%d' % since)
+        since = response['seq']
+        for door, state, state_time in response['update']:
+            if door in targets and state != 'closed':
+                changed.add(door)
+    if not targets <= changed:
+        raise RuntimeError("no state change from %s" % ', '.join(sorted(targets - changed)))
+    print("All %d nodes toggled and reported back in %.2fs" % (args.nodes, time.time() - start_time))
+
+    # A node reports the stuck state itself, so the aggregator never saw the door start
+    urlopen('http://127.0.0.1:%d/api?key=%s&command=toggle&id=node0_jammed' % (args.port, KEY)).read()
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        alerts = [e for e in get(args.port, 'history?door=node0_jammed') if e[2] == 'alert' and 'stuck' in e[3]]
+        if alerts:
+            break
+        time.sleep(0.5)
+    else:
+        raise RuntimeError("no stuck alert from the aggregator for node0_jammed")
+    print("Aggregator raised %r" % alerts[-1][3])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nodes', type=int, default=3)
+    parser.add_argument('--doors', type=int, default=4, help='doors per node')
+    parser.add_argument('--travel-time', type=float, default=5, help='door travel time in seconds')
+    parser.add_argument('--port', type=int, default=18081, help='web port of the aggregator; nodes use the ports after it')
+    parser.add_argument('--node-port', type=int, default=18090, help='port the aggregator listens on for nodes')
+    parser.add_argument('--check', action='store_true', help='toggle a door on each node and exit')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='garage-multinode-')
+    processes = [start(aggregator_config(args, workdir), 'aggregator', workdir)]
+    time.sleep(1)
+    for n in range(args.nodes):
+        processes.append(start(node_config(n, args, workdir), 'node%d' % n, workdir))
+    try:
+        if args.check:
+            check(args)
+        else:
+            print("Aggregator running on http://localhost:%d/ (Ctrl-C to stop)" % args.port)
+            processes[0].wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+"""
+Checks that slow or failing alert backends don't hold up the controller.
+
+Starts stub SMTP and HTTP servers in this process and a simulated
+controller in a child process that sends its alerts to them by SMTP and
+Pushover. Doors are opened through the API to raise an alert each time,
+while /st is requested ten times a second. Reports how long each alert
+took from the click to reaching a stub, /st latency and reactor lag.
+
+Each stub can be told to answer normally, slowly (--delay seconds before
+accepting each message) or to fail every message, e.g.
+
+    python extra/notifycheck.py --smtp slow --http fail
+
+Run from the top of the repository. The controller is given a plain HTTP
+connection to the stub in place of its HTTPS connection to Pushover.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from twisted.internet import reactor, task, defer
+from twisted.internet.protocol import Factory
+from twisted.protocols.basic import LineReceiver
+from twisted.web import server
+from twisted.web.client import Agent, HTTPConnectionPool, readBody
+from twisted.web.resource import Resource
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KEY = 'notifycheck'
+
+def percentiles(values):
+    if not values:
+        return {}
+    values = sorted(values)
+    pick = lambda p: values[min(int(len(values) * p), len(values) - 1)]
+    return {'count': len(values), 'p50': pick(0.5), 'p90': pick(0.9),
+            'p99': pick(0.99), 'max': values[-1]}
+
+class SmtpStub(LineReceiver):
+    """Just enough of an SMTP server for smtplib: EHLO, AUTH, MAIL, RCPT, DATA and QUIT."""
+    delimiter = b'\r\n'
+
+    def connectionMade(self):
+        self.data = None
+        self.sendLine(b'220 notifycheck ESMTP')
+
+    def lineReceived(self, line):
+        if self.data is not None:
+            if line == b'.':
+                message, self.data = b'\n'.join(self.data), None
+                self.message_received(message)
+            else:
+                self.data.append(line)
+            return
+        command = line.split(b' ', 1)[0].upper()
+        if command == b'EHLO':
+            self.sendLine(b'250-notifycheck')
+            self.sendLine(b'250 AUTH PLAIN LOGIN')
+        elif command == b'AUTH':
+            self.sendLine(b'235 Authenticated')
+        elif command == b'DATA':
+            self.data = []
+            self.sendLine(b'354 Go ahead')
+        elif command == b'QUIT':
+            self.sendLine(b'221 Bye')
+            self.transport.loseConnection()
+        else:
+            self.sendLine(b'250 OK')
+
+    def message_received(self, message):
+        mode = self.factory.mode
+        if mode == 'fail':
+            self.sendLine(b'554 Transaction failed')
+            return
+        delay = self.factory.delay if mode == 'slow' else 0
+        def accept():
+            self.factory.received.append((time.time(), message))
+            self.sendLine(b'250 Queued')
+        reactor.callLater(delay, accept)  # @UndefinedVariable
+
+class SmtpStubFactory(Factory):
+    protocol = SmtpStub
+
+    def __init__(self, mode, delay):
+        self.mode = mode
+        self.delay = delay
+        self.received = []
+
+class PushoverStub(Resource):
+    isLeaf = True
+
+    def __init__(self, mode, delay):
+        Resource.__init__(self)
+        self.mode = mode
+        self.delay = delay
+        self.received = []
+
+    def render_POST(self, request):
+        if self.mode == 'fail':
+            request.setResponseCode(500)
+            return b'{"status":0}'
+        message = request.args.get(b'message', [b''])[0]
+        if self.mode == 'slow':
+            def accept():
+                self.received.append((time.time(), message))
+                request.write(b'{"status":1}')
+                request.finish()
+            reactor.callLater(self.delay, accept)  # @UndefinedVariable
+            return server.NOT_DONE_YET
+        self.received.append((time.time(), message))
+        return b'{"status":1}'
+
+def controller_config(args, workdir, smtp_port):
+    doors = {}
+    for d in range(args.doors):
+        doors['door%d' % d] = {"name": "Door %d" % d, "relay_pin": 100 + d, "state_pin": 200 + d,
+                               "time_to_open": args.travel_time, "time_to_close": args.travel_time}
+    return {
+        "config": {"gpio_backend": "sim", "use_alerts": True, "allow_api": True, "api_key": KEY},
+        "alerts": {
+            "alert_type": ["smtp", "pushover"],
+            "rules": [{"type": "opened_at_night", "hours": "00:01-00:00"}],
+            "timeout": args.timeout,
+            "max_retries": 2,
+            "retry_delay": 1,
+            "coalesce_window": 0,
+            "rate_limit": 0,
+            "flap_max": 1000,
+            "smtp": {"smtphost": "127.0.0.1", "smtpport": smtp_port, "smtp_tls": False,
+                     "username": "garage@example.com", "password": "secret", "to_email": "me@example.com"},
+            "pushover": {"user_key": "user", "api_key": "key"},
+        },
+        "history": {"file": os.path.join(workdir, 'history.log')},
+        "auth": {"secret_file": os.path.join(workdir, 'session.key')},
+        "site": {"port": args.port},
+        "doors": doors,
+    }
+
+class Check(object):
+    def __init__(self, args):
+        self.args = args
+        self.base = 'http://127.0.0.1:%d/' % args.port
+        self.agent = Agent(reactor, pool=HTTPConnectionPool(reactor, persistent=True))
+        self.clicks = {}
+        self.status_latencies = []
+        self.max_lag = 0.0
+        self.errors = 0
+        self.next_door = 0
+
+    @defer.inlineCallbacks
+    def get(self, path):
+        response = yield self.agent.request(b'GET', (self.base + path).encode('ascii'))
+        body = yield readBody(response)
+        defer.returnValue(body)
+
+    def failed(self, failure):
+        self.errors += 1
+
+    def poll_status(self):
+        start = time.time()
+        d = self.get('st?id=door0')
+        d.addCallbacks(lambda _: self.status_latencies.append(time.time() - start), self.failed)
+
+    def poll_health(self):
+        d = self.get('health')
+        d.addCallbacks(lambda body: setattr(self, 'max_lag', json.loads(body)['max_reactor_lag']), self.failed)
+
+    def open_door(self):
+        # Doors are opened in turn and closed again before their next turn
+        door = self.next_door
+        self.next_door = (door + 1) % self.args.doors
+        d = self.get('api?key=%s&command=toggle&id=door%d' % (KEY, door))
+        d.addErrback(self.failed)
+        if door not in self.clicks or len(self.clicks[door]) % 2 == 0:
+            self.clicks.setdefault(door, []).append(time.time())
+        else:
+            self.clicks[door].append(None)
+
+    def start(self):
+        task.LoopingCall(self.poll_status).start(0.1)
+        task.LoopingCall(self.poll_health).start(1.0)
+        task.LoopingCall(self.open_door).start(self.args.click_interval, now=False)
+
+    def dispatch_latencies(self, received):
+        """Time from each opening click to the alert about it reaching the stub."""
+        latencies = []
+        for when, message in received:
+            for door, clicks in self.clicks.items():
+                if (b'Door %d\'s' % door) in message:
+                    opened = [t for t in clicks if t is not None and t <= when]
+                    if opened:
+                        latencies.append(when - opened[-1])
+        return latencies
+
+def wait_for_server(port, timeout=30):
+    import socket
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), 1).close()
+            return
+        except socket.error:
+            time.sleep(0.2)
+    raise RuntimeError("controller did not start")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--smtp', choices=('ok', 'slow', 'fail'), default='slow', help='how the SMTP stub behaves')
+    parser.add_argument('--http', choices=('ok', 'slow', 'fail'), default='fail', help='how the HTTP stub behaves')
+    parser.add_argument('--delay', type=float, default=5, help='seconds a slow stub takes over each message')
+    parser.add_argument('--timeout', type=float, default=10, help='alert timeout given to the controller')
+    parser.add_argument('--doors', type=int, default=4)
+    parser.add_argument('--click-interval', type=float, default=1, help='seconds between clicks')
+    parser.add_argument('--travel-time', type=float, default=0.5, help='door travel time in seconds')
+    parser.add_argument('--duration', type=float, default=30, help='seconds')
+    parser.add_argument('--port', type=int, default=18081, help='web port of the controller')
+    args = parser.parse_args()
+
+    smtp = SmtpStubFactory(args.smtp, args.delay)
+    smtp_port = reactor.listenTCP(0, smtp, interface='127.0.0.1').getHost().port  # @UndefinedVariable
+    pushover = PushoverStub(args.http, args.delay)
+    http_port = reactor.listenTCP(0, server.Site(pushover), interface='127.0.0.1').getHost().port  # @UndefinedVariable
+
+    workdir = tempfile.mkdtemp(prefix='garage-notifycheck-')
+    config_file = os.path.join(workdir, 'config.json')
+    with open(config_file, 'w') as f:
+        json.dump(controller_config(args, workdir, smtp_port), f)
+    code = ("import sys, httplib, controller\n"
+            "port = int(sys.argv[2])\n"
+            "controller.httplib.HTTPSConnection = "
+            "lambda host, p, timeout=None: httplib.HTTPConnection('127.0.0.1', port, timeout=timeout)\n"
+            "controller.Controller(controller.load_config(sys.argv[1])).run()")
+    process = subprocess.Popen([sys.executable, '-c', code, config_file, str(http_port)], cwd=ROOT)
+    check = Check(args)
+    try:
+        wait_for_server(args.port)
+        reactor.callWhenRunning(check.start)  # @UndefinedVariable
+        reactor.callLater(args.duration, reactor.stop)  # @UndefinedVariable
+        reactor.run()  # @UndefinedVariable
+    finally:
+        process.terminate()
+        process.wait()
+
+    print(json.dumps({
+        'smtp': {'mode': args.smtp, 'delivered': len(smtp.received),
+                 'dispatch_latency': percentiles(check.dispatch_latencies(smtp.received))},
+        'pushover': {'mode': args.http, 'delivered': len(pushover.received),
+                     'dispatch_latency': percentiles(check.dispatch_latencies(pushover.received))},
+        'openings': sum(len([t for t in clicks if t is not None]) for clicks in check.clicks.values()),
+        'status_latency': percentiles(check.status_latencies),
+        'max_reactor_lag': check.max_lag,
+        'errors': check.errors,
+    }, indent=2, sort_keys=True))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+Measures what it costs to open the web app, cold and warm.
+
+Starts a simulated controller in a child process and loads the app the way
+a browser does: the page, then the stylesheet and script it links to, the
+first state request the script makes (upd?full=1) and the door pictures.
+Icons and the manifest are fetched afterwards. That is done three times:
+- cold: nothing cached,
+- warm: the page revalidated with its ETag, and the fingerprinted (?v=)
+  assets taken from the cache without asking, as their Cache-Control allows,
+- revalidate: every asset revalidated with its ETag, as a browser does
+  after a forced reload.
+For each it reports the requests made, bytes transferred (headers and
+bodies, as sent) and the time until the page could be used, both as
+measured here and as estimated for a slower link (--rtt and --bandwidth)
+from the round trips and bytes needed before then.
+The cold load is also done without compression for comparison.
+
+Run from the top of the repository, e.g.
+
+    python extra/pageload.py --bandwidth 1000 --rtt 0.05
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import httplib
+except ImportError:
+    import http.client as httplib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINK_RE = re.compile(r'(?:src|href)="([^"#:]+)"')
+
+def controller_config(args, workdir):
+    doors = {}
+    for d in range(args.doors):
+        doors['door%d' % d] = {"name": "Door %d" % d, "relay_pin": 100 + d, "state_pin": 200 + d}
+    return {
+        "config": {"gpio_backend": "sim"},
+        "history": {"file": os.path.join(workdir, 'history.log')},
+        "auth": {"secret_file": os.path.join(workdir, 'session.key')},
+        "site": {"port": args.port},
+        "doors": doors,
+    }
+
+class Browser(object):
+    """Fetches over one kept-alive connection, with a cache of ETags and bodies."""
+
+    def __init__(self, port, compression=True):
+        self.connection = httplib.HTTPConnection('127.0.0.1', port, timeout=30)
+        self.compression = compression
+        self.cache = {}
+        self.reset()
+
+    def reset(self):
+        self.requests = 0
+        self.bytes = 0
+        self.not_modified = 0
+
+    def get(self, path, revalidate=True):
+        """Returns the body of path, from the cache if it may be used without asking."""
+        cached = self.cache.get(path)
+        if cached is not None and not revalidate:
+            return cached['body']
+        headers = {}
+        if self.compression:
+            headers['Accept-Encoding'] = 'br, gzip'
+        if cached is not None:
+            headers['If-None-Match'] = cached['etag']
+        self.connection.request('GET', '/' + path, headers=headers)
+        response = self.connection.getresponse()
+        raw = response.read()
+        self.requests += 1
+        self.bytes += len(raw) + len(str(response.msg)) + len('HTTP/1.1 200 OK\r\n\r\n')
+        if response.status == 304:
+            self.not_modified += 1
+            return cached['body']
+        body = raw
+        encoding = response.getheader('Content-Encoding')
+        if encoding == 'gzip':
+            import zlib
+            body = zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+        elif encoding == 'br':
+            import brotli
+            body = brotli.decompress(raw)
+        etag = response.getheader('ETag')
+        if etag is not None:
+            self.cache[path] = {'etag': etag, 'body': body}
+        return body
+
+    def immutable(self, path):
+        return '?v=' in path and path in self.cache
+
+def load(browser, args, mode):
+    """Loads the app once; returns its statistics."""
+    browser.reset()
+    rounds = 0
+    start = time.time()
+    page = browser.get('')
+    rounds += 1
+    links = [link.lstrip('/') for link in LINK_RE.findall(page.decode('utf-8'))]
+    # only the stylesheet and script hold up the page; icons and the manifest come later
+    critical = [link for link in links if link.split('?')[0].endswith(('.css', '.js'))]
+    requests_before = browser.requests
+    for link in critical:
+        browser.get(link, revalidate=mode == 'revalidate' or not browser.immutable(link))
+    if browser.requests > requests_before:
+        rounds += 1
+    # what client.js asks for once it runs
+    state = json.loads(browser.get('upd?full=1').decode('utf-8'))
+    rounds += 1
+    interactive = time.time() - start
+    interactive_bytes = browser.bytes
+    # the door pictures arrive after the doors have been drawn
+    for image in sorted(set('img/%s.png' % door[2] for door in state['doors'])):
+        browser.get(image, revalidate=True)
+    for link in sorted(set(links) - set(critical)):
+        browser.get(link, revalidate=mode == 'revalidate' or not browser.immutable(link))
+    return {
+        'requests': browser.requests,
+        'not_modified': browser.not_modified,
+        'bytes': browser.bytes,
+        'time_to_interactive': interactive,
+        'estimated_time_to_interactive': rounds * args.rtt + interactive_bytes * 8.0 / (args.bandwidth * 1000),
+    }
+
+def wait_for_server(port, timeout=30):
+    import socket
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), 1).close()
+            return
+        except socket.error:
+            time.sleep(0.2)
+    raise RuntimeError("controller did not start")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--doors', type=int, default=2)
+    parser.add_argument('--rtt', type=float, default=0.05, help='round trip time of the slow link, in seconds')
+    parser.add_argument('--bandwidth', type=float, default=1000, help='speed of the slow link, in kbit/s')
+    parser.add_argument('--port', type=int, default=18081, help='web port of the controller')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='garage-pageload-')
+    config_file = os.path.join(workdir, 'config.json')
+    with open(config_file, 'w') as f:
+        json.dump(controller_config(args, workdir), f)
+    code = "import sys, controller; controller.Controller(controller.load_config(sys.argv[1])).run()"
+    process = subprocess.Popen([sys.executable, '-c', code, config_file], cwd=ROOT)
+    try:
+        wait_for_server(args.port)
+        browser = Browser(args.port)
+        results = {'cold': load(browser, args, 'cold')}
+        results['warm'] = load(browser, args, 'warm')
+        results['revalidate'] = load(browser, args, 'revalidate')
+        results['cold_uncompressed'] = load(Browser(args.port, compression=False), args, 'cold')
+    finally:
+        process.terminate()
+        process.wait()
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+if __name__ == '__main__':
+    main()
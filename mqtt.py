@@ -0,0 +1,286 @@
+"""
+A small MQTT 3.1.1 client that runs on the Twisted reactor, used by the
+controller's MQTT integration. It covers what that needs and no more:
+publishing at QoS 0 and 1 (optionally retained), subscribing, a last will,
+keep-alive pings, and reconnecting with backoff.
+
+While the broker can't be reached, publishes are kept in memory: only the
+latest message for each retained topic (an older state is of no use once a
+newer one exists) and up to buffer_size other messages. They are sent as
+soon as the connection is back, as are QoS 1 messages the broker never
+acknowledged.
+
+The packet helpers at the top are also used by extra/mqttcheck.py's broker
+stand-in.
+"""
+
+import collections
+import struct
+import syslog
+import time
+
+from twisted.internet import task
+from twisted.internet.protocol import Protocol, ReconnectingClientFactory
+
+CONNECT = 1
+CONNACK = 2
+PUBLISH = 3
+PUBACK = 4
+SUBSCRIBE = 8
+SUBACK = 9
+PINGREQ = 12
+PINGRESP = 13
+DISCONNECT = 14
+
+CONNACK_ERRORS = {1: 'unacceptable protocol version', 2: 'client id rejected', 3: 'server unavailable',
+                  4: 'bad user name or password', 5: 'not authorized'}
+
+def utf8(value):
+    if not isinstance(value, bytes):
+        return value.encode('utf-8')
+    return value
+
+def encode_string(value):
+    value = utf8(value)
+    return struct.pack('!H', len(value)) + value
+
+def decode_string(data, offset=0):
+    """Returns the string at offset and the offset just past it."""
+    length, = struct.unpack('!H', data[offset:offset + 2])
+    end = offset + 2 + length
+    return data[offset + 2:end], end
+
+def packet(kind, flags, body=b''):
+    length = len(body)
+    header = b''
+    while True:
+        byte = length % 128
+        length //= 128
+        header += struct.pack('!B', byte | (0x80 if length else 0))
+        if not length:
+            break
+    return struct.pack('!B', kind << 4 | flags) + header + body
+
+def read_packets(data):
+    """
+    Splits received bytes into complete packets. Returns a list of
+    (kind, flags, body) and whatever is left over for the next call.
+    """
+    packets = []
+    while len(data) >= 2:
+        length = 0
+        multiplier = 1
+        pos = 1
+        while True:
+            if pos >= len(data):
+                return packets, data
+            byte, = struct.unpack('!B', data[pos:pos + 1])
+            length += (byte & 0x7f) * multiplier
+            multiplier *= 128
+            pos += 1
+            if not byte & 0x80:
+                break
+            if pos > 4:
+                raise ValueError("malformed remaining length")
+        if len(data) < pos + length:
+            break
+        first, = struct.unpack('!B', data[0:1])
+        packets.append((first >> 4, first & 0x0f, data[pos:pos + length]))
+        data = data[pos + length:]
+    return packets, data
+
+def publish_packet(topic, payload, qos=0, retain=False, packet_id=None, dup=False):
+    body = encode_string(topic)
+    if qos:
+        body += struct.pack('!H', packet_id)
+    flags = (0x08 if dup else 0) | qos << 1 | (0x01 if retain else 0)
+    return packet(PUBLISH, flags, body + utf8(payload))
+
+def parse_publish(flags, body):
+    """Returns (topic, payload, qos, retain, packet_id) from a PUBLISH body."""
+    qos = (flags >> 1) & 0x03
+    topic, pos = decode_string(body)
+    packet_id = None
+    if qos:
+        packet_id, = struct.unpack('!H', body[pos:pos + 2])
+        pos += 2
+    return topic, body[pos:], qos, bool(flags & 0x01), packet_id
+
+def topic_matches(topic_filter, topic):
+    """Whether topic matches a subscription filter, with + and # wildcards."""
+    filter_parts = topic_filter.split('/')
+    topic_parts = topic.split('/')
+    for n, part in enumerate(filter_parts):
+        if part == '#':
+            return True
+        if n >= len(topic_parts) or (part != '+' and part != topic_parts[n]):
+            return False
+    return len(filter_parts) == len(topic_parts)
+
+class MQTTProtocol(Protocol):
+    """One connection to the broker; see MQTTClientFactory."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.buffer = b''
+        self.session = False
+        self.inflight = collections.OrderedDict()
+        self.next_id = 0
+        self.last_heard = time.time()
+        self.pinger = task.LoopingCall(self.keep_alive)
+
+    def connectionMade(self):
+        factory = self.factory
+        flags = 0x02  # clean session
+        payload = encode_string(factory.client_id)
+        if factory.will is not None:
+            topic, message, retain = factory.will
+            flags |= 0x04 | (0x20 if retain else 0)
+            payload += encode_string(topic) + encode_string(message)
+        if factory.username is not None:
+            flags |= 0x80
+            payload += encode_string(factory.username)
+            if factory.password is not None:
+                flags |= 0x40
+                payload += encode_string(factory.password)
+        body = encode_string('MQTT') + struct.pack('!BBH', 4, flags, factory.keepalive)
+        self.transport.write(packet(CONNECT, 0, body + payload))
+        self.last_heard = time.time()
+        self.pinger.start(factory.keepalive / 2.0, now=False)
+
+    def keep_alive(self):
+        if time.time() - self.last_heard > self.factory.keepalive * 1.5:
+            syslog.syslog("MQTT broker stopped answering; reconnecting")
+            self.transport.abortConnection()
+            return
+        self.transport.write(packet(PINGREQ, 0))
+
+    def dataReceived(self, data):
+        self.last_heard = time.time()
+        try:
+            packets, self.buffer = read_packets(self.buffer + data)
+        except ValueError:
+            self.transport.abortConnection()
+            return
+        for kind, flags, body in packets:
+            self.packet_received(kind, flags, body)
+
+    def packet_received(self, kind, flags, body):
+        if kind == CONNACK:
+            code, = struct.unpack('!B', body[1:2])
+            if code != 0:
+                syslog.syslog("MQTT broker refused the connection: %s" % CONNACK_ERRORS.get(code, code))
+                self.transport.loseConnection()
+                return
+            self.session = True
+            self.factory.session_started(self)
+        elif kind == PUBLISH:
+            topic, payload, qos, retain, packet_id = parse_publish(flags, body)
+            if qos:
+                self.transport.write(packet(PUBACK, 0, struct.pack('!H', packet_id)))
+            self.factory.message_received(topic.decode('utf-8'), payload)
+        elif kind == PUBACK:
+            packet_id, = struct.unpack('!H', body[:2])
+            self.inflight.pop(packet_id, None)
+
+    def new_id(self):
+        self.next_id = self.next_id % 65535 + 1
+        return self.next_id
+
+    def publish(self, topic, payload, retain=False, qos=0):
+        packet_id = None
+        if qos:
+            packet_id = self.new_id()
+            self.inflight[packet_id] = (topic, payload, retain, qos)
+        self.transport.write(publish_packet(topic, payload, qos, retain, packet_id))
+
+    def subscribe(self, topic_filters):
+        body = struct.pack('!H', self.new_id())
+        for topic_filter in topic_filters:
+            body += encode_string(topic_filter) + struct.pack('!B', 1)
+        self.transport.write(packet(SUBSCRIBE, 0x02, body))
+
+    def disconnect(self):
+        self.transport.write(packet(DISCONNECT, 0))
+        self.transport.loseConnection()
+
+    def connectionLost(self, reason):
+        if self.pinger.running:
+            self.pinger.stop()
+        self.factory.session_ended(self, list(self.inflight.values()))
+
+class MQTTClientFactory(ReconnectingClientFactory):
+    """
+    Keeps a connection to one broker. Connect it with reactor.connectTCP;
+    publish() and subscribe() can be used whether or not it is connected.
+    on_connect, if set, is called each time a session starts, before the
+    offline buffer is sent.
+    """
+    maxDelay = 60
+
+    def __init__(self, client_id, keepalive=60, username=None, password=None, will=None, buffer_size=100):
+        self.client_id = client_id
+        self.keepalive = keepalive
+        self.username = username
+        self.password = password
+        self.will = will
+        self.connection = None
+        self.subscriptions = collections.OrderedDict()
+        self.retained = collections.OrderedDict()
+        self.queue = collections.deque(maxlen=buffer_size)
+        self.on_connect = None
+
+    def buildProtocol(self, addr):
+        return MQTTProtocol(self)
+
+    def session_started(self, protocol):
+        self.resetDelay()
+        self.connection = protocol
+        syslog.syslog("Connected to the MQTT broker")
+        if self.subscriptions:
+            protocol.subscribe(list(self.subscriptions))
+        if self.on_connect is not None:
+            self.on_connect()
+        retained, self.retained = self.retained, collections.OrderedDict()
+        for topic, (payload, qos) in retained.items():
+            protocol.publish(topic, payload, True, qos)
+        while self.queue and self.connection is protocol:
+            topic, payload, qos = self.queue.popleft()
+            protocol.publish(topic, payload, False, qos)
+
+    def session_ended(self, protocol, unacknowledged):
+        if self.connection is protocol:
+            self.connection = None
+            syslog.syslog("Lost the connection to the MQTT broker")
+        for topic, payload, retain, qos in unacknowledged:
+            if retain:
+                # in the order they were sent, so the newest for each topic wins
+                self.retained.pop(topic, None)
+                self.retained[topic] = (payload, qos)
+            else:
+                self.queue.append((topic, payload, qos))
+
+    def publish(self, topic, payload, retain=False, qos=0):
+        if self.connection is not None:
+            self.connection.publish(topic, payload, retain, qos)
+        elif retain:
+            self.retained.pop(topic, None)
+            self.retained[topic] = (payload, qos)
+        else:
+            self.queue.append((topic, payload, qos))
+
+    def subscribe(self, topic_filter, callback):
+        """Calls callback(topic, payload) for every message matching topic_filter."""
+        self.subscriptions[topic_filter] = callback
+        if self.connection is not None:
+            self.connection.subscribe([topic_filter])
+
+    def message_received(self, topic, payload):
+        for topic_filter, callback in self.subscriptions.items():
+            if topic_matches(topic_filter, topic):
+                callback(topic, payload)
+
+    def stop(self):
+        self.stopTrying()
+        if self.connection is not None:
+            self.connection.disconnect()
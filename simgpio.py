@@ -0,0 +1,210 @@
+"""
+Simulated stand-in for RPi.GPIO, used when config.json sets
+"gpio_backend":"sim". It lets the controller run (and be profiled) on any
+machine.
+
+Doors are registered with add_door() and behave like the real thing:
+pulsing a door's relay pin starts, stops or reverses its motion, the door
+takes time_to_open/time_to_close seconds to travel, and its state pin
+reads closed only while the door is fully closed. An open_state_pin, if
+configured, reads open only while the door is fully open. Each door can
+also be given a "simulation" section in config.json:
+- bounce_time: seconds the contact switch chatters after changing.
+- stuck_sensor: 0 or 1 to make the state pin always read that value.
+- jammed: true if the door never moves when its relay is pulsed.
+- position: where the door starts, "closed" (the default) or "open".
+
+Edge detection callbacks are run from timer threads, as RPi.GPIO runs them
+from its own thread.
+"""
+
+import random
+import threading
+import time
+
+BCM = 11
+BOARD = 10
+OUT = 0
+IN = 1
+LOW = 0
+HIGH = 1
+PUD_OFF = 20
+PUD_DOWN = 21
+PUD_UP = 22
+RISING = 31
+FALLING = 32
+BOTH = 33
+
+lock = threading.RLock()
+outputs = {}
+callbacks = {}
+doors_by_relay = {}
+doors_by_state = {}
+doors_by_open_state = {}
+
+class SimulatedDoor(object):
+    def __init__(self, relay_pin, state_pin, closed_value=0, time_to_open=10, time_to_close=10,
+                 bounce_time=0, stuck_sensor=None, jammed=False, position='closed',
+                 open_state_pin=None, open_value=0):
+        self.relay_pin = relay_pin
+        self.state_pin = state_pin
+        self.closed_value = closed_value
+        self.open_state_pin = open_state_pin
+        self.open_value = open_value
+        self.time_to_open = time_to_open
+        self.time_to_close = time_to_close
+        self.bounce_time = bounce_time
+        self.stuck_sensor = stuck_sensor
+        self.jammed = jammed
+        self.position = position
+        self.last_direction = 'close' if position == 'closed' else 'open'
+        self.moved_at = 0
+        self.sensor_changed_at = 0
+        self.open_sensor_changed_at = 0
+
+    def update(self, now):
+        if self.position == 'opening' and now - self.moved_at >= self.time_to_open:
+            self.position = 'open'
+            self.open_sensor_changed_at = self.moved_at + self.time_to_open
+        elif self.position == 'closing' and now - self.moved_at >= self.time_to_close:
+            self.position = 'closed'
+            self.sensor_changed_at = self.moved_at + self.time_to_close
+
+    def press(self, now):
+        """The relay was pulsed: behave like a garage door opener's button."""
+        self.update(now)
+        if self.jammed:
+            return
+        if self.position in ('opening', 'closing'):
+            # Most openers stop when the button is pressed mid-travel
+            self.position = 'stopped'
+            return
+        if self.position == 'closed' or (self.position == 'stopped' and self.last_direction == 'close'):
+            if self.position == 'closed':
+                self.sensor_changed_at = now
+                fire_edge(self.state_pin, 0, self.bounce_time)
+            self.position = 'opening'
+            self.last_direction = 'open'
+            fire_edge(self.open_state_pin, self.time_to_open, self.bounce_time)
+        else:
+            if self.position == 'open':
+                self.open_sensor_changed_at = now
+                fire_edge(self.open_state_pin, 0, self.bounce_time)
+            self.position = 'closing'
+            self.last_direction = 'close'
+            fire_edge(self.state_pin, self.time_to_close, self.bounce_time)
+        self.moved_at = now
+
+    def sensor(self, now):
+        if self.stuck_sensor is not None:
+            return self.stuck_sensor
+        self.update(now)
+        if self.bounce_time and now - self.sensor_changed_at < self.bounce_time:
+            return random.choice((0, 1))
+        if self.position == 'closed':
+            return self.closed_value
+        return 1 - self.closed_value
+
+    def open_sensor(self, now):
+        self.update(now)
+        if self.bounce_time and now - self.open_sensor_changed_at < self.bounce_time:
+            return random.choice((0, 1))
+        if self.position == 'open':
+            return self.open_value
+        return 1 - self.open_value
+
+def add_door(config):
+    """Simulates the door described by a compiled door config (see controller.DoorConfig)."""
+    simulation = config.simulation
+    time_to_open = config.time_to_open if config.time_to_open is not None else config.approx_time_to_open
+    time_to_close = config.time_to_close if config.time_to_close is not None else config.approx_time_to_close
+    with lock:
+        door = SimulatedDoor(config.relay_pin, config.state_pin,
+                             closed_value=config.state_pin_closed_value,
+                             time_to_open=time_to_open,
+                             time_to_close=time_to_close,
+                             bounce_time=simulation.bounce_time,
+                             stuck_sensor=simulation.stuck_sensor,
+                             jammed=simulation.jammed,
+                             position=simulation.position,
+                             open_state_pin=config.open_state_pin,
+                             open_value=config.open_state_pin_open_value)
+        doors_by_relay[door.relay_pin] = door
+        doors_by_state[door.state_pin] = door
+        if door.open_state_pin is not None:
+            doors_by_open_state[door.open_state_pin] = door
+
+def remove_door(config):
+    with lock:
+        doors_by_relay.pop(config.relay_pin, None)
+        doors_by_state.pop(config.state_pin, None)
+        doors_by_open_state.pop(config.open_state_pin, None)
+
+def fire_edge(pin, delay, bounce_time):
+    if pin not in callbacks:
+        return
+    timer = threading.Timer(delay, run_callbacks, (pin,))
+    timer.daemon = True
+    timer.start()
+    if bounce_time:
+        # and again once the switch has settled
+        timer = threading.Timer(delay + bounce_time, run_callbacks, (pin,))
+        timer.daemon = True
+        timer.start()
+
+def run_callbacks(pin):
+    with lock:
+        pin_callbacks = list(callbacks.get(pin, ()))
+    for callback in pin_callbacks:
+        callback(pin)
+
+def setwarnings(flag):
+    pass
+
+def setmode(mode):
+    pass
+
+def cleanup(channel=None):
+    with lock:
+        if channel is None:
+            outputs.clear()
+            callbacks.clear()
+        else:
+            outputs.pop(channel, None)
+            callbacks.pop(channel, None)
+
+def setup(channel, direction, pull_up_down=PUD_OFF, initial=None):
+    with lock:
+        if direction == OUT:
+            outputs[channel] = HIGH if initial is None else initial
+
+def output(channel, value):
+    with lock:
+        previous = outputs.get(channel, HIGH)
+        outputs[channel] = value
+        door = doors_by_relay.get(channel)
+        # The relay board is active low
+        if door is not None and previous and not value:
+            door.press(time.time())
+
+def input(channel):
+    with lock:
+        door = doors_by_state.get(channel)
+        if door is not None:
+            return door.sensor(time.time())
+        door = doors_by_open_state.get(channel)
+        if door is not None:
+            return door.open_sensor(time.time())
+        return outputs.get(channel, HIGH)
+
+def add_event_detect(channel, edge, callback=None, bouncetime=None):
+    with lock:
+        callbacks[channel] = [callback] if callback is not None else []
+
+def add_event_callback(channel, callback):
+    with lock:
+        callbacks.setdefault(channel, []).append(callback)
+
+def remove_event_detect(channel):
+    with lock:
+        callbacks.pop(channel, None)
@@ -1,93 +1,227 @@
-var lastupdate = 0;
+// Garage controller web client. The first page is drawn from one request
+// (evt?full=1, or upd?full=1 without EventSource) and after that only the
+// rows of doors that changed are touched. When the controller wants a login,
+// the login form is shown and everything starts over once it succeeds.
+
+var lastseq = 0;
+var doors = {};
+
+var MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+
+function ordinal(n)
+{
+    if (n % 100 >= 11 && n % 100 <= 13)
+        return 'th';
+    return ['th', 'st', 'nd', 'rd'][n % 10] || 'th';
+}
+
+// e.g. "Jan 5th, 2024, 7:05 PM"
+function formatDate(date)
+{
+    var hours = date.getHours() % 12 || 12;
+    var minutes = date.getMinutes();
+    return MONTHS[date.getMonth()] + ' ' + date.getDate() + ordinal(date.getDate()) +
+        ', ' + date.getFullYear() + ', ' + hours + ':' + (minutes < 10 ? '0' : '') +
+        minutes + ' ' + (date.getHours() < 12 ? 'AM' : 'PM');
+}
 
 function formatState(state, time)
 {
-    dateStr = dateFormat(new Date(parseInt(time)*1000), "mmm dS, yyyy, h:MM TT");
-    return state.charAt(0).toUpperCase() + state.slice(1) + " as of " + dateStr;
-};
-
-function click(name)
-{
-    $.ajax({
-	url:"clk",
-	data:{'id':name}
-    })
-};
-
-function closeall(name)
-{
-    $.ajax({
-	url:"cla",
-  data:{'all':'doors'}
-    })
-};
-
-$.ajax({
-    url:"cfg",
-    success: function(data) {
-	for (var i = 0; i < data.length; i++) {
-	    var id = data[i][0];
-	    var name = data[i][1];
-	    var state = data[i][2];
-	    var time = data[i][3];
-	    var li = '<li id="' + id + '" data-icon="false">';
-	    li = li + '<a href="javascript:click(\'' + id + '\');">';
-	    li = li + '<img src="img/'+state + '.png" />';
-	    li = li + '<h3>' + name + '</h3>';
-	    li = li + '<p>' + formatState(state, time) + '</p>';
-	    li = li + '</a></li>';
-	    $("#doorlist").append(li);
-	    $("#doorlist").listview('refresh');
-	}
+    return state.charAt(0).toUpperCase() + state.slice(1) + " as of " +
+        formatDate(new Date(parseInt(time) * 1000));
+}
+
+function stateImage(state)
+{
+    // there is no picture for a stuck door or one we know nothing about
+    if (state == "stuck" || state == "unknown")
+        state = "open";
+    return "img/" + state + ".png";
+}
+
+function request(url, success, error, timeout, body)
+{
+    var xhr = new XMLHttpRequest();
+    xhr.open(body === undefined ? "GET" : "POST", url, true);
+    xhr.timeout = timeout || 30000;
+    xhr.onload = function() {
+        if (xhr.status == 200) {
+            if (success)
+                success(JSON.parse(xhr.responseText));
+        } else if (xhr.status == 401 && url != "login") {
+            // whatever was running stops until the login succeeds
+            showLogin();
+        } else if (error) {
+            error();
+        }
+    };
+    if (error)
+        xhr.onerror = xhr.ontimeout = error;
+    if (body !== undefined)
+        xhr.setRequestHeader("Content-Type", "application/x-www-form-urlencoded");
+    xhr.send(body);
+}
+
+function showLogin()
+{
+    document.getElementById("login").hidden = false;
+}
+
+function login(event)
+{
+    event.preventDefault();
+    var form = document.getElementById("login");
+    var body = "username=" + encodeURIComponent(form.username.value) +
+        "&password=" + encodeURIComponent(form.password.value);
+    request("login",
+            function() {
+                form.hidden = true;
+                form.password.value = "";
+                document.getElementById("loginerror").textContent = "";
+                connect();
+            },
+            function() {
+                document.getElementById("loginerror").textContent = "Wrong user name or password";
+            }, 30000, body);
+}
+
+function click(id)
+{
+    request("clk?id=" + encodeURIComponent(id));
+}
+
+function closeall()
+{
+    request("cla?all=doors");
+}
+
+function setUptime(text)
+{
+    document.getElementById("uptime").textContent = text;
+}
+
+function uptime()
+{
+    request("upt", setUptime, null, 60000);
+}
+
+function addDoor(list, id, name)
+{
+    var li = document.createElement("li");
+    var img = document.createElement("img");
+    var h3 = document.createElement("h3");
+    var p = document.createElement("p");
+    h3.textContent = name;
+    li.appendChild(img);
+    li.appendChild(h3);
+    li.appendChild(p);
+    li.onclick = function() { click(id); };
+    list.appendChild(li);
+    doors[id] = {img: img, text: p, state: null};
+}
+
+// Draws the whole list from a full reply; only needed on the first load
+// or when the set of doors has changed.
+function render(response)
+{
+    var list = document.getElementById("doorlist");
+    var fresh = document.createElement("ul");
+    fresh.id = "doorlist";
+    doors = {};
+    for (var i = 0; i < response.doors.length; i++)
+        addDoor(fresh, response.doors[i][0], response.doors[i][1]);
+    list.parentNode.replaceChild(fresh, list);
+    var updates = [];
+    for (var i = 0; i < response.doors.length; i++) {
+        var door = response.doors[i];
+        updates.push([door[0], door[2], door[3]]);
+    }
+    applyUpdates({seq: response.seq, update: updates});
+    setUptime(response.uptime);
+}
+
+function applyUpdates(response)
+{
+    lastseq = response.seq;
+    for (var i = 0; i < response.update.length; i++) {
+        var id = response.update[i][0];
+        var state = response.update[i][1];
+        var door = doors[id];
+        if (door === undefined) {
+            // a door we have not drawn yet, e.g. a node that just joined
+            fetchFull();
+            return;
+        }
+        if (door.state != state) {
+            door.img.src = stateImage(state);
+            door.state = state;
+        }
+        door.text.textContent = formatState(state, response.update[i][2]);
+    }
+}
+
+function fetchFull()
+{
+    request("upd?full=1", render);
+}
+
+function listen()
+{
+    var opened = false;
+    var source = new EventSource("evt?full=1");
+    source.onopen = function() {
+        opened = true;
+    };
+    source.addEventListener('state', function(event) {
+        render(JSON.parse(event.data));
+    }, false);
+    source.addEventListener('update', function(event) {
+        applyUpdates(JSON.parse(event.data));
+    }, false);
+    source.onerror = function() {
+        // The browser reconnects by itself once a stream has worked,
+        // resuming from the last event id, unless it was refused (e.g. the
+        // login expired); otherwise the server or a proxy does not support it
+        if (!opened || source.readyState == 2) {
+            source.close();
+            request("upd?full=1", function(response) { render(response); poll(); },
+                    function() { setTimeout(listen, 10000); });
+        }
+    };
+}
+
+function poll()
+{
+    request("upd?since=" + lastseq,
+            function(response) {
+                applyUpdates(response);
+                // the server holds the request until something changes
+                setTimeout(poll, 0);
+            },
+            function() {
+                // try again in 10 seconds if there was a request error
+                setTimeout(poll, 10000);
+            });
+}
+
+function connect()
+{
+    if (window.EventSource) {
+        listen();
+    } else {
+        request("upd?full=1", function(response) { render(response); poll(); });
     }
-});
-
-function uptime() {
-     $.ajax({
- 	url:"upt",
- 	success: function(data) {
- 	    $("#uptime").html(data)
- 	    setTimeout('uptime()', 60000)
- 	},
- 	error: function(XMLHttpRequest, textStatus, errorThrown) {
- 	    setTimeout('uptime()', 60000)
- 	},
- 	dataType: "json",
- 	timeout: 60000
-     });
-}
-
-
-function poll(){
-    $.ajax({
-    	url: "upd",
-    	data: {'lastupdate': lastupdate },
-    	success: function(response, status) {
-    	    lastupdate = response.timestamp;
-    	    for (var i = 0; i < response.update.length; i++) {
-    		var id = response.update[i][0];
-    		var state = response.update[i][1];
-    		var time = response.update[i][2];
-    		$("#" + id + " p").html(formatState(state, time));
-    		$("#" + id  + " img").attr("src", "img/" + state + ".png")
-    		$("#doorlist").listview('refresh');
-    	    }
-    	    setTimeout('poll()', 1000);
-        },
-        // handle error
-        error: function(XMLHttpRequest, textStatus, errorThrown){
-            // try again in 10 seconds if there was a request error
-            setTimeout('poll();', 10000);
-        },
-    	//complete: poll,
-    	dataType: "json",
-    	timeout: 30000
-    });
-};
-
-function init() {
-    uptime()
-    poll()
-}
-
-$(document).live('pageinit', init);
+}
+
+function init()
+{
+    document.getElementById("closeall").onclick = closeall;
+    document.getElementById("login").onsubmit = login;
+    connect();
+    setInterval(uptime, 60000);
+    if ('serviceWorker' in navigator)
+        navigator.serviceWorker.register('sw.js');
+}
+
+init();
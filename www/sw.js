@@ -0,0 +1,44 @@
+// Keeps a copy of the app shell so the page still opens when the controller
+// is briefly unreachable. Pages and assets are always fetched from the
+// network first (they are small and the server answers with ETags), and the
+// cache is only used when that fails. Door state and commands are never
+// cached.
+
+var CACHE = 'garage-shell-1';
+var SHELL = ['./', 'js/client.js', 'css/client.css', 'manifest.webmanifest',
+             'img/closed.png', 'img/closing.png', 'img/open.png', 'img/opening.png'];
+var API = /\/(upd|evt|cfg|upt|st|clk|cla|api|bat|health|metrics|history)(\?|$)/;
+
+self.addEventListener('install', function(event) {
+    event.waitUntil(caches.open(CACHE).then(function(cache) {
+        return cache.addAll(SHELL);
+    }));
+});
+
+self.addEventListener('activate', function(event) {
+    event.waitUntil(caches.keys().then(function(keys) {
+        return Promise.all(keys.filter(function(key) {
+            return key != CACHE;
+        }).map(function(key) {
+            return caches.delete(key);
+        }));
+    }));
+});
+
+self.addEventListener('fetch', function(event) {
+    var request = event.request;
+    if (request.method != 'GET' || API.test(new URL(request.url).pathname))
+        return;
+    event.respondWith(fetch(request).then(function(response) {
+        if (response.ok) {
+            var copy = response.clone();
+            // one entry per file, whatever its ?v= fingerprint
+            caches.open(CACHE).then(function(cache) {
+                cache.put(request.url.split('?')[0], copy);
+            });
+        }
+        return response;
+    }).catch(function() {
+        return caches.match(request, {ignoreSearch: true});
+    }));
+});